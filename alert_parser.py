@@ -0,0 +1,269 @@
+"""Parses Telegram call alerts such as
+
+    🔔 CoinA COA | Marketcap: $1.2M | Age: 2 hours
+
+into coin, symbol, market cap and age. Channels that post in another format get their
+own AlertParser in PARSERS, chosen by channel name through CHANNEL_PARSERS; every other
+channel gets the bell format above. No Qt here, so the dashboard, jsonchange.py and the
+scraper scripts all share it.
+"""
+import re
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+NOT_AVAILABLE = "N/A"
+SCRAPER_DATE_LENGTH = len("2025-05-07 19:09:16")  # telegram-scraper's naive UTC dates
+EPOCH = datetime(1970, 1, 1)
+EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MILLISECOND = timedelta(milliseconds=1)
+
+# One pass over the whole message for the bell that starts a "<coin> ... <symbol> |" head
+# and for the "Marketcap:" and "Age:" fields, each ending at the next "|" or line break.
+# Every branch starts with a literal, which lets the regex engine skip ahead quickly.
+ALERT_RE = re.compile(r"🔔|Marketcap:[ \t]*(?P<cap>[^|\n]*)|Age:[ \t]*(?P<age>[^|\n]*)")
+ALERT_MARKERS = ("🔔", "Marketcap:", "Age:")
+
+CAP_SUFFIXES = {"K": 1e3, "M": 1e6, "B": 1e9, "T": 1e12}
+CAP_RE = re.compile(r"([\d.,]+)\s*([KMBT]?)", re.IGNORECASE)
+AGE_RE = re.compile(r"(\d+(?:\.\d+)?)\s*([a-z]+)", re.IGNORECASE)
+AGE_UNITS = (("mo", 30 * 86400), ("s", 1), ("m", 60), ("h", 3600), ("d", 86400), ("w", 7 * 86400),
+             ("y", 365 * 86400))
+
+
+def cap_value(cap):
+    """"$1.2M" -> 1200000.0; None for "N/A" or anything else without a number."""
+    match = CAP_RE.search(cap or "")
+    if match is None:
+        return None
+    try:
+        value = float(match.group(1).replace(",", ""))
+    except ValueError:
+        return None
+    return value * CAP_SUFFIXES.get(match.group(2).upper(), 1)
+
+
+def age_seconds(age):
+    """"2 hours" -> 7200, "1h 20m" -> 4800; None if no unit is recognised."""
+    total = None
+    for number, unit in AGE_RE.findall(age or ""):
+        unit = unit.lower()
+        for prefix, seconds in AGE_UNITS:
+            if unit.startswith(prefix):
+                total = (total or 0) + float(number) * seconds
+                break
+    return total
+
+
+class AlertParser:
+    """One message format: literal markers to pre-filter on and a function that parses.
+
+    parse_text(text) returns (coin, symbol, cap, market_cap, age), or None when the
+    text is not an alert. It only runs on texts holding one of the markers, so a
+    message in another format costs a few substring searches and no regex. Parsers
+    hold no state, so the loader threads can share them.
+    """
+    __slots__ = ('name', 'markers', 'parse_text')
+
+    def __init__(self, name, markers, parse_text):
+        self.name = name
+        self.markers = tuple(markers)
+        self.parse_text = parse_text
+
+    def accepts(self, text):
+        """Whether text holds one of the markers, i.e. parse_text would run on it."""
+        return bool(text) and any(marker in text for marker in self.markers)
+
+    def parse(self, text):
+        if not self.accepts(text):
+            return None
+        return self.parse_text(text)
+
+
+PARSERS = {}  # name -> AlertParser
+CHANNEL_PARSERS = {}  # telegram-scraper channel folder -> parser name
+DEFAULT_PARSER = "bell"
+
+
+def register_parser(name, markers, parse_text, channels=()):
+    """Adds (or replaces) a parser and routes the given channels to it."""
+    parser = PARSERS[name] = AlertParser(name, markers, parse_text)
+    for channel in channels:
+        CHANNEL_PARSERS[channel] = name
+    return parser
+
+
+def parser_for(channel):
+    return PARSERS[CHANNEL_PARSERS.get(channel, DEFAULT_PARSER)]
+
+
+def _alert(coin, symbol, cap=NOT_AVAILABLE, age=NOT_AVAILABLE):
+    return coin, symbol, cap, cap_value(cap), age
+
+
+def parse_bell(text):
+    coin = symbol = cap = age = NOT_AVAILABLE
+    for match in ALERT_RE.finditer(text):
+        if match.group("cap") is not None:
+            cap = match.group("cap").strip()
+        elif match.group("age") is not None:
+            age = match.group("age").strip()
+        else:
+            # The head runs from the start of the bell's line to the line's first "|"
+            start = text.rfind("\n", 0, match.start()) + 1
+            end = text.find("\n", start)
+            bar = text.find("|", start, len(text) if end < 0 else end)
+            if bar < 0:
+                continue
+            words = text[start:bar].replace("🔔", "").split()
+            if words:
+                coin = words[0]
+                symbol = words[-1]
+    if coin == symbol == cap == age == NOT_AVAILABLE:
+        return None
+    return _alert(coin, symbol, cap, age)
+
+
+# DEXTNewPairsBot: "New pair at Uniswap V2 v2 \n\nMOO POO (MOOPOO/WETH)\n\nInitial Liquidity: ..."
+DEXT_PAIR_RE = re.compile(r"New pair at [^\n]*\n+[ \t]*(?P<coin>[^\n(]*?)\s*\((?P<symbol>[^/\n)]+)/")
+
+
+def parse_dext_pair(text):
+    match = DEXT_PAIR_RE.search(text)
+    if match is None:
+        return None
+    return _alert(match.group("coin") or match.group("symbol"), match.group("symbol"))
+
+
+# binance_futures_5m_pump: "#DEGENUSDT price UP on 2.7% \nVolume up on 3323.8%..."
+FUTURES_MOVE_RE = re.compile(r"#(?P<symbol>[A-Z0-9]+?)(?:USDT|BUSD|USDC)?\s+price (?:UP|DOWN)")
+
+
+def parse_futures_move(text):
+    match = FUTURES_MOVE_RE.search(text)
+    if match is None:
+        return None
+    return _alert(match.group("symbol"), match.group("symbol"))
+
+
+# cmcal_bot: "🆕 New Virtuals Protocol (VIRTUAL) event! ..."
+CALENDAR_EVENT_RE = re.compile(r"New\s+(?P<coin>[^\n(]+?)\s+\((?P<symbol>[^)\n]+)\)\s+event!")
+
+
+def parse_calendar_event(text):
+    match = CALENDAR_EVENT_RE.search(text)
+    if match is None:
+        return None
+    return _alert(match.group("coin"), match.group("symbol"))
+
+
+# coindar: "🗓 Axie Infinity #AXS\n\nClassic Competitive 9..."
+COINDAR_RE = re.compile(r"🗓\s*(?P<coin>[^#\n]+?)\s*#(?P<symbol>\w+)")
+
+
+def parse_coindar(text):
+    match = COINDAR_RE.search(text)
+    if match is None:
+        return None
+    return _alert(match.group("coin"), match.group("symbol"))
+
+
+# Call channels: "🪙 $pitcoin ... 💰Mcap: 35K" or "🪙$BBW ... Dyor/NFA 70K MCAP"
+CASHTAG_CALL_RE = re.compile(
+    r"🪙\s*\$(?P<symbol>\w+)"
+    r"|Mcap:\s*(?P<cap>\$?[\d.,]+\s*[KMB]?)"
+    r"|(?P<cap_before>\$?[\d.,]+\s*[KMB]?)\s*MCAP",
+    re.IGNORECASE,
+)
+
+
+def parse_cashtag_call(text):
+    symbol = cap = None
+    for match in CASHTAG_CALL_RE.finditer(text):
+        if match.group("symbol") is not None:
+            symbol = symbol or match.group("symbol")
+        else:
+            cap = cap or (match.group("cap") or match.group("cap_before")).strip()
+    if symbol is None:
+        return None
+    return _alert(symbol, symbol, cap or NOT_AVAILABLE)
+
+
+# Buy bots: "SATO Buy!\n...\n🔼 Market Cap $7,082,075"
+BUY_BOT_RE = re.compile(r"^(?P<symbol>\S+) Buy!(?:.*?Market Cap (?P<cap>\$[\d,.]+))?", re.DOTALL)
+
+
+def parse_buy_bot(text):
+    match = BUY_BOT_RE.match(text)
+    if match is None:
+        return None
+    return _alert(match.group("symbol"), match.group("symbol"), match.group("cap") or NOT_AVAILABLE)
+
+
+register_parser(DEFAULT_PARSER, ALERT_MARKERS, parse_bell)
+register_parser("dext_pair", ("New pair at",), parse_dext_pair, channels=("DEXTNewPairsBot",))
+register_parser("futures_move", (" price UP", " price DOWN"), parse_futures_move,
+                channels=("binance_futures_5m_pump",))
+register_parser("calendar_event", (" event!",), parse_calendar_event, channels=("cmcal_bot",))
+register_parser("coindar", ("🗓",), parse_coindar, channels=("coindar",))
+register_parser("cashtag_call", ("🪙",), parse_cashtag_call, channels=("Insider_ECA", "POSEIDON_DEGEN_CALLS"))
+register_parser("buy_bot", (" Buy!",), parse_buy_bot, channels=("Maestrosdegen", "PEYOSDEGENHUB"))
+
+NO_ALERT = (NOT_AVAILABLE, NOT_AVAILABLE, NOT_AVAILABLE, None, NOT_AVAILABLE)
+
+
+def parse_alert(text, channel=None):
+    """Returns (coin, symbol, cap, market_cap, age) for a message text.
+
+    The channel picks the parser (the bell format by default). cap and age are the
+    text as written, "N/A" when missing; market_cap is cap as a number, or None. A text
+    that is not an alert gives all fields "N/A". In the bell format the last of a
+    repeated field wins, and a head with a single word is both coin and symbol.
+    """
+    return parser_for(channel).parse(text) or NO_ALERT
+
+
+def parse_date(value):
+    """"2025-05-07 19:09:16" or ISO 8601 -> naive datetime; None if it does not parse."""
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_dates(values):
+    """Parses many date strings into epoch milliseconds, -1 where a value does not parse.
+
+    Naive dates are taken as UTC. A batch made only of the scraper's own
+    "2025-05-07 19:09:16" form is converted by numpy in one call; anything else goes
+    through datetime.fromisoformat one value at a time.
+    """
+    if all(type(value) is str and len(value) == SCRAPER_DATE_LENGTH for value in values):
+        try:
+            return np.array(values, dtype="datetime64[ms]").astype(np.int64).tolist()
+        except ValueError:
+            pass  # some value is not a date; find which one by one
+    millis = []
+    for value in values:
+        date = parse_date(value)
+        if date is None:
+            millis.append(-1)
+        else:
+            millis.append((date - (EPOCH if date.tzinfo is None else EPOCH_UTC)) // MILLISECOND)
+    return millis
+
+
+def parse_messages(messages, channel=None):
+    """Parses a batch of telegram-scraper message dicts from one channel.
+
+    Returns a (date_ms, coin, symbol, cap, market_cap, age) tuple per message that has
+    both a date and a message field and whose date parses, in input order. date_ms is
+    epoch milliseconds, the date taken as UTC.
+    """
+    kept = [msg for msg in messages if "date" in msg and "message" in msg]
+    if not kept:
+        return []
+    dates = parse_dates([msg["date"] for msg in kept])
+    parse = parser_for(channel).parse
+    return [(date_ms,) + (parse(msg["message"]) or NO_ALERT)
+            for date_ms, msg in zip(dates, kept) if date_ms != -1]
@@ -0,0 +1,180 @@
+"""Micro-benchmark of the Telegram alert parser over the telegram-scraper archive.
+
+Times the line-splitting parser the Telegram panels used to carry (kept here as the
+baseline), alert_parser one message at a time, alert_parser.parse_messages on batches,
+and then every registered channel parser over the whole archive, which shows how much
+its marker pre-filter saves. Also (re)builds the regression corpus that
+test_alert_parser.py checks:
+
+    python bench_alert_parser.py
+    python bench_alert_parser.py --build-corpus
+"""
+import argparse
+import glob
+import json
+import os
+import time
+
+from alert_parser import CHANNEL_PARSERS, PARSERS, parse_alert, parse_date, parse_messages, parser_for
+from telegram_loader import iter_json_messages
+
+ARCHIVE_DIR = "telegram-scraper"
+CORPUS_PATH = "alert_parser_corpus.json"
+CORPUS_PER_CHANNEL = 3  # messages with a parser marker kept per channel, besides its first message
+BATCH_SIZE = 5000  # as TelegramLoadWorker sends them
+
+
+def legacy_parse_message_data(msg):
+    """The per-line parser that was copy-pasted in main.py and jsonchange.py."""
+    from PyQt5.QtCore import QDateTime, Qt
+
+    if "date" in msg and "message" in msg:
+        date_str = msg["date"]
+        message_text = msg["message"]
+        coin = "N/A"
+        symbol = "N/A"
+        cap = "N/A"
+        age = "N/A"
+
+        if message_text:
+            lines = message_text.split('\n')
+            for line in lines:
+                if "🔔" in line:
+                    parts = line.split("|")
+                    if len(parts) > 1:
+                        coin_symbol = parts[0].replace("🔔", "").strip()
+                        symbol_match = coin_symbol.split()
+                        if symbol_match:
+                            coin = symbol_match[0].strip()
+                            if len(symbol_match) > 1:
+                                symbol = symbol_match[-1].strip()
+                            else:
+                                symbol = coin
+                if "Marketcap:" in line:
+                    cap = line.split(":")[-1].strip()
+                if "Age:" in line:
+                    age = line.split(":")[-1].strip()
+
+        datetime_obj = QDateTime.fromString(date_str, Qt.ISODate)
+        if not datetime_obj.isValid():
+            datetime_obj = QDateTime.fromString(date_str, "yyyy-MM-dd hh:mm:ss")
+        if datetime_obj.isValid():
+            return datetime_obj, coin, symbol, cap, age
+    return None
+
+
+def load_archive(root=ARCHIVE_DIR):
+    """Every (channel, message) of the JSON dumps under root; unreadable dumps are skipped."""
+    messages = []
+    for path in sorted(glob.glob(os.path.join(root, "*", "*.json"))):
+        channel = os.path.basename(os.path.dirname(path))
+        try:
+            messages.extend((channel, msg) for msg in iter_json_messages(path))
+        except ValueError as e:
+            print(f"Skipping {path}: {e}")
+    return messages
+
+
+def parse_one_by_one(archive):
+    rows = []
+    for channel, msg in archive:
+        if "date" in msg and "message" in msg:
+            date = parse_date(msg["date"])
+            if date is not None:
+                rows.append((date,) + parse_alert(msg["message"], channel))
+    return rows
+
+
+def parse_in_batches(archive):
+    # Batches of one channel at a time, as the loaders send them
+    by_channel = {}
+    for channel, msg in archive:
+        by_channel.setdefault(channel, []).append(msg)
+    rows = []
+    for channel, messages in by_channel.items():
+        for start in range(0, len(messages), BATCH_SIZE):
+            rows.extend(parse_messages(messages[start:start + BATCH_SIZE], channel))
+    return rows
+
+
+def bench_parsers(texts, repeat):
+    """Runs every registered parser over every text, timing it and counting its pre-filter hits."""
+    print(f"\n{'parser':<16} {'channels':>8} {'msgs/s':>12} {'skipped':>8} {'regex':>7} {'matched':>8}")
+    for name, parser in PARSERS.items():
+        best = float("inf")
+        for _ in range(repeat):
+            skipped = matched = 0
+            started = time.perf_counter()
+            for text in texts:
+                if not parser.accepts(text):
+                    skipped += 1
+                elif parser.parse_text(text) is not None:
+                    matched += 1
+            best = min(best, time.perf_counter() - started)
+        channels = sum(1 for routed in CHANNEL_PARSERS.values() if routed == name)
+        print(f"{name:<16} {channels or 'default':>8} {len(texts) / best:>12,.0f} {skipped:>8} "
+              f"{len(texts) - skipped:>7} {matched:>8}")
+
+
+def build_corpus(archive, path=CORPUS_PATH):
+    """Picks alert-like and plain messages from every channel and records what they parse to."""
+    picked = []
+    counts = {}
+    for channel, msg in archive:
+        text = msg.get("message") or ""
+        first = channel not in counts
+        counts.setdefault(channel, 0)
+        markers = parser_for(channel).markers
+        if any(marker in text for marker in markers) and counts[channel] < CORPUS_PER_CHANNEL:
+            counts[channel] += 1
+        elif not first:
+            continue
+        picked.append((channel, msg))
+
+    corpus = []
+    for channel, msg in picked:
+        rows = parse_messages([msg], channel)
+        expected = None
+        if rows:
+            date_ms, coin, symbol, cap, market_cap, age = rows[0]
+            expected = {"date_ms": date_ms, "coin": coin, "symbol": symbol, "cap": cap,
+                        "market_cap": market_cap, "age": age}
+        corpus.append({"channel": channel, "message_id": msg.get("message_id"),
+                       "date": msg.get("date"), "message": msg.get("message"), "expected": expected})
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(corpus, f, indent=1, ensure_ascii=False)
+    print(f"Wrote {len(corpus)} messages from {len(counts)} channels to {path}")
+
+
+def timed(label, func, messages, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = func(messages)
+        best = min(best, time.perf_counter() - started)
+    print(f"{label:<24} {len(messages) / best:>12,.0f} msgs/s  ({best * 1000:.0f} ms, {len(rows)} rows)")
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Telegram alert parser on the scraped archive.")
+    parser.add_argument("--root", default=ARCHIVE_DIR)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--build-corpus", action="store_true", help=f"Rewrite {CORPUS_PATH} instead of timing")
+    args = parser.parse_args()
+
+    archive = load_archive(args.root)
+    if args.build_corpus:
+        build_corpus(archive)
+        return
+
+    print(f"{len(archive)} messages from {len({channel for channel, _ in archive})} channels")
+    timed("legacy (QDateTime)", lambda batch: [row for row in (legacy_parse_message_data(msg) for _, msg in batch) if row],
+          archive, args.repeat)
+    timed("alert_parser per message", parse_one_by_one, archive, args.repeat)
+    timed("alert_parser batches", parse_in_batches, archive, args.repeat)
+    bench_parsers([msg.get("message") for _, msg in archive], args.repeat)
+
+
+if __name__ == "__main__":
+    main()
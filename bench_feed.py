@@ -0,0 +1,143 @@
+"""Ingest benchmark for the real-time dashboard against a local replay server.
+
+Runs WebSocketDisplay headless and reports throughput, decode-to-render latency
+(from the frame leaving the socket to the feed view having repainted it) and memory
+growth. Example:
+
+    QT_QPA_PLATFORM=offscreen python bench_feed.py --coins 20000 --speed 0
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import sys
+import time
+
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication
+from qasync import QEventLoop
+
+from feed_recorder import read_recording
+from replay_server import ReplayServer, synthetic_frames
+
+
+def rss_mb():
+    """Current resident memory; falls back to the peak where /proc is not available."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10
+
+
+class LatencyProbe:
+    """Times every drained message until the feed flush that shows it has been painted."""
+
+    def __init__(self, display):
+        self.display = display
+        self.latencies = []
+        self.drained = []
+        self.first_render = None
+        self.last_render = None
+
+        worker = display.feed_worker
+        drain = worker.drain
+
+        def drain_and_note(max_items=None):
+            batch = drain(max_items)
+            self.drained.extend(received_at for received_at, _ in batch)
+            return batch
+
+        worker.drain = drain_and_note
+        display.feed_timer.timeout.disconnect()
+        display.feed_timer.timeout.connect(self.flush_feed)
+
+    def flush_feed(self):
+        self.display.flush_feed()
+        if not self.drained:
+            return
+        self.display.realtime_view.viewport().repaint()
+        now = time.perf_counter()
+        self.latencies.extend(now - received_at for received_at in self.drained)
+        self.drained.clear()
+        if self.first_render is None:
+            self.first_render = now
+        self.last_render = now
+
+
+async def run_bench(frames, speed, timeout):
+    import main  # after the Qt platform is chosen
+
+    server = ReplayServer(frames, speed=speed)
+    uri = server.start_in_thread()
+    rss_before = rss_mb()
+    display = main.WebSocketDisplay(feed_uri=uri)
+    probe = LatencyProbe(display)
+    worker = display.feed_worker
+    started = time.perf_counter()
+    try:
+        # Done once the server has played everything and the UI has shown all of it
+        while time.perf_counter() - started < timeout:
+            await asyncio.sleep(0.1)
+            if server.sessions_done and worker.received >= server.sent and not len(worker.queue) \
+                    and not probe.drained and len(probe.latencies) >= server.sent:
+                break
+        elapsed = time.perf_counter() - started
+    finally:
+        worker.stop()
+        server.stop_thread()
+
+    latencies = np.array(probe.latencies) * 1000
+    span = (probe.last_render - probe.first_render) if probe.first_render else 0.0
+    return {
+        "frames_sent": server.sent,
+        "frames_received": worker.received,
+        "messages_rendered": len(latencies),
+        "dropped": worker.queue.dropped,
+        "elapsed_s": round(elapsed, 3),
+        "msgs_per_s": round(len(latencies) / span, 1) if span else None,
+        "latency_p50_ms": round(float(np.percentile(latencies, 50)), 2) if len(latencies) else None,
+        "latency_p99_ms": round(float(np.percentile(latencies, 99)), 2) if len(latencies) else None,
+        "latency_max_ms": round(float(latencies.max()), 2) if len(latencies) else None,
+        "rss_before_mb": round(rss_before, 1),
+        "rss_after_mb": round(rss_mb(), 1),
+        "rss_growth_mb": round(rss_mb() - rss_before, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dashboard ingest against a local replay server.")
+    parser.add_argument("--recording", help="Folder of segments written by FeedRecorder")
+    parser.add_argument("--coins", type=int, default=5000, help="Synthetic coins when no recording is given")
+    parser.add_argument("--trades-per-coin", type=int, default=0)
+    parser.add_argument("--rate", type=float, default=200.0, help="Synthetic frames per second at 1x")
+    parser.add_argument("--speed", type=float, default=0, help="Playback speed; 0 sends as fast as possible")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    args = parser.parse_args()
+
+    if args.recording:
+        frames = list(read_recording(args.recording))
+    else:
+        frames = synthetic_frames(args.coins, args.trades_per_coin, rate=args.rate)
+
+    app = QApplication(sys.argv[:1])
+    loop = QEventLoop(app)
+    asyncio.set_event_loop(loop)
+    with loop:
+        results = loop.run_until_complete(run_bench(frames, args.speed or None, args.timeout))
+
+    if args.json:
+        print(json.dumps(results))
+    else:
+        for name, value in results.items():
+            print(f"{name:>20}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from csv_cache import CsvCache, DEFAULT_CACHE_DIR
+
+
+def list_coin_files(folder_path):
+    """Returns the CSV files in folder_path, sorted by name."""
+    return sorted(
+        os.path.join(folder_path, filename)
+        for filename in os.listdir(folder_path)
+        if filename.endswith(".csv")
+    )
+
+
+def coin_name_for(file_path):
+    return os.path.splitext(os.path.basename(file_path))[0]
+
+
+def parse_and_cache(file_path, cache_dir):
+    # Runs in a worker process, so it builds its own cache handle
+    return CsvCache(cache_dir).load(file_path)
+
+
+class CoinLoader:
+    """Loads a folder of coin CSVs in parallel without blocking the event loop.
+
+    Cache hits are read on a thread pool (Arrow releases the GIL), cache misses are
+    parsed on a process pool so a cold folder uses every core.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_workers=None):
+        self.cache = CsvCache(cache_dir)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._threads = None
+        self._processes = None
+
+    def _thread_pool(self):
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(self.max_workers, thread_name_prefix="coin-cache")
+        return self._threads
+
+    def _process_pool(self):
+        if self._processes is None:
+            # spawn keeps the workers clear of the parent's Qt and event loop threads
+            context = multiprocessing.get_context("spawn")
+            self._processes = ProcessPoolExecutor(self.max_workers, mp_context=context)
+        return self._processes
+
+    async def _load_one(self, file_path):
+        loop = asyncio.get_running_loop()
+        try:
+            df = await loop.run_in_executor(self._thread_pool(), self.cache.lookup, file_path)
+            if df is None:
+                df = await loop.run_in_executor(
+                    self._process_pool(), parse_and_cache, file_path, self.cache.cache_dir
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Error loading {os.path.basename(file_path)}: {e}")
+            df = None
+        return coin_name_for(file_path), df
+
+    async def load_folder(self, folder_path, on_coin=None, on_progress=None):
+        """Loads every CSV in folder_path and returns {coin_name: DataFrame}.
+
+        on_coin(coin_name, df) is called as each coin finishes and
+        on_progress(done, total) after every file, loaded or not.
+        Cancelling the calling task cancels all files that have not started yet.
+        """
+        file_paths = list_coin_files(folder_path)
+        total = len(file_paths)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._thread_pool(), self.cache.prune_folder, folder_path)
+        if on_progress:
+            on_progress(0, total)
+
+        tasks = [asyncio.ensure_future(self._load_one(path)) for path in file_paths]
+        all_data = {}
+        done = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                coin_name, df = await next_done
+                if df is not None:
+                    all_data[coin_name] = df
+                    if on_coin:
+                        on_coin(coin_name, df)
+                done += 1
+                if on_progress:
+                    on_progress(done, total)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return all_data
+
+    def shutdown(self):
+        if self._threads is not None:
+            self._threads.shutdown(wait=False, cancel_futures=True)
+            self._threads = None
+        if self._processes is not None:
+            self._processes.shutdown(wait=False, cancel_futures=True)
+            self._processes = None
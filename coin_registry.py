@@ -0,0 +1,153 @@
+import bisect
+import difflib
+import time
+from collections import OrderedDict
+
+
+def normalize_symbol(symbol):
+    return (symbol or "").strip().upper()
+
+
+class CoinRegistry:
+    """Bounded registry of created coins (mint -> CreateEvent) with a symbol index.
+
+    Symbols are indexed case-insensitively, so exact lookups cost O(1) plus the
+    number of mints that share the symbol, and prefix lookups a binary search plus
+    the number of matches. Coins are kept in least-recently-used order; adding past
+    max_coins evicts the least recently used one, and coins not seen or looked up
+    for ttl seconds are dropped (ttl=None keeps them until the cap is reached).
+
+    An optional RegistrySnapshot backs the lookups: coins found only in the snapshot
+    are loaded into the registry the first time a search matches them.
+    """
+
+    def __init__(self, max_coins=50000, ttl=None, clock=time.monotonic, snapshot=None):
+        self.max_coins = max_coins
+        self.ttl = ttl
+        self.clock = clock
+        self.snapshot = snapshot
+        self.coins = OrderedDict()  # mint -> [event, last_seen]
+        self.by_symbol = {}  # normalized symbol -> {mint: None}, in insertion order
+        self.sorted_symbols = []
+        self.evicted = 0
+
+    def __len__(self):
+        return len(self.coins)
+
+    def __contains__(self, mint):
+        return mint in self.coins
+
+    def add(self, event):
+        """Registers a create event; a mint that is already known keeps its first event."""
+        mint = event.mint
+        if not mint:
+            return
+        now = self.clock()
+        entry = self.coins.get(mint)
+        if entry is not None:
+            entry[1] = now
+            self.coins.move_to_end(mint)
+            return
+
+        self.coins[mint] = [event, now]
+        symbol = normalize_symbol(event.symbol)
+        mints = self.by_symbol.get(symbol)
+        if mints is None:
+            mints = self.by_symbol[symbol] = {}
+            bisect.insort(self.sorted_symbols, symbol)
+        mints[mint] = None
+        self.expire(now)
+        while len(self.coins) > self.max_coins:
+            self._evict_oldest()
+
+    def get(self, mint):
+        entry = self.coins.get(mint)
+        return None if entry is None else entry[0]
+
+    def find_symbol(self, symbol):
+        """All known coins with exactly this symbol (any case), oldest first."""
+        self.expire()
+        if self.snapshot is not None:
+            self._restore(self.snapshot.find_symbol(symbol))
+        mints = self.by_symbol.get(normalize_symbol(symbol), ())
+        return self._touch(list(mints))
+
+    def find_prefix(self, prefix, limit=20):
+        """Coins whose symbol starts with prefix (any case), in symbol order."""
+        self.expire()
+        prefix = normalize_symbol(prefix)
+        if not prefix:
+            return []
+        if self.snapshot is not None:
+            self._restore(self.snapshot.find_prefix(prefix, limit))
+        start = bisect.bisect_left(self.sorted_symbols, prefix)
+        mints = []
+        for symbol in self.sorted_symbols[start:]:
+            if not symbol.startswith(prefix) or len(mints) >= limit:
+                break
+            mints.extend(self.by_symbol[symbol])
+        return self._touch(mints[:limit])
+
+    def suggest_symbols(self, symbol, limit=5, cutoff=0.6):
+        """Known symbols close to symbol, for typos.
+
+        Only symbols sharing the first character are compared, which keeps this a
+        binary search plus one bucket instead of a scan of every symbol.
+        """
+        symbol = normalize_symbol(symbol)
+        if not symbol:
+            return []
+        first = symbol[0]
+        start = bisect.bisect_left(self.sorted_symbols, first)
+        stop = bisect.bisect_left(self.sorted_symbols, chr(ord(first) + 1))
+        candidates = self.sorted_symbols[start:stop]
+        if self.snapshot is not None:
+            candidates = set(candidates).union(self.snapshot.symbols_starting_with(first))
+        return difflib.get_close_matches(symbol, candidates, limit, cutoff)
+
+    def expire(self, now=None):
+        if self.ttl is None:
+            return
+        if now is None:
+            now = self.clock()
+        # Least recently seen coins are at the front
+        while self.coins:
+            oldest = next(iter(self.coins.values()))
+            if now - oldest[1] < self.ttl:
+                break
+            self._evict_oldest()
+
+    def _evict_oldest(self):
+        mint, (event, _) = self.coins.popitem(last=False)
+        symbol = normalize_symbol(event.symbol)
+        mints = self.by_symbol.get(symbol)
+        if mints is not None:
+            mints.pop(mint, None)
+            if not mints:
+                del self.by_symbol[symbol]
+                index = bisect.bisect_left(self.sorted_symbols, symbol)
+                if index < len(self.sorted_symbols) and self.sorted_symbols[index] == symbol:
+                    del self.sorted_symbols[index]
+        self.evicted += 1
+
+    def _restore(self, events):
+        for event in events:
+            if event.mint not in self.coins:
+                self.add(event)
+
+    def _touch(self, mints):
+        now = self.clock()
+        events = []
+        for mint in mints:
+            entry = self.coins[mint]
+            entry[1] = now
+            self.coins.move_to_end(mint)
+            events.append(entry[0])
+        return events
+
+    def stats(self):
+        return {
+            "coins": len(self.coins),
+            "symbols": len(self.by_symbol),
+            "evicted": self.evicted,
+        }
@@ -0,0 +1,171 @@
+import asyncio
+import json
+import random
+import ssl
+import time
+import traceback
+
+import certifi
+import websockets
+
+from subscription_manager import SubscriptionManager
+
+PUMPPORTAL_URI = "wss://pumpportal.fun/api/data"
+DEFAULT_STREAMS = ("subscribeNewToken", "subscribeMigration")
+
+
+class ConnectionSupervisor:
+    """Owns the one pumpportal websocket session and keeps it alive.
+
+    run() connects, replays the current subscriptions, hands every frame to
+    on_message(raw) and reconnects with jittered exponential backoff when the
+    session drops. start() never creates a second session while one is running.
+    """
+
+    def __init__(self, on_message, uri=PUMPPORTAL_URI, streams=DEFAULT_STREAMS,
+                 base_delay=1.0, max_delay=60.0, stable_after=30.0,
+                 ping_interval=15.0, ping_timeout=10.0, batch_size=100, min_frame_interval=0.25):
+        self.on_message = on_message
+        self.uri = uri
+        self.streams = set(streams)
+        self.subscriptions = SubscriptionManager(self.send, batch_size=batch_size,
+                                                 min_interval=min_frame_interval)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.stable_after = stable_after
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+
+        self.websocket = None
+        self.task = None
+
+        # Counters for checking that only one session ever exists
+        self.open_connections = 0
+        self.connection_count = 0
+        self.reconnect_count = 0
+        self.ping_rtt = None
+
+    @property
+    def is_connected(self):
+        return self.websocket is not None
+
+    @property
+    def token_keys(self):
+        """The mints whose trades this session should receive."""
+        return self.subscriptions.desired
+
+    def start(self):
+        if self.task is None or self.task.done():
+            self.task = asyncio.ensure_future(self.run())
+        return self.task
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+
+    def backoff_delay(self, attempt):
+        # Equal jitter: never below half the capped exponential delay
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+    def ssl_context(self):
+        if self.uri.startswith("wss://"):
+            return ssl.create_default_context(cafile=certifi.where())
+        return None
+
+    async def run(self):
+        attempt = 0
+        while True:
+            connected_at = None
+            try:
+                async with websockets.connect(self.uri, ssl=self.ssl_context(), ping_interval=None) as websocket:
+                    connected_at = time.monotonic()
+                    self.websocket = websocket
+                    self.open_connections += 1
+                    self.connection_count += 1
+                    if self.connection_count > 1:
+                        self.reconnect_count += 1
+                    await self.replay_subscriptions()
+
+                    pinger = asyncio.ensure_future(self.ping_loop(websocket))
+                    try:
+                        async for message in websocket:
+                            self.on_message(message)
+                    finally:
+                        pinger.cancel()
+                        # wait() does not raise the pinger's CancelledError, but a cancel of run() still does
+                        await asyncio.wait([pinger])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                traceback.print_exc()
+            finally:
+                if connected_at is not None:
+                    self.open_connections -= 1
+                self.websocket = None
+
+            # Only a session that stayed up for a while resets the backoff
+            if connected_at is not None and time.monotonic() - connected_at >= self.stable_after:
+                attempt = 0
+            delay = self.backoff_delay(attempt)
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def ping_loop(self, websocket):
+        while True:
+            await asyncio.sleep(self.ping_interval)
+            sent_at = time.perf_counter()
+            try:
+                pong_waiter = await websocket.ping()
+                await asyncio.wait_for(pong_waiter, self.ping_timeout)
+            except asyncio.TimeoutError:
+                print("Ping timed out, dropping connection")
+                await websocket.close()
+                return
+            except websockets.ConnectionClosed:
+                return
+            self.ping_rtt = time.perf_counter() - sent_at
+
+    async def send(self, payload):
+        """Sends one control frame; returns False if there is no open session to send it on."""
+        websocket = self.websocket
+        if websocket is None:
+            return False
+        try:
+            await websocket.send(json.dumps(payload))
+        except websockets.ConnectionClosed:
+            return False
+        return True
+
+    async def replay_subscriptions(self):
+        for method in sorted(self.streams):
+            await self.send({"method": method})
+        await self.subscriptions.resubscribe()
+
+    async def subscribe_tokens(self, keys):
+        self.subscriptions.watch(keys)
+        await self.subscriptions.sync()
+
+    async def unsubscribe_tokens(self, keys):
+        self.subscriptions.unwatch(keys)
+        await self.subscriptions.sync()
+
+    async def set_tokens(self, keys):
+        """Replaces the watched mints; only the difference is sent."""
+        self.subscriptions.set_desired(keys)
+        await self.subscriptions.sync()
+
+    def stats(self):
+        return {
+            "connected": self.is_connected,
+            "open_connections": self.open_connections,
+            "connections": self.connection_count,
+            "reconnects": self.reconnect_count,
+            "ping_rtt_ms": None if self.ping_rtt is None else self.ping_rtt * 1000,
+            **self.subscriptions.stats(),
+        }
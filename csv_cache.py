@@ -0,0 +1,133 @@
+import hashlib
+import glob
+import os
+import pandas as pd
+
+# Feather (Arrow IPC) needs pyarrow; fall back to pickle so the cache still works without it
+try:
+    import pyarrow  # noqa: F401
+    HAS_ARROW = True
+except ImportError:
+    HAS_ARROW = False
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pump_screener", "csv")
+PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume', 'Market Cap']
+
+
+def parse_coin_csv(file_path):
+    """Reads one coin history CSV into a Date-indexed frame with float price columns."""
+    df = pd.read_csv(file_path)
+    df['Date'] = pd.to_datetime(df['Date'], format='%d-%m-%Y')
+    df.set_index('Date', inplace=True)
+    df = df.drop(columns=['Adj Close'], errors='ignore')
+    for column in PRICE_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype('float64')
+    return df
+
+
+class CsvCache:
+    """On-disk columnar cache of parsed coin CSVs, keyed by file path, size and mtime.
+
+    Every entry is named after the folder and source file it came from, so concurrent
+    writers never share a file. Writing a new version of a file drops its older entries,
+    and prune_folder drops the entries of files that were deleted or changed.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.extension = ".feather" if HAS_ARROW else ".pkl"
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _folder_prefix(self, folder_path):
+        folder_key = os.path.abspath(folder_path).encode("utf-8")
+        return os.path.join(self.cache_dir, hashlib.sha1(folder_key).hexdigest()[:12])
+
+    def _path_prefix(self, file_path):
+        file_path = os.path.abspath(file_path)
+        path_key = hashlib.sha1(file_path.encode("utf-8")).hexdigest()[:20]
+        return f"{self._folder_prefix(os.path.dirname(file_path))}-{path_key}"
+
+    def entry_path(self, file_path, stat=None):
+        if stat is None:
+            stat = os.stat(file_path)
+        version = f"{stat.st_size}-{stat.st_mtime_ns}"
+        return f"{self._path_prefix(file_path)}-{version}{self.extension}"
+
+    def lookup(self, file_path):
+        """Returns the cached frame for the current version of file_path, or None."""
+        entry = self.entry_path(file_path)
+        if os.path.exists(entry):
+            try:
+                df = self._read_entry(entry)
+                self.hits += 1
+                return df
+            except Exception as e:
+                print(f"Discarding unreadable cache entry {entry}: {e}")
+        return None
+
+    def load(self, file_path):
+        """Returns the parsed frame for file_path, re-parsing only when the file changed."""
+        df = self.lookup(file_path)
+        if df is not None:
+            return df
+
+        entry = self.entry_path(file_path)
+        df = parse_coin_csv(file_path)
+        self.misses += 1
+        try:
+            self._write_entry(file_path, entry, df)
+        except Exception as e:
+            print(f"Could not cache {file_path}: {e}")
+        return df
+
+    def _read_entry(self, entry):
+        if HAS_ARROW:
+            df = pd.read_feather(entry)
+        else:
+            df = pd.read_pickle(entry)
+        return df.set_index('Date')
+
+    def _write_entry(self, file_path, entry, df):
+        # Drop older versions of the same source file before writing the new one
+        prefix = self._path_prefix(file_path)
+        for old_entry in glob.glob(glob.escape(prefix) + "-*" + self.extension):
+            if old_entry != entry:
+                os.remove(old_entry)
+
+        tmp_path = f"{entry}.{os.getpid()}.tmp"
+        frame = df.reset_index()
+        if HAS_ARROW:
+            frame.to_feather(tmp_path)
+        else:
+            frame.to_pickle(tmp_path)
+        os.replace(tmp_path, entry)
+
+    def prune_folder(self, folder_path):
+        """Deletes the entries of folder_path's CSVs that no longer match a file on disk."""
+        current = set()
+        for filename in os.listdir(folder_path):
+            if filename.endswith(".csv"):
+                try:
+                    current.add(self.entry_path(os.path.join(folder_path, filename)))
+                except OSError:
+                    pass  # deleted while listing
+        entries = glob.glob(glob.escape(self._folder_prefix(folder_path)) + "-*" + self.extension)
+        # Entries named by file path alone, from before they were grouped by folder
+        entries += glob.glob(os.path.join(glob.escape(self.cache_dir), "[0-9a-f]" * 20 + "-*" + self.extension))
+        removed = 0
+        for entry in entries:
+            if entry not in current:
+                try:
+                    os.remove(entry)
+                    removed += 1
+                except OSError:
+                    pass  # already pruned by another loader
+        return removed
+
+    def clear(self):
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(self.extension) or name.endswith(".tmp"):
+                os.remove(os.path.join(self.cache_dir, name))
@@ -1,18 +1,21 @@
 import pandas as pd
 import os
 import matplotlib.pyplot as plt
+from csv_cache import CsvCache, parse_coin_csv
 
-def load_and_merge_data(folder_path):
-   #Combines the CSV files
+def load_and_merge_data(folder_path, cache=None):
+   #Combines the CSV files, reusing parsed frames from the cache when one is given
     all_data = {}
+    if cache is not None:
+        cache.prune_folder(folder_path)
     for filename in os.listdir(folder_path):
         if filename.endswith(".csv"):
             filepath = os.path.join(folder_path, filename)
             try:
-                df = pd.read_csv(filepath)
-                df['Date'] = pd.to_datetime(df['Date'], format='%d-%m-%Y')
-                df.set_index('Date', inplace=True)
-                df = df.drop(columns=['Adj Close'], errors='ignore')
+                if cache is not None:
+                    df = cache.load(filepath)
+                else:
+                    df = parse_coin_csv(filepath)
                 coin_name = os.path.splitext(filename)[0]
                 all_data[coin_name] = df
             except FileNotFoundError:
@@ -35,10 +38,11 @@ def plot_closing_prices(data_dict):
         plt.grid(True)
         plt.show()
 
-folder_path = "/Users/skautt/Desktop/capstone/Capstone-Project/Meme Coin"
-coin_data = load_and_merge_data(folder_path)
+if __name__ == "__main__":
+    folder_path = "/Users/skautt/Desktop/capstone/Capstone-Project/Meme Coin"
+    coin_data = load_and_merge_data(folder_path, cache=CsvCache())
 
-if coin_data:
-    plot_closing_prices(coin_data)
-else:
-    print("No data loaded.")
\ No newline at end of file
+    if coin_data:
+        plot_closing_prices(coin_data)
+    else:
+        print("No data loaded.")
@@ -0,0 +1,87 @@
+import numpy as np
+
+
+def visible_range(x, x_min, x_max):
+    """Index range of sorted x covering [x_min, x_max], plus one point either side."""
+    start = max(int(np.searchsorted(x, x_min, side='left')) - 1, 0)
+    stop = min(int(np.searchsorted(x, x_max, side='right')) + 1, len(x))
+    return start, stop
+
+
+def minmax_envelope(x, y, n_buckets):
+    """Keeps the lowest and highest point of each of n_buckets equal-width buckets.
+
+    Spikes survive at any zoom level, which matters for pump/dump charts.
+    Returns at most 2 * n_buckets + 2 points, in x order.
+    """
+    n = len(y)
+    if n_buckets < 1 or n <= 2 * n_buckets + 2:
+        return x, y
+
+    size = -(-n // n_buckets)
+    padded = np.full(size * n_buckets, np.nan)
+    padded[:n] = y
+    buckets = padded.reshape(n_buckets, size)
+
+    # NaNs never win either comparison, padding included
+    lows = np.where(np.isnan(buckets), np.inf, buckets).argmin(axis=1)
+    highs = np.where(np.isnan(buckets), -np.inf, buckets).argmax(axis=1)
+    offsets = np.arange(n_buckets) * size
+    index = np.concatenate([[0], offsets + lows, offsets + highs, [n - 1]])
+    index = np.unique(index[index < n])
+    return x[index], y[index]
+
+
+def lttb(x, y, n_out):
+    """Largest-Triangle-Three-Buckets downsampling to n_out points.
+
+    Keeps the visual shape of the series better than the envelope for smooth data;
+    the first and last points are always kept.
+    """
+    n = len(y)
+    if n_out < 3 or n <= n_out:
+        return x, y
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    index = np.empty(n_out, dtype=int)
+    index[0] = 0
+    index[-1] = n - 1
+    previous = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        # Average of the next bucket is the third corner of every candidate triangle
+        next_stop = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[stop:next_stop].mean()
+        avg_y = y[stop:next_stop].mean()
+
+        bucket_x = x[start:stop]
+        bucket_y = y[start:stop]
+        areas = np.abs(
+            (x[previous] - avg_x) * (bucket_y - y[previous])
+            - (x[previous] - bucket_x) * (avg_y - y[previous])
+        )
+        previous = start + int(np.nanargmax(areas)) if np.isfinite(areas).any() else start
+        index[i + 1] = previous
+    return x[index], y[index]
+
+
+def thin_points(x, weight, x_min, x_max, n_buckets):
+    """Indices of the heaviest point in each of n_buckets slots across [x_min, x_max].
+
+    Used for markers, where drawing more than one per pixel column only costs time.
+    """
+    inside = np.flatnonzero((x >= x_min) & (x <= x_max))
+    if len(inside) <= n_buckets or x_max <= x_min:
+        return inside
+
+    slots = ((x[inside] - x_min) / (x_max - x_min) * n_buckets).astype(int).clip(0, n_buckets - 1)
+    order = np.lexsort((-weight[inside], slots))
+    sorted_slots = slots[order]
+    first_in_slot = np.concatenate([[True], sorted_slots[1:] != sorted_slots[:-1]])
+    return np.sort(inside[order][first_in_slot])
+
+
+DOWNSAMPLERS = {
+    'minmax': minmax_envelope,
+    'lttb': lttb,
+}
@@ -0,0 +1,146 @@
+import json
+import re
+from operator import attrgetter
+
+from pump_events import EVENT_TYPES
+
+# Event attributes a rule can test; numeric ones take min/max, text ones regex/in/not_in
+NUMERIC_FIELDS = {"sol_amount", "market_cap_sol", "initial_buy", "token_amount",
+                  "v_sol_in_bonding_curve", "v_tokens_in_bonding_curve"}
+TEXT_FIELDS = {"name", "symbol", "trader", "pool", "mint", "uri"}
+DEFAULT_EVENTS = ("create",)
+
+
+class FilterRule:
+    """One compiled rule: a predicate over an event plus its hit counters."""
+    __slots__ = ('name', 'event_types', 'predicate', 'checked', 'rejected')
+
+    def __init__(self, name, event_types, predicate):
+        self.name = name
+        self.event_types = event_types
+        self.predicate = predicate
+        self.checked = 0
+        self.rejected = 0
+
+
+def compile_rule(spec):
+    """Builds a FilterRule from a dict such as
+
+        {"field": "market_cap_sol", "min": 30, "max": 500}
+        {"field": "name", "regex": "rug|scam", "exclude": true}
+        {"field": "trader", "not_in": ["<creator key>", ...]}
+        {"field": "pool", "in": ["pump"]}
+
+    A rule keeps the events that match it ("exclude" inverts that) and only looks at
+    events whose txType is in "events" (default: creates). Raises ValueError for a
+    spec it cannot compile, naming the offending spec.
+    """
+    if not isinstance(spec, dict):
+        raise ValueError(f"Filter rule should be an object, not {spec!r}")
+    field = spec.get("field")
+    if field not in NUMERIC_FIELDS and field not in TEXT_FIELDS:
+        raise ValueError(f"Unknown filter field: {field!r}")
+    get = attrgetter(field)
+    name = spec.get("name") or json.dumps(spec, sort_keys=True)
+
+    if "min" in spec or "max" in spec:
+        if field not in NUMERIC_FIELDS:
+            raise ValueError(f"min/max need a numeric field, not {field!r}")
+        try:
+            low = float(spec.get("min", float("-inf")))
+            high = float(spec.get("max", float("inf")))
+        except (TypeError, ValueError):
+            raise ValueError(f"min/max need numbers in filter {name}") from None
+
+        def predicate(event):
+            value = get(event)
+            return value is not None and low <= value <= high
+    elif "regex" in spec:
+        if not isinstance(spec["regex"], str):
+            raise ValueError(f"regex needs a string in filter {name}")
+        try:
+            search = re.compile(spec["regex"], re.IGNORECASE).search
+        except re.error as e:
+            raise ValueError(f"Bad regex in filter {name}: {e}") from None
+
+        def predicate(event):
+            return search(get(event) or "") is not None
+    elif "in" in spec or "not_in" in spec:
+        allowed = "in" in spec
+        values = spec["in"] if allowed else spec["not_in"]
+        # A bare string would otherwise become a set of its characters
+        if not isinstance(values, list) or not all(isinstance(v, (str, int, float)) for v in values):
+            raise ValueError(f"in/not_in need a list of values in filter {name}")
+        values = frozenset(values)
+
+        def predicate(event):
+            return (get(event) in values) is allowed
+    else:
+        raise ValueError(f"Filter {name} has no condition (min/max, regex, in or not_in)")
+
+    if spec.get("exclude"):
+        matches = predicate
+
+        def predicate(event):
+            return not matches(event)
+
+    event_types = spec.get("events", DEFAULT_EVENTS)
+    if not isinstance(event_types, (list, tuple)) or not all(isinstance(t, str) for t in event_types):
+        raise ValueError(f"events needs a list of txTypes in filter {name}")
+    event_types = frozenset(event_types)
+    for event_type in event_types:
+        if event_type not in EVENT_TYPES or field not in EVENT_TYPES[event_type].__slots__:
+            raise ValueError(f"Filter {name} tests {field!r}, which {event_type!r} events do not have")
+    return FilterRule(name, event_types, predicate)
+
+
+class FeedFilter:
+    """Keeps an event only if every rule that applies to its txType keeps it.
+
+    Rules run in order and stop at the first rejection, so cheap, selective rules
+    belong first. Events of types no rule looks at (status messages, for example) pass
+    untouched.
+    """
+
+    def __init__(self, rules=()):
+        self.rules = [rule if isinstance(rule, FilterRule) else compile_rule(rule) for rule in rules]
+        # The rules for each txType, resolved once instead of per event
+        self.rules_by_type = {}
+        for rule in self.rules:
+            for event_type in rule.event_types:
+                self.rules_by_type.setdefault(event_type, []).append(rule)
+        self.passed = 0
+        self.rejected = 0
+
+    def __bool__(self):
+        return bool(self.rules)
+
+    def __call__(self, event):
+        for rule in self.rules_by_type.get(event.tx_type, ()):
+            rule.checked += 1
+            if not rule.predicate(event):
+                rule.rejected += 1
+                self.rejected += 1
+                return False
+        self.passed += 1
+        return True
+
+    def stats(self):
+        return {
+            "passed": self.passed,
+            "rejected": self.rejected,
+            "rules": [{"name": rule.name, "checked": rule.checked, "rejected": rule.rejected}
+                      for rule in self.rules],
+        }
+
+
+def load_rules(path):
+    """Reads a JSON list of rule specs; a missing file means no rules."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            specs = json.load(f)
+    except FileNotFoundError:
+        return FeedFilter()
+    if not isinstance(specs, list):
+        raise ValueError(f"{path} should hold a JSON list of filter rules")
+    return FeedFilter(specs)
@@ -0,0 +1,66 @@
+from collections import deque
+
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+def format_trade_row(row):
+    name, symbol, sol_amount, market_cap_sol, signature = row
+    return f"{name} ({symbol})  SOL: {sol_amount:.2f}  Cap: {market_cap_sol:.2f}  Sig: {signature}"
+
+
+class FeedModel(QAbstractListModel):
+    """Bounded ring buffer of real-time feed rows for a QListView.
+
+    append() only queues a row; flush() moves everything queued into the model in
+    one insert, dropping the oldest rows past `retention`. Rows are kept as raw
+    tuples and only formatted when the view asks for a visible row.
+    """
+
+    def __init__(self, retention=2000, formatter=format_trade_row, parent=None):
+        super().__init__(parent)
+        self.retention = retention
+        self.formatter = formatter
+        self.rows = deque(maxlen=retention)
+        self.pending = deque(maxlen=retention)
+        self.received = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        row = self.rows[index.row()]
+        return row if isinstance(row, str) else self.formatter(row)
+
+    def append(self, row):
+        """Queues a row (a formatter tuple, or a plain status string) for the next flush."""
+        self.pending.append(row)
+        self.received += 1
+
+    def flush(self):
+        """Inserts the queued rows; returns how many were added."""
+        if not self.pending:
+            return 0
+        batch = list(self.pending)
+        self.pending.clear()
+
+        overflow = len(self.rows) + len(batch) - self.retention
+        if overflow > 0:
+            removed = min(overflow, len(self.rows))
+            self.beginRemoveRows(QModelIndex(), 0, removed - 1)
+            for _ in range(removed):
+                self.rows.popleft()
+            self.endRemoveRows()
+
+        first = len(self.rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(batch) - 1)
+        self.rows.extend(batch)
+        self.endInsertRows()
+        return len(batch)
+
+    def clear(self):
+        self.beginResetModel()
+        self.rows.clear()
+        self.pending.clear()
+        self.endResetModel()
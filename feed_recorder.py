@@ -0,0 +1,193 @@
+import glob
+import gzip
+import json
+import os
+import threading
+import time
+from collections import deque
+
+# zstd compresses the feed better and faster than gzip, but needs the zstandard package
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DEFAULT_RECORD_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pump_screener", "recordings")
+EXTENSIONS = {"gzip": ".jsonl.gz", "zstd": ".jsonl.zst"}
+
+
+def encode_record(received_at, raw):
+    """One JSONL line: {"t": unix receive time, "frame": the frame text}."""
+    if isinstance(raw, bytes):
+        raw = raw.decode("utf-8", errors="replace")
+    if orjson is not None:
+        return orjson.dumps({"t": received_at, "frame": raw}) + b"\n"
+    return (json.dumps({"t": received_at, "frame": raw}) + "\n").encode("utf-8")
+
+
+def open_segment(path, compression):
+    if compression == "zstd":
+        return zstandard.ZstdCompressor(level=3).stream_writer(open(path, "wb"))
+    return gzip.open(path, "wb", compresslevel=5)
+
+
+def open_segment_reader(path):
+    if path.endswith(EXTENSIONS["zstd"]):
+        if zstandard is None:
+            raise RuntimeError(f"{path} needs the zstandard package")
+        return zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+    return gzip.open(path, "rb")
+
+
+def list_segments(directory):
+    """Recorded segments in the order they were written."""
+    paths = []
+    for extension in EXTENSIONS.values():
+        paths.extend(glob.glob(os.path.join(directory, f"feed-*{extension}")))
+    return sorted(paths)
+
+
+def read_segment(path):
+    """Yields (received_at, frame) for every complete line of one segment."""
+    with open_segment_reader(path) as raw_file:
+        try:
+            for line in _lines(raw_file):
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break  # the tail of a segment that was still being written
+                yield record["t"], record["frame"]
+        except EOFError:
+            pass  # gzip stream cut off by a crash
+
+
+def _lines(raw_file):
+    buffered = b""
+    while True:
+        chunk = raw_file.read(1 << 16)
+        if not chunk:
+            break
+        lines = (buffered + chunk).split(b"\n")
+        buffered = lines.pop()
+        yield from lines
+    if buffered:
+        yield buffered
+
+
+def read_recording(directory):
+    for path in list_segments(directory):
+        yield from read_segment(path)
+
+
+class FeedRecorder(threading.Thread):
+    """Appends every raw feed frame, with its receive time, to compressed JSONL segments.
+
+    record() only appends to an in-memory deque, so the feed thread never waits on
+    compression or disk. A writer thread drains the deque every flush_interval seconds
+    and starts a new segment once the current one holds max_bytes of uncompressed
+    lines or is max_seconds old. If the writer falls max_pending frames behind, the
+    oldest unwritten frames are dropped and counted.
+    """
+
+    def __init__(self, directory=DEFAULT_RECORD_DIR, compression=None, max_bytes=64 * 1024 * 1024,
+                 max_seconds=3600, flush_interval=0.5, max_pending=200000):
+        super().__init__(name="feed-recorder", daemon=True)
+        if compression is None:
+            compression = "zstd" if zstandard is not None else "gzip"
+        if compression == "zstd" and zstandard is None:
+            raise RuntimeError("zstd recording needs the zstandard package")
+        if compression not in EXTENSIONS:
+            raise ValueError(f"Unknown compression: {compression}")
+        self.directory = directory
+        self.compression = compression
+        self.max_bytes = max_bytes
+        self.max_seconds = max_seconds
+        self.flush_interval = flush_interval
+        self.pending = deque(maxlen=max_pending)
+        self.stopping = threading.Event()
+
+        self.file = None
+        self.segment_path = None
+        self.segment_bytes = 0
+        self.segment_opened_at = None
+        self.segment_count = 0
+
+        self.received = 0
+        self.written = 0
+        self.bytes_written = 0
+
+    def record(self, raw, received_at=None):
+        # deque.append is atomic, so the feed thread needs no lock here
+        self.pending.append((time.time() if received_at is None else received_at, raw))
+        self.received += 1
+
+    @property
+    def dropped(self):
+        return self.received - self.written - len(self.pending)
+
+    def run(self):
+        try:
+            while not self.stopping.wait(self.flush_interval):
+                self.write_pending()
+            self.write_pending()
+        finally:
+            self.close_segment()
+
+    def stop(self, timeout=5.0):
+        self.stopping.set()
+        if self.is_alive():
+            self.join(timeout)
+
+    def write_pending(self):
+        batch = []
+        pending = self.pending
+        while pending:
+            batch.append(pending.popleft())
+        if not batch:
+            return 0
+
+        for start in range(0, len(batch), 10000):
+            data = b"".join(encode_record(received_at, raw)
+                            for received_at, raw in batch[start:start + 10000])
+            if self.file is None or self.segment_full():
+                self.rotate()
+            self.file.write(data)
+            self.segment_bytes += len(data)
+            self.bytes_written += len(data)
+        self.file.flush()
+        self.written += len(batch)
+        return len(batch)
+
+    def segment_full(self):
+        return (self.segment_bytes >= self.max_bytes
+                or time.monotonic() - self.segment_opened_at >= self.max_seconds)
+
+    def rotate(self):
+        self.close_segment()
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        self.segment_count += 1
+        name = f"feed-{stamp}-{os.getpid()}-{self.segment_count:04d}{EXTENSIONS[self.compression]}"
+        self.segment_path = os.path.join(self.directory, name)
+        self.file = open_segment(self.segment_path, self.compression)
+        self.segment_bytes = 0
+        self.segment_opened_at = time.monotonic()
+
+    def close_segment(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def stats(self):
+        return {
+            "recorded": self.written,
+            "record_pending": len(self.pending),
+            "record_dropped": self.dropped,
+            "segments": self.segment_count,
+            "record_bytes": self.bytes_written,
+        }
@@ -0,0 +1,130 @@
+import asyncio
+import threading
+import time
+from collections import deque
+
+from connection_supervisor import ConnectionSupervisor, PUMPPORTAL_URI
+from pump_events import decode_event
+
+
+class DropOldestQueue:
+    """Thread-safe bounded FIFO; a put on a full queue discards the oldest item."""
+
+    def __init__(self, maxsize):
+        self.items = deque(maxlen=maxsize)
+        self.lock = threading.Lock()
+        self.dropped = 0
+
+    def put(self, item):
+        with self.lock:
+            if len(self.items) == self.items.maxlen:
+                self.dropped += 1
+            self.items.append(item)
+
+    def drain(self, max_items=None):
+        """Removes and returns up to max_items of the oldest items."""
+        with self.lock:
+            if max_items is None or max_items >= len(self.items):
+                batch = list(self.items)
+                self.items.clear()
+            else:
+                batch = [self.items.popleft() for _ in range(max_items)]
+        return batch
+
+    def __len__(self):
+        return len(self.items)
+
+
+class FeedWorker(threading.Thread):
+    """Receives and decodes the pumpportal feed on its own thread and event loop.
+
+    Typed events are queued as (received_at, event) with a drop-oldest policy, so a
+    slow consumer loses the oldest messages instead of stalling the socket read.
+    Frames that fail to decode are queued as their error text instead of an event;
+    frames the decoder does not recognise are not queued at all. An optional
+    FeedRecorder receives every raw frame before it is decoded; the worker starts and
+    stops it with itself. An optional FeedFilter runs right after decoding, so events
+    it rejects never reach the consumer.
+    """
+
+    def __init__(self, uri=PUMPPORTAL_URI, queue_size=10000, decode=decode_event, recorder=None,
+                 feed_filter=None):
+        super().__init__(name="pumpportal-feed", daemon=True)
+        self.decode = decode
+        self.recorder = recorder
+        self.feed_filter = feed_filter or None
+        self.queue = DropOldestQueue(queue_size)
+        self.supervisor = ConnectionSupervisor(self.handle_message, uri=uri)
+        self.loop = None
+        self.loop_ready = threading.Event()
+
+        self.received = 0
+        self.decode_errors = 0
+        self.last_lag = None
+        self.max_lag = 0.0
+
+    def run(self):
+        if self.recorder is not None:
+            self.recorder.start()
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.supervisor.start()
+        self.loop.call_soon(self.loop_ready.set)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+
+    def handle_message(self, raw):
+        received_at = time.perf_counter()
+        self.received += 1
+        if self.recorder is not None:
+            self.recorder.record(raw)
+        try:
+            event = self.decode(raw)
+        except ValueError:
+            self.decode_errors += 1
+            event = f"Error decoding JSON: {raw}"
+        if event is None:
+            return
+        if self.feed_filter is not None and not isinstance(event, str) and not self.feed_filter(event):
+            return
+        self.queue.put((received_at, event))
+
+    def drain(self, max_items=None):
+        """Returns queued (received_at, event) items, oldest first, and records their lag."""
+        batch = self.queue.drain(max_items)
+        if batch:
+            # The oldest item in the batch has waited the longest
+            self.last_lag = time.perf_counter() - batch[0][0]
+            self.max_lag = max(self.max_lag, self.last_lag)
+        return batch
+
+    def submit(self, coro):
+        """Runs a coroutine on the worker loop; returns a concurrent.futures.Future."""
+        self.loop_ready.wait()
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self, timeout=5.0):
+        if self.loop is not None and self.loop.is_running():
+            self.submit(self.supervisor.stop()).result(timeout)
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        self.join(timeout)
+        if self.recorder is not None:
+            self.recorder.stop(timeout)
+
+    def stats(self):
+        stats = self.supervisor.stats()
+        stats.update({
+            "received": self.received,
+            "decode_errors": self.decode_errors,
+            "queue_depth": len(self.queue),
+            "dropped": self.queue.dropped,
+            "lag_ms": None if self.last_lag is None else self.last_lag * 1000,
+            "max_lag_ms": self.max_lag * 1000,
+        })
+        if self.recorder is not None:
+            stats.update(self.recorder.stats())
+        if self.feed_filter is not None:
+            stats["filtered"] = self.feed_filter.rejected
+        return stats
@@ -0,0 +1,294 @@
+"""Headless pump.fun ingest: feed, registry, tracker, detector and recorder without Qt.
+
+Alerts are appended to a JSONL file and a status file with stats and the top tokens is
+rewritten every stats interval. With --relay-port the daemon also serves a local,
+pumpportal-compatible websocket, so the dashboard can attach to it with
+PUMP_FEED_URI=ws://127.0.0.1:<port> instead of opening its own upstream session.
+
+    python ingest_daemon.py --alerts alerts.jsonl --status status.json --relay-port 8765
+"""
+import argparse
+import asyncio
+import json
+import os
+import signal
+import time
+
+import websockets
+
+from coin_registry import CoinRegistry
+from connection_supervisor import ConnectionSupervisor, PUMPPORTAL_URI
+from feed_filters import FeedFilter, load_rules
+from feed_recorder import FeedRecorder
+from pump_events import CreateEvent, MigrationEvent, TradeEvent, loads, event_from_dict
+from registry_snapshot import DEFAULT_SNAPSHOT_DIR, RegistrySnapshot
+from replay_server import STREAMS, apply_control, wants
+from stream_detector import StreamDetector
+from token_tracker import TokenTracker
+
+REGISTRY_MAX_COINS = 50000
+REGISTRY_TTL = 24 * 60 * 60
+RELAY_QUEUE_SIZE = 10000  # frames waiting for one relay client before the oldest are dropped
+
+
+class RelayClient:
+    """One attached websocket client, its subscriptions and its outgoing queue."""
+
+    def __init__(self, websocket):
+        self.websocket = websocket
+        self.streams = set()
+        self.keys = set()
+        self.queue = asyncio.Queue(RELAY_QUEUE_SIZE)
+        self.dropped = 0
+
+    def offer(self, raw):
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(raw)
+
+    async def write(self):
+        while True:
+            await self.websocket.send(await self.queue.get())
+
+
+class IngestDaemon:
+    def __init__(self, uri=PUMPPORTAL_URI, alerts_path=None, status_path=None, relay_port=None,
+                 relay_host="127.0.0.1", record_dir=None, snapshot_dir=DEFAULT_SNAPSHOT_DIR,
+                 feed_filter=None, stats_interval=10.0, snapshot_interval=300.0, top_n=20):
+        self.supervisor = ConnectionSupervisor(self.handle_message, uri=uri)
+        self.snapshot = RegistrySnapshot(snapshot_dir, ttl=REGISTRY_TTL) if snapshot_dir else None
+        self.registry = CoinRegistry(max_coins=REGISTRY_MAX_COINS, ttl=REGISTRY_TTL, snapshot=self.snapshot)
+        self.tracker = TokenTracker(max_tokens=REGISTRY_MAX_COINS)
+        self.detector = StreamDetector()
+        self.recorder = FeedRecorder(record_dir) if record_dir else None
+        self.feed_filter = feed_filter or None
+
+        self.alerts_path = alerts_path
+        self.alerts_file = None
+        self.status_path = status_path
+        self.relay_host = relay_host
+        self.relay_port = relay_port
+        self.relay = None
+        self.clients = set()
+        self.stats_interval = stats_interval
+        self.snapshot_interval = snapshot_interval
+        self.top_n = top_n
+
+        self.received = 0
+        self.decode_errors = 0
+        self.filtered = 0
+        self.alerts = 0
+        self.started_at = None
+        self.stopping = asyncio.Event()
+
+        # Mints the daemon watches for itself, on top of what relay clients ask for
+        self.own_keys = set()
+        if self.snapshot is not None:
+            self.own_keys.update(self.snapshot.subscriptions())
+            self.supervisor.token_keys.update(self.own_keys)
+
+    def handle_message(self, raw):
+        self.received += 1
+        if self.recorder is not None:
+            self.recorder.record(raw)
+        try:
+            data = loads(raw)
+        except ValueError:
+            self.decode_errors += 1
+            return
+        event = event_from_dict(data)
+        if event is None:
+            return
+        if self.clients:
+            self.relay_frame(raw, data)
+        if self.feed_filter is not None and not self.feed_filter(event):
+            self.filtered += 1
+            return
+
+        event_type = type(event)
+        if event_type is TradeEvent or event_type is MigrationEvent:
+            token = self.tracker.apply(event)
+            for anomaly in self.detector.update(event):
+                self.write_alert(anomaly, token)
+        elif event_type is CreateEvent:
+            self.registry.add(event)
+            self.tracker.create(event)
+
+    def relay_frame(self, raw, data):
+        stream = STREAMS.get(data.get("txType"))
+        mint = data.get("mint")
+        for client in self.clients:
+            if stream is None or wants(stream, mint, client.streams, client.keys):
+                client.offer(raw)
+
+    def write_alert(self, anomaly, token):
+        self.alerts += 1
+        record = {
+            "at": anomaly.at,
+            "kind": anomaly.kind,
+            "mint": anomaly.mint,
+            "symbol": token.symbol if token is not None else "",
+            "score": round(anomaly.score, 3),
+            "value": anomaly.value,
+            "market_cap_sol": token.market_cap_sol if token is not None else None,
+        }
+        if self.alerts_file is not None:
+            self.alerts_file.write(json.dumps(record) + "\n")
+        else:
+            print(f"Alert: {record}")
+
+    # --- Relay ---
+
+    async def handle_relay_client(self, websocket):
+        client = RelayClient(websocket)
+        self.clients.add(client)
+        writer = asyncio.ensure_future(client.write())
+        try:
+            async for message in websocket:
+                method = apply_control(message, client.streams, client.keys)
+                if method is None:
+                    continue
+                if method.endswith("TokenTrade"):
+                    await self.sync_relay_keys()
+                client.offer(json.dumps({"message": f"Successfully handled {method}."}))
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            self.clients.discard(client)
+            writer.cancel()
+            # As with the supervisor's pinger, wait() leaves a cancel of this handler to propagate
+            await asyncio.wait([writer])
+            error = None if writer.cancelled() else writer.exception()
+            if error is not None and not isinstance(error, websockets.ConnectionClosed):
+                print(f"Relay client writer failed: {error!r}")
+            await self.sync_relay_keys()
+
+    async def sync_relay_keys(self):
+        # Upstream trades are the daemon's own mints plus the union of what the attached clients want
+        keys = set(self.own_keys)
+        for client in self.clients:
+            keys.update(client.keys)
+        await self.supervisor.set_tokens(keys)
+
+    # --- Lifecycle ---
+
+    def stats(self):
+        stats = self.supervisor.stats()
+        stats.update({
+            "uptime_s": round(time.monotonic() - self.started_at, 1) if self.started_at else 0.0,
+            "received": self.received,
+            "decode_errors": self.decode_errors,
+            "filtered": self.filtered,
+            "alerts": self.alerts,
+            "coins": len(self.registry),
+            "relay_clients": len(self.clients),
+        })
+        stats.update(self.tracker.stats())
+        if self.recorder is not None:
+            stats.update(self.recorder.stats())
+        return stats
+
+    def write_status(self):
+        if not self.status_path:
+            return
+        status = self.stats()
+        status["top"] = [
+            {"mint": t.mint, "symbol": t.symbol, "market_cap_sol": t.market_cap_sol,
+             "progress": round(t.progress, 4), "buys": t.buys, "sells": t.sells,
+             "traders": t.unique_traders}
+            for t in self.tracker.top(self.top_n)
+        ]
+        tmp_path = f"{self.status_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(status, f, indent=2)
+        os.replace(tmp_path, self.status_path)
+
+    def save_snapshot(self):
+        if self.snapshot is None:
+            return
+        try:
+            self.snapshot.save(self.registry, set(self.supervisor.token_keys), max_coins=REGISTRY_MAX_COINS)
+        except OSError as e:
+            print(f"Error saving registry snapshot: {e}")
+
+    async def start(self):
+        self.started_at = time.monotonic()
+        if self.alerts_path:
+            self.alerts_file = open(self.alerts_path, "a", encoding="utf-8", buffering=1)
+        if self.recorder is not None:
+            self.recorder.start()
+        if self.relay_port is not None:
+            self.relay = await websockets.serve(self.handle_relay_client, self.relay_host, self.relay_port)
+            self.relay_port = self.relay.sockets[0].getsockname()[1]
+            print(f"Relay on ws://{self.relay_host}:{self.relay_port}")
+        self.supervisor.start()
+
+    async def stop(self):
+        await self.supervisor.stop()
+        if self.relay is not None:
+            self.relay.close()
+            await self.relay.wait_closed()
+            self.relay = None
+        if self.recorder is not None:
+            self.recorder.stop()
+        self.save_snapshot()
+        self.write_status()
+        if self.alerts_file is not None:
+            self.alerts_file.close()
+            self.alerts_file = None
+
+    async def run(self):
+        await self.start()
+        last_snapshot = time.monotonic()
+        try:
+            while not self.stopping.is_set():
+                try:
+                    await asyncio.wait_for(self.stopping.wait(), self.stats_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self.write_status()
+                if time.monotonic() - last_snapshot >= self.snapshot_interval:
+                    self.save_snapshot()
+                    last_snapshot = time.monotonic()
+        finally:
+            await self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the pump.fun ingest pipeline without a GUI.")
+    parser.add_argument("--uri", default=os.environ.get("PUMP_FEED_URI", PUMPPORTAL_URI))
+    parser.add_argument("--alerts", help="Append alerts to this JSONL file (default: print them)")
+    parser.add_argument("--status", help="Rewrite this JSON file with stats and top tokens every interval")
+    parser.add_argument("--relay-port", type=int, help="Serve a local pumpportal-compatible websocket")
+    parser.add_argument("--relay-host", default="127.0.0.1")
+    parser.add_argument("--record", help="Record the raw feed to this folder")
+    parser.add_argument("--filters", help="JSON list of feed filter rules")
+    parser.add_argument("--snapshot-dir", default=DEFAULT_SNAPSHOT_DIR)
+    parser.add_argument("--interval", type=float, default=10.0, help="Seconds between status updates")
+    args = parser.parse_args()
+
+    daemon = IngestDaemon(
+        uri=args.uri, alerts_path=args.alerts, status_path=args.status, relay_port=args.relay_port,
+        relay_host=args.relay_host, record_dir=args.record, snapshot_dir=args.snapshot_dir,
+        feed_filter=load_rules(args.filters) if args.filters else FeedFilter(),
+        stats_interval=args.interval,
+    )
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, daemon.stopping.set)
+            except (NotImplementedError, AttributeError, ValueError):
+                pass  # Windows: Ctrl+C arrives as KeyboardInterrupt instead
+        await daemon.run()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
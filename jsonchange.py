@@ -1,10 +1,14 @@
+import os
 import sys
-import json
+from functools import partial
 from PyQt5.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QLabel, QPushButton, QFileDialog, QScrollArea, QFrame
+    QApplication, QWidget, QVBoxLayout, QLabel, QPushButton, QFileDialog, QProgressBar
 )
-from PyQt5.QtCore import Qt, QDate, QDateTime
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import QThreadPool
+
+from telegram_loader import channel_name
+from telegram_model import TelegramMessageModel, make_message_table, message_rows
+from telegram_worker import TelegramLoadWorker
 
 
 class MessageProcessor(QWidget):
@@ -19,102 +23,72 @@ class MessageProcessor(QWidget):
         self.load_button.clicked.connect(self.load_and_process_file)
         self.layout.addWidget(self.load_button)
 
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_content = QVBoxLayout()
-        container = QWidget()
-        container.setLayout(self.scroll_content)
-        self.scroll_area.setWidget(container)
-        self.layout.addWidget(self.scroll_area)
+        self.load_progress = QProgressBar()
+        self.load_progress.setRange(0, 0)
+        self.load_progress.setTextVisible(False)
+        self.load_progress.hide()
+        self.layout.addWidget(self.load_progress)
+        self.status_label = QLabel()
+        self.layout.addWidget(self.status_label)
+        self.load_worker = None
+
+        self.model = TelegramMessageModel(parent=self)
+        self.table = make_message_table(self.model)
+        self.layout.addWidget(self.table)
 
     def parse_message_data(self, msg):
         """Parses a single message to extract date, coin, symbol, cap, and age."""
-        if "date" in msg and "message" in msg:
-            date_str = msg["date"]
-            message_text = msg["message"]
-            coin = "N/A"
-            symbol = "N/A"
-            cap = "N/A"
-            age = "N/A"
-
-            if message_text:
-                lines = message_text.split('\n')
-                for line in lines:
-                    if "🔔" in line:
-                        parts = line.split("|")
-                        if len(parts) > 1:
-                            coin_symbol = parts[0].replace("🔔", "").strip()
-                            symbol_match = coin_symbol.split()
-                            if symbol_match:
-                                coin = symbol_match[0].strip()
-                                if len(symbol_match) > 1:
-                                    symbol = symbol_match[-1].strip()
-                                else:
-                                    symbol = coin
-                    if "Marketcap:" in line:
-                        cap = line.split(":")[-1].strip()
-                    if "Age:" in line:
-                        age = line.split(":")[-1].strip()
-
-            try:
-                datetime_obj = QDateTime.fromString(date_str, Qt.ISODate)
-                if not datetime_obj.isValid():
-                    datetime_obj = QDateTime.fromString(date_str, "yyyy-MM-dd hh:mm:ss")
-                if datetime_obj.isValid():
-                    return datetime_obj, coin, symbol, cap, age
-                else:
-                    print(f"Warning: Could not parse date: {date_str}")
-                    return None
-            except Exception as e:
-                print(f"Error parsing date '{date_str}': {e}")
-                return None
-        return None
+        rows = message_rows([msg])
+        return rows[0][:5] if rows else None
 
     def load_and_process_file(self):
         filename, _ = QFileDialog.getOpenFileName(self, "Open JSON", "", "JSON Files (*.json)")
         if filename:
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            messages = data if isinstance(data, list) else data.get("messages", [])
-            processed_messages = []
-
-            for msg in messages:
-                print(msg)
-                print("===" * 20)
-                parsed_data = self.parse_message_data(msg)
-                if parsed_data:
-                    processed_messages.append(parsed_data)
-
-            # Sort messages by date
-            processed_messages.sort(key=lambda item: item[0], reverse = True)
-
-            # Clear old content
-            while self.scroll_content.count():
-                child = self.scroll_content.takeAt(0)
-                if child.widget():
-                    child.widget().deleteLater()
-
-            # Display processed messages
-            font = QFont()
-            font.setPointSize(10)
-            for date_obj, coin, symbol, cap, age in processed_messages:
-                date_str_readable = date_obj.toString("yyyy-MM-dd hh:mm:ss")
-                output_text = f"<b>Date:</b> {date_str_readable}<br>"
-                output_text += f"<b>Coin:</b> {coin}, <b>Symbol:</b> {symbol}, <b>Cap:</b> {cap}, <b>Age:</b> {age}<br><br>"
-
-                label = QLabel(output_text)
-                label.setFont(font)
-                label.setWordWrap(True)
-                self.scroll_content.addWidget(label)
-
-            # **Crucial Step: Create a container widget and set its layout, then set it as the scroll area's widget**
-            container = QWidget()
-            container.setLayout(self.scroll_content)
-            self.scroll_area.setWidget(container)
-
-            # Optional: Ensure scroll to top after loading new data
-            self.scroll_area.verticalScrollBar().setValue(0)
+            self.load_file(filename)
+
+    def load_file(self, filename):
+        """Streams the dump on the thread pool into the table, chunk by chunk."""
+        self.cancel_load()
+        self.model.clear()
+        worker = TelegramLoadWorker(filename, partial(message_rows, channel=channel_name(filename)))
+        worker.signals.chunk.connect(self.add_message_chunk)
+        worker.signals.finished.connect(self.finish_load)
+        worker.signals.failed.connect(self.finish_load)
+        self.load_worker = worker
+        self.status_label.setText(f"Loading {os.path.basename(filename)}...")
+        self.load_progress.show()
+        QThreadPool.globalInstance().start(worker)
+
+    def is_current(self):
+        # Chunks already queued by a cancelled worker still arrive; they are dropped here
+        return self.load_worker is not None and self.sender() is self.load_worker.signals
+
+    def add_message_chunk(self, rows, read):
+        if not self.is_current():
+            return
+        self.model.add_rows(rows)
+        self.status_label.setText(f"{len(self.model.rows)} alerts from {read} messages...")
+
+    def finish_load(self, result):
+        if not self.is_current():
+            return
+        self.load_worker = None
+        self.load_progress.hide()
+        if isinstance(result, str):
+            self.status_label.setText(result)
+        else:
+            self.status_label.setText(f"{len(self.model.rows)} alerts from {result} messages")
+
+    def cancel_load(self):
+        if self.load_worker is not None:
+            self.load_worker.cancel()
+            self.load_worker = None
+        self.load_progress.hide()
+
+    def closeEvent(self, event):
+        self.cancel_load()
+        event.accept()
+
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
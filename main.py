@@ -1,27 +1,61 @@
 import sys
-import json
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QPushButton, QTextEdit, QComboBox, QFileDialog, QScrollArea, QFrame, QMainWindow, QMessageBox
+    QPushButton, QTextEdit, QComboBox, QFileDialog, QFrame, QMainWindow, QMessageBox,
+    QProgressBar, QSlider, QListView
 )
-from PyQt5.QtCore import Qt, QDate, QDateTime, QTimer
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, QDate, QThreadPool, QTimer
 
 import asyncio
-import websockets
-import ssl
-import certifi
 import platform
 import os
-import pandas as pd
-import traceback
+import time
+from functools import partial
 from datetime import datetime
 
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+import matplotlib.dates as mdates
+from matplotlib.ticker import FuncFormatter
+import numpy as np
 
 from qasync import QEventLoop
 
+from coin_loader import CoinLoader
+from feed_model import FeedModel
+from coin_registry import CoinRegistry
+from registry_snapshot import RegistrySnapshot
+from feed_recorder import FeedRecorder
+from feed_worker import FeedWorker
+from feed_filters import FeedFilter, load_rules
+from connection_supervisor import PUMPPORTAL_URI
+from pump_events import CreateEvent, MigrationEvent, StatusEvent, TradeEvent
+from token_tracker import TokenTracker
+from stream_detector import StreamDetector
+from trade_buffer import TradeBuffers
+from downsample import DOWNSAMPLERS, thin_points, visible_range
+from pump_detection import DetectionCache, detect_coin_events
+from telegram_loader import channel_name
+from telegram_model import TelegramMessageModel, make_message_table, message_rows
+from telegram_worker import TelegramLoadWorker
+
+FEED_RETENTION = 2000  # rows kept in the real-time feed
+FEED_FLUSH_HZ = 20
+FEED_QUEUE_SIZE = 10000  # decoded messages waiting for the UI before the oldest are dropped
+FEED_MAX_BATCH = 2000  # messages handled per flush
+FEED_URI = os.environ.get("PUMP_FEED_URI", PUMPPORTAL_URI)  # e.g. a local replay_server.py
+FEED_RECORD_DIR = os.environ.get("PUMP_FEED_RECORD_DIR")  # set to keep the raw feed on disk
+FEED_FILTERS_PATH = os.environ.get("PUMP_FEED_FILTERS", "feed_filters.json")  # JSON list of filter rules
+LIVE_PLOT_FPS = 10
+LIVE_PLOT_POINTS = 2000  # most recent trades drawn on the live chart
+TRADE_RING_CAPACITY = 4096  # trades kept per mint
+REGISTRY_MAX_COINS = 50000  # created coins remembered for search
+REGISTRY_TTL = 24 * 60 * 60  # seconds a coin is kept without being seen or searched
+REGISTRY_SNAPSHOT_INTERVAL = 5 * 60  # seconds between registry snapshots
+TELEGRAM_CHANNEL_FILE = os.environ.get(
+    "PUMP_TELEGRAM_FILE", "telegram-scraper/TheDegenBoysLounge/TheDegenBoysLounge.json")
+TELEGRAM_MESSAGE_LIMIT = 5000  # newest channel messages kept in the panel
+
 # Windows compatibility
 if platform.system() == "Windows":
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
@@ -87,63 +121,200 @@ class LoginWindow(QWidget):
 
 
 class PlotCanvas(FigureCanvas):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, downsample_mode='minmax'):
         self.figure = Figure(figsize=(8, 4))
         self.ax = self.figure.add_subplot(111)
         super().__init__(self.figure)
         self.setParent(parent)
 
-    def plot(self, df, coin_name, threshold_multiplier=0.5):
-        self.ax.clear()
-        self.ax.plot(df['Close'], label=f'{coin_name} Close Price')
-
-        # Calculate price changes
-        df['Price_Change'] = df['Close'].diff()
-        # Compute mean and standard deviation of price changes
-        mean_change = df['Price_Change'].mean()
-        std_change = df['Price_Change'].std()
-
-        # Define thresholds
-        pump_threshold = mean_change + (threshold_multiplier * std_change)
-        dump_threshold = mean_change - (threshold_multiplier * std_change)
-
-        # Identify pumps and dumps
-        pumps = df[df['Price_Change'] > pump_threshold]
-        dumps = df[df['Price_Change'] < dump_threshold]
+        # Artists are created once and updated in place on every redraw
+        self.ax.xaxis_date()
+        self.price_line, = self.ax.plot([], [], label='Close Price')
+        self.pump_markers = self.ax.scatter([], [], color='green', marker='^', s=100, label='Pump (Price Spike)')
+        self.dump_markers = self.ax.scatter([], [], color='red', marker='v', s=100, label='Dump (Price Drop)')
+        self.ax.set_xlabel('Date')
+        self.ax.set_ylabel('Price')
+        self.ax.grid(True)
 
-        # Plot markers
-        self.ax.scatter(pumps.index, pumps['Close'], color='red', marker='v', s=100, label='Dump (Price Drop)')
-        self.ax.scatter(dumps.index, dumps['Close'], color='green', marker='^', s=100, label='Pump (Price Spike)')
+        # The full series stays here; the line only ever holds about one point per pixel
+        self.downsample_mode = downsample_mode
+        self.x_values = np.empty(0)
+        self.y_values = np.empty(0)
+        self.marker_points = {}
+        self.ax.callbacks.connect('xlim_changed', self.on_xlim_changed)
+
+        # Markers are blitted over a cached background so threshold changes skip a full redraw
+        self.background = None
+        self.pump_markers.set_animated(True)
+        self.dump_markers.set_animated(True)
+        self.mpl_connect('draw_event', self.on_draw)
+
+    def plot(self, df, coin_name, threshold_multiplier=0.5, events=None):
+        if events is None:
+            events = detect_coin_events(df, threshold_multiplier=threshold_multiplier)
+
+        closes = df['Close'].sort_index()
+        self.x_values = mdates.date2num(closes.index)
+        self.y_values = closes.to_numpy(dtype='float64')
+        self.price_line.set_label(f'{coin_name} Close Price')
+        self.set_markers(events)
 
         self.ax.set_title(f'{coin_name} Closing Price with Significant Pumps & Dumps')
-        self.ax.set_xlabel('Date')
-        self.ax.set_ylabel('Price')
-        self.ax.legend()
+        self.refresh_line(0, len(self.x_values))
+        self.ax.relim()
+        self.ax.autoscale_view()
+        self.refresh_view()
+        # A fixed corner; 'best' would test every plotted point on each draw
+        self.ax.legend(loc='upper left')
+        self.draw_idle()
+
+    def refresh_line(self, start, stop):
+        x = self.x_values[start:stop]
+        y = self.y_values[start:stop]
+        downsample = DOWNSAMPLERS.get(self.downsample_mode)
+        if downsample is not None:
+            x, y = downsample(x, y, max(int(self.ax.bbox.width), 1))
+        self.price_line.set_data(x, y)
+
+    def refresh_view(self):
+        # Zooming or panning re-samples only the visible part of the series
+        x_min, x_max = self.ax.get_xlim()
+        if len(self.x_values):
+            self.refresh_line(*visible_range(self.x_values, x_min, x_max))
+        self.refresh_markers(x_min, x_max)
+
+    def refresh_markers(self, x_min, x_max):
+        n_slots = max(int(self.ax.bbox.width), 1)
+        for artist, (x, y, weight) in self.marker_points.items():
+            keep = thin_points(x, weight, x_min, x_max, n_slots)
+            artist.set_offsets(np.column_stack([x[keep], y[keep]]))
+
+    def on_xlim_changed(self, ax):
+        self.refresh_view()
+
+    def on_draw(self, event):
+        self.background = self.copy_from_bbox(self.figure.bbox)
+        self.draw_markers()
+
+    def draw_markers(self):
+        self.ax.draw_artist(self.pump_markers)
+        self.ax.draw_artist(self.dump_markers)
+
+    def set_markers(self, events):
+        pumps = events[events['kind'] == 'pump']
+        dumps = events[events['kind'] == 'dump']
+        self.marker_points = {
+            self.pump_markers: self._marker_points(pumps),
+            self.dump_markers: self._marker_points(dumps),
+        }
+        self.refresh_markers(*self.ax.get_xlim())
+
+    def update_markers(self, events):
+        """Moves the pump/dump markers without touching the price line or axes."""
+        self.set_markers(events)
+        if self.background is None:
+            self.draw_idle()
+            return
+        self.restore_region(self.background)
+        self.draw_markers()
+        self.blit(self.figure.bbox)
+
+    @staticmethod
+    def _marker_points(events):
+        x = mdates.date2num(events.index) if len(events) else np.empty(0)
+        y = events['Close'].to_numpy(dtype='float64')
+        weight = events['zscore'].abs().to_numpy(dtype='float64')
+        return x, y, weight
+
+
+class LivePlotCanvas(FigureCanvas):
+    """Price of one mint from its trade ring, redrawn at a fixed frame rate.
+
+    The line is fed views of the ring, and a frame is only drawn when the ring has
+    taken new trades since the last one.
+    """
+
+    def __init__(self, parent=None, fps=LIVE_PLOT_FPS, points=LIVE_PLOT_POINTS):
+        self.figure = Figure(figsize=(8, 2.5))
+        self.ax = self.figure.add_subplot(111)
+        super().__init__(self.figure)
+        self.setParent(parent)
+
+        self.points = points
+        self.price_line, = self.ax.plot([], [], color='tab:blue', linewidth=1)
+        self.ax.xaxis.set_major_formatter(FuncFormatter(lambda x, _: datetime.fromtimestamp(x).strftime('%H:%M:%S')))
+        self.ax.set_ylabel('Price (SOL)')
         self.ax.grid(True)
-        self.draw()
+
+        self.ring = None
+        self.drawn_version = None
+        self.frame_timer = QTimer()
+        self.frame_timer.timeout.connect(self.refresh)
+        self.frame_timer.start(1000 // fps)
+
+    def set_ring(self, ring, title=""):
+        self.ring = ring
+        self.drawn_version = None
+        self.ax.set_title(title)
+        self.price_line.set_data([], [])
+        self.draw_idle()
+        self.refresh()
+
+    def refresh(self):
+        ring = self.ring
+        if ring is None or ring.version == self.drawn_version:
+            return
+        self.drawn_version = ring.version
+        trades = ring.latest(self.points)
+        if not len(trades):
+            return
+        self.price_line.set_data(trades['t'], trades['price'])
+        self.ax.relim()
+        self.ax.autoscale_view()
+        self.draw_idle()
 
 
 class WebSocketDisplay(QWidget):
-    def __init__(self):
+    def __init__(self, feed_uri=FEED_URI):
         super().__init__()
         self.setWindowTitle("Pump.fun Real-time + Historical Graphs")
         # Removed setGeometry here, will be managed by MainWindow
-        self.websocket = None
-        self.is_connected = False
-        self.connection_task = None
-        self.subscribed_tokens = set()
-        self.known_coins = {}
+        recorder = FeedRecorder(FEED_RECORD_DIR) if FEED_RECORD_DIR else None
+        # Filtered-out events are dropped on the feed thread: they are neither shown nor searchable
+        try:
+            feed_filter = load_rules(FEED_FILTERS_PATH)
+        except (OSError, ValueError) as e:
+            print(f"Error loading feed filters from {FEED_FILTERS_PATH}: {e}")
+            feed_filter = FeedFilter()
+        self.feed_worker = FeedWorker(feed_uri, queue_size=FEED_QUEUE_SIZE, recorder=recorder,
+                                      feed_filter=feed_filter)
+        # Coins and subscriptions from the last session are read from the snapshot on demand
+        self.registry_snapshot = RegistrySnapshot(ttl=REGISTRY_TTL)
+        self.coin_registry = CoinRegistry(max_coins=REGISTRY_MAX_COINS, ttl=REGISTRY_TTL,
+                                          snapshot=self.registry_snapshot)
+        self.feed_worker.supervisor.token_keys.update(self.registry_snapshot.subscriptions())
+        self.token_tracker = TokenTracker(max_tokens=REGISTRY_MAX_COINS)
+        self.stream_detector = StreamDetector()
+        self.trade_buffers = TradeBuffers(capacity=TRADE_RING_CAPACITY)
+        self.live_mint = None
         self.searched_symbol = None
 
         self.csv_data = {}
+        self.coin_loader = CoinLoader()
+        self.detection_cache = DetectionCache()
+        self.csv_load_task = None
 
         # --- LAYOUT SETUP ---
         self.layout = QVBoxLayout(self)
 
         # Top Section (Real-time Feed + Search)
+        self.connection_status_label = QLabel("Connecting...")
         self.realtime_label = QLabel("Real-time Feed:")
-        self.realtime_text_edit = QTextEdit()
-        self.realtime_text_edit.setReadOnly(True)
+        self.feed_model = FeedModel(retention=FEED_RETENTION, parent=self)
+        self.realtime_view = QListView()
+        self.realtime_view.setModel(self.feed_model)
+        self.realtime_view.setUniformItemSizes(True)
+        self.realtime_view.setEditTriggers(QListView.NoEditTriggers)
 
         self.search_layout = QHBoxLayout()
         self.search_label = QLabel("Search Symbol:")
@@ -158,281 +329,381 @@ class WebSocketDisplay(QWidget):
         self.search_results_text_edit = QTextEdit()
         self.search_results_text_edit.setReadOnly(True)
 
+        self.layout.addWidget(self.connection_status_label)
         self.layout.addWidget(self.realtime_label)
-        self.layout.addWidget(self.realtime_text_edit)
+        self.layout.addWidget(self.realtime_view)
         self.layout.addLayout(self.search_layout)
         self.layout.addWidget(self.search_results_text_edit)
 
+        self.live_plot_label = QLabel("Live Price:")
+        self.live_plot_canvas = LivePlotCanvas(self)
+        self.layout.addWidget(self.live_plot_label)
+        self.layout.addWidget(self.live_plot_canvas)
+
         # Bottom Section (Historical Data)
         self.plot_label = QLabel("Historical Data:")
         self.load_button = QPushButton("Load CSV Folder")
         self.load_button.clicked.connect(self.load_csv_folder)
 
+        self.load_progress = QProgressBar()
+        self.load_progress.setFormat("Loaded %v / %m")
+        self.cancel_load_button = QPushButton("Cancel")
+        self.cancel_load_button.clicked.connect(self.cancel_csv_load)
+        self.load_layout = QHBoxLayout()
+        self.load_layout.addWidget(self.load_progress)
+        self.load_layout.addWidget(self.cancel_load_button)
+        self.load_progress.hide()
+        self.cancel_load_button.hide()
+
         self.coin_selector = QComboBox()
         self.coin_selector.currentIndexChanged.connect(self.update_plot)
 
+        self.threshold_label = QLabel()
+        self.threshold_slider = QSlider(Qt.Horizontal)
+        self.threshold_slider.setRange(5, 300)  # hundredths of a standard deviation
+        self.threshold_slider.setValue(50)
+        self.threshold_slider.valueChanged.connect(self.update_threshold)
+        self.threshold_layout = QHBoxLayout()
+        self.threshold_layout.addWidget(self.threshold_label)
+        self.threshold_layout.addWidget(self.threshold_slider)
+        self.update_threshold_label()
+
         self.plot_canvas = PlotCanvas(self)
 
         self.layout.addWidget(self.plot_label)
         self.layout.addWidget(self.load_button)
+        self.layout.addLayout(self.load_layout)
         self.layout.addWidget(self.coin_selector)
+        self.layout.addLayout(self.threshold_layout)
         self.layout.addWidget(self.plot_canvas)
 
         # Start WebSocket
         self.connect_websocket()
 
-        # Timer for reconnection
+        # Feed rows are coalesced and shown at a fixed rate, however fast they arrive
+        self.feed_timer = QTimer()
+        self.feed_timer.timeout.connect(self.flush_feed)
+        self.feed_timer.start(1000 // FEED_FLUSH_HZ)
+
+        # Timer for connection stats; reconnecting is up to the supervisor
         self.timer = QTimer()
-        self.timer.timeout.connect(self.check_connection)
+        self.timer.timeout.connect(self.update_connection_status)
         self.timer.start(5000)
 
+        self.snapshot_timer = QTimer()
+        self.snapshot_timer.timeout.connect(self.save_snapshot)
+        self.snapshot_timer.start(REGISTRY_SNAPSHOT_INTERVAL * 1000)
+
+    def save_snapshot(self):
+        # set() copies the keys in one step while the feed thread may be changing them
+        token_keys = set(self.feed_worker.supervisor.token_keys)
+        try:
+            self.registry_snapshot.save(self.coin_registry, token_keys, max_coins=REGISTRY_MAX_COINS)
+        except OSError as e:
+            print(f"Error saving registry snapshot: {e}")
+
+    def shutdown(self):
+        self.snapshot_timer.stop()
+        self.feed_worker.stop()
+        self.save_snapshot()
+
     # WebSocket logic...
 
     def connect_websocket(self):
-        self.connection_task = asyncio.create_task(self.connect_websocket_async())
-
-    async def connect_websocket_async(self):
-        uri = "wss://pumpportal.fun/api/data"
-        ssl_context = ssl.create_default_context(cafile=certifi.where())
-
-        while True:
-            try:
-                self.websocket = await websockets.connect(uri, ssl=ssl_context)
-                self.is_connected = True
-                await self.subscribe_initial()
-                async for message in self.websocket:
-                    try:
-                        message_data = json.loads(message)
-                        self.process_realtime_message(message_data)
-                    except json.JSONDecodeError:
-                        self.realtime_text_edit.append(f"Error decoding JSON: {message}")
-            except Exception:
-                traceback.print_exc()
-            finally:
-                self.is_connected = False
-                await asyncio.sleep(5)
-
-    async def subscribe_initial(self):
-        if self.websocket:
-            payloads = [
-                {"method": "subscribeNewToken"},
-                {"method": "subscribeMigration"}
-            ]
-            for p in payloads:
-                await self.websocket.send(json.dumps(p))
-
-    async def subscribe_token_trade(self, symbol):
-        if self.websocket and symbol not in self.subscribed_tokens:
-            payload = {"method": "subscribeTokenTrade", "keys": [symbol]}
-            await self.websocket.send(json.dumps(payload))
-            self.subscribed_tokens.add(symbol)
-
-    async def unsubscribe_token_trade(self, symbol):
-        if self.websocket and symbol in self.subscribed_tokens:
-            payload = {"method": "unsubscribeTokenTrade", "keys": [symbol]}
-            await self.websocket.send(json.dumps(payload))
-            self.subscribed_tokens.discard(symbol)
-
-    def process_realtime_message(self, data):
-        if "txType" in data and data["txType"] == "create":
-            mint = data.get("mint")
-            if mint and mint not in self.known_coins:
-                self.known_coins[mint] = data
-
-        if all(k in data for k in ["name", "symbol", "solAmount", "marketCapSol", "signature"]):
-            name = data["name"]
-            symbol = data["symbol"]
-            sol_amount = data["solAmount"]
-            market_cap_sol = data["marketCapSol"]
-            sig = data["signature"]
-
-            formatted = f"Name: {name}\nSymbol: {symbol}\nSOL: {sol_amount:.2f}\nCap: {market_cap_sol:.2f}\nSig: {sig}\n"
-            self.realtime_text_edit.append(formatted)
-
-            if self.searched_symbol and symbol.upper() == self.searched_symbol:
-                self.display_search_results(data)
-
-    def display_search_results(self, data):
+        if not self.feed_worker.is_alive():
+            self.feed_worker.start()
+
+    def flush_feed(self):
+        # Decoded messages arrive from the feed thread; a bounded batch per tick keeps the UI responsive
+        for received_at, message_data in self.feed_worker.drain(FEED_MAX_BATCH):
+            if isinstance(message_data, str):
+                self.feed_model.append(message_data)
+            else:
+                self.process_realtime_message(message_data)
+
+        # Follow the newest rows only if the user has not scrolled up
+        scroll_bar = self.realtime_view.verticalScrollBar()
+        at_bottom = scroll_bar.value() >= scroll_bar.maximum() - 1
+        if self.feed_model.flush() and at_bottom:
+            self.realtime_view.scrollToBottom()
+
+    # Subscriptions change on the feed thread's loop; the supervisor batches and diffs them
+
+    async def subscribe_token_trade(self, mints):
+        supervisor = self.feed_worker.supervisor
+        await asyncio.wrap_future(self.feed_worker.submit(supervisor.subscribe_tokens(mints)))
+
+    async def unsubscribe_token_trade(self, mints):
+        supervisor = self.feed_worker.supervisor
+        await asyncio.wrap_future(self.feed_worker.submit(supervisor.unsubscribe_tokens(mints)))
+
+    async def set_token_trade(self, mints):
+        supervisor = self.feed_worker.supervisor
+        await asyncio.wrap_future(self.feed_worker.submit(supervisor.set_tokens(mints)))
+
+    def process_realtime_message(self, event):
+        # Events arrive typed from the feed thread, so this is a single dispatch on the class
+        event_type = type(event)
+        if event_type is TradeEvent or event_type is MigrationEvent:
+            token = self.token_tracker.apply(event)
+            if event_type is TradeEvent:
+                ring = self.trade_buffers.append(event, time.time())
+                if event.mint == self.live_mint and ring is not None and self.live_plot_canvas.ring is not ring:
+                    self.live_plot_canvas.set_ring(ring, self.live_plot_label.text())
+            for anomaly in self.stream_detector.update(event):
+                self.feed_model.append(self.format_anomaly(anomaly, token))
+        elif event_type is CreateEvent:
+            self.coin_registry.add(event)
+            self.token_tracker.create(event)
+
+            self.feed_model.append((event.name, event.symbol, event.sol_amount, event.market_cap_sol, event.signature))
+
+            if self.searched_symbol and event.symbol.upper() == self.searched_symbol:
+                self.display_search_results(event)
+                self.show_live_mint(event)
+                # A new coin with the searched symbol joins the watched mints
+                self.feed_worker.submit(self.feed_worker.supervisor.subscribe_tokens([event.mint]))
+        elif event_type is StatusEvent:
+            self.feed_model.append(f"Status: {event.message}")
+
+    def display_search_results(self, event):
         self.search_results_text_edit.clear()
-        if data and "signature" in data and "name" in data and "symbol" in data and "solAmount" in data and "marketCapSol" in data:
-            name = data.get("name", "N/A")
-            symbol = data.get("symbol", "N/A")
-            sol_amount = data.get("solAmount", "N/A")
-            market_cap_sol = data.get("marketCapSol", "N/A")
-            signature = data.get("signature", "N/A")
-
-            results_text = f"--- Search Results for {symbol.upper()} ---\n"
-            results_text += f"Name: {name}\n"
-            results_text += f"Symbol: {symbol}\n"
-            results_text += f"SOL Amount: {sol_amount:.2f}\n"
-            results_text += f"Market Cap (SOL): {market_cap_sol:.2f}\n"
-            results_text += f"Signature: {signature}\n\n"
+        if event is not None:
+            results_text = f"--- Search Results for {event.symbol.upper()} ---\n"
+            results_text += self.format_coin(event)
             self.search_results_text_edit.append(results_text)
         else:
             self.search_results_text_edit.append(f"No information found for symbol: {self.search_input.text().upper()}\n")
 
+    @staticmethod
+    def format_coin(event):
+        results_text = f"Name: {event.name}\n"
+        results_text += f"Symbol: {event.symbol}\n"
+        results_text += f"SOL Amount: {event.sol_amount:.2f}\n"
+        results_text += f"Market Cap (SOL): {event.market_cap_sol:.2f}\n"
+        results_text += f"Signature: {event.signature}\n\n"
+        return results_text
+
+    @staticmethod
+    def format_anomaly(anomaly, token):
+        name = f"{token.name} ({token.symbol})" if token is not None and token.symbol else anomaly.mint
+        return f"Alert: {anomaly.kind.replace('_', ' ')} on {name}  score {anomaly.score:.1f}"
+
+    @staticmethod
+    def format_token_state(token):
+        results_text = f"State: {token.state} | Price: {token.price:.10f} SOL | Curve: {token.progress:.1%}\n"
+        results_text += f"Buys: {token.buys} ({token.buy_volume:.2f} SOL) | Sells: {token.sells} ({token.sell_volume:.2f} SOL)"
+        results_text += f" | Traders: {token.unique_traders}\n\n"
+        return results_text
+
     async def search_token_data(self, symbol):
         symbol = symbol.upper()
-        found_coins = [info for mint, info in self.known_coins.items() if info.get("symbol") == symbol]
+        found_coins = self.coin_registry.find_symbol(symbol)
 
         self.search_results_text_edit.clear()
         if found_coins:
             self.search_results_text_edit.append(f"--- Found {len(found_coins)} previously seen coins with symbol {symbol} ---\n")
             for coin in found_coins:
-                results_text = f"Name: {coin.get('name', 'N/A')}\n"
-                results_text += f"Symbol: {coin.get('symbol', 'N/A')}\n"
-                results_text += f"SOL Amount: {coin.get('solAmount', 'N/A'):.2f}\n"
-                results_text += f"Market Cap (SOL): {coin.get('marketCapSol', 'N/A'):.2f}\n"
-                results_text += f"Signature: {coin.get('signature', 'N/A')}\n\n"
-                self.search_results_text_edit.append(results_text)
+                self.search_results_text_edit.append(self.format_coin(coin))
+                token = self.token_tracker.get(coin.mint)
+                if token is not None:
+                    self.search_results_text_edit.append(self.format_token_state(token))
         else:
             self.search_results_text_edit.append(f"No previously seen coins found with symbol: {symbol}\n")
+            similar = self.similar_symbols(symbol)
+            if similar:
+                self.search_results_text_edit.append(f"Similar symbols: {', '.join(similar)}\n")
 
-        await self.unsubscribe_token_trade(symbol)
-        await self.subscribe_token_trade(symbol)
-        if not found_coins:
+        # Trades are subscribed by mint; mints from the previous search are dropped
+        await self.set_token_trade([coin.mint for coin in found_coins])
+        if found_coins:
+            self.show_live_mint(found_coins[-1])
+        else:
             self.search_results_text_edit.append("Waiting for real-time updates for this symbol...\n")
         self.searched_symbol = symbol
 
+    def show_live_mint(self, coin):
+        # The chart switches to the mint's ring as soon as it has one, i.e. on its first trade
+        self.live_mint = coin.mint
+        self.live_plot_label.setText(f"Live Price: {coin.name} ({coin.symbol})")
+        self.live_plot_canvas.set_ring(self.trade_buffers.get(coin.mint), self.live_plot_label.text())
+
+    def similar_symbols(self, symbol, limit=5):
+        symbols = [coin.symbol.upper() for coin in self.coin_registry.find_prefix(symbol, limit)]
+        for suggestion in self.coin_registry.suggest_symbols(symbol, limit):
+            if suggestion not in symbols:
+                symbols.append(suggestion)
+        return symbols[:limit]
+
     def handle_search(self):
         symbol = self.search_input.text().strip()
         if symbol:
             asyncio.create_task(self.search_token_data(symbol))
 
-    def check_connection(self):
-        if not self.websocket or self.websocket.close:
-            self.connect_websocket()
+    def update_connection_status(self):
+        stats = self.feed_worker.stats()
+        state = "Connected" if stats["connected"] else "Reconnecting..."
+        ping = "n/a" if stats["ping_rtt_ms"] is None else f"{stats['ping_rtt_ms']:.0f} ms"
+        lag = "n/a" if stats["lag_ms"] is None else f"{stats['lag_ms']:.0f} ms"
+        self.connection_status_label.setText(
+            f"{state} | sessions open: {stats['open_connections']} | "
+            f"reconnects: {stats['reconnects']} | ping: {ping} | "
+            f"queue: {stats['queue_depth']} (dropped {stats['dropped']}) | lag: {lag}"
+        )
+        if "filtered" in stats:
+            self.connection_status_label.setText(
+                f"{self.connection_status_label.text()} | filtered: {stats['filtered']}"
+            )
+        if "recorded" in stats:
+            self.connection_status_label.setText(
+                f"{self.connection_status_label.text()} | recorded: {stats['recorded']}"
+            )
 
     def load_csv_folder(self):
         folder = QFileDialog.getExistingDirectory(self, "Select Folder with CSVs")
         if folder:
-            self.csv_data = self.load_and_merge_data(folder)
+            self.cancel_csv_load()
+            self.csv_data = {}
+            self.detection_cache.clear()
             self.coin_selector.clear()
-            self.coin_selector.addItems(self.csv_data.keys())
-
-    def load_and_merge_data(self, folder_path):
-        all_data = {}
-        for filename in os.listdir(folder_path):
-            if filename.endswith(".csv"):
-                try:
-                    df = pd.read_csv(os.path.join(folder_path, filename))
-                    df['Date'] = pd.to_datetime(df['Date'], format='%d-%m-%Y')
-                    df.set_index('Date', inplace=True)
-                    df.drop(columns=['Adj Close'], errors='ignore', inplace=True)
-                    coin_name = os.path.splitext(filename)[0]
-                    all_data[coin_name] = df
-                except Exception as e:
-                    print(f"Error loading {filename}: {e}")
-        return all_data
+            self.csv_load_task = asyncio.create_task(self.load_csv_folder_async(folder))
+
+    async def load_csv_folder_async(self, folder):
+        self.load_progress.setValue(0)
+        self.load_progress.show()
+        self.cancel_load_button.show()
+        try:
+            await self.coin_loader.load_folder(
+                folder, on_coin=self.add_loaded_coin, on_progress=self.update_load_progress
+            )
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            print(f"Error loading folder {folder}: {e}")
+        finally:
+            # A cancelled load must not hide the progress of the load that replaced it
+            if self.csv_load_task is asyncio.current_task():
+                self.csv_load_task = None
+                self.load_progress.hide()
+                self.cancel_load_button.hide()
+
+    def add_loaded_coin(self, coin_name, df):
+        self.csv_data[coin_name] = df
+        self.coin_selector.addItem(coin_name)
+
+    def update_load_progress(self, done, total):
+        self.load_progress.setMaximum(total)
+        self.load_progress.setValue(done)
+
+    def cancel_csv_load(self):
+        if self.csv_load_task and not self.csv_load_task.done():
+            self.csv_load_task.cancel()
+        self.csv_load_task = None
+        self.load_progress.hide()
+        self.cancel_load_button.hide()
+
+    def threshold_multiplier(self):
+        return self.threshold_slider.value() / 100
+
+    def update_threshold_label(self):
+        self.threshold_label.setText(f"Threshold: {self.threshold_multiplier():.2f} σ")
+
+    def coin_events(self, coin):
+        return self.detection_cache.events(coin, self.csv_data[coin], self.threshold_multiplier())
 
     def update_plot(self):
         coin = self.coin_selector.currentText()
         if coin and coin in self.csv_data:
-            self.plot_canvas.plot(self.csv_data[coin], coin)
+            self.plot_canvas.plot(self.csv_data[coin], coin, events=self.coin_events(coin))
+
+    def update_threshold(self):
+        self.update_threshold_label()
+        coin = self.coin_selector.currentText()
+        if coin and coin in self.csv_data:
+            self.plot_canvas.update_markers(self.coin_events(coin))
 
 
 class TelegramMessageDisplay(QWidget):
-    def __init__(self):
+    def __init__(self, filename=TELEGRAM_CHANNEL_FILE):
         super().__init__()
         self.setWindowTitle("Telegram Message Viewer")
         # Removed setGeometry here, will be managed by MainWindow
         self.layout = QVBoxLayout(self)
-
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_content = QVBoxLayout()
-        container = QWidget()
-        container.setLayout(self.scroll_content)
-        self.scroll_area.setWidget(container)
-        self.layout.addWidget(self.scroll_area)
+        self.filename = filename
+        self.load_worker = None
+
+        self.load_progress = QProgressBar()
+        self.load_progress.setRange(0, 0)  # busy indicator; the dump size is unknown up front
+        self.load_progress.setTextVisible(False)
+        self.load_progress.hide()
+        self.layout.addWidget(self.load_progress)
+
+        self.status_label = QLabel()
+        self.layout.addWidget(self.status_label)
+        self.message_model = TelegramMessageModel(parent=self)
+        self.message_table = make_message_table(self.message_model)
+        self.layout.addWidget(self.message_table)
         self.load_and_process_file()
 
     def parse_message_data(self, msg):
         """Parses a single message to extract date, coin, symbol, cap, and age."""
-        if "date" in msg and "message" in msg:
-            date_str = msg["date"]
-            message_text = msg["message"]
-            coin = "N/A"
-            symbol = "N/A"
-            cap = "N/A"
-            age = "N/A"
-
-            if message_text:
-                lines = message_text.split('\n')
-                for line in lines:
-                    if "🔔" in line:
-                        parts = line.split("|")
-                        if len(parts) > 1:
-                            coin_symbol = parts[0].replace("🔔", "").strip()
-                            symbol_match = coin_symbol.split()
-                            if symbol_match:
-                                coin = symbol_match[0].strip()
-                                if len(symbol_match) > 1:
-                                    symbol = symbol_match[-1].strip()
-                                else:
-                                    symbol = coin
-                    if "Marketcap:" in line:
-                        cap = line.split(":")[-1].strip()
-                    if "Age:" in line:
-                        age = line.split(":")[-1].strip()
-
-            try:
-                datetime_obj = QDateTime.fromString(date_str, Qt.ISODate)
-                if not datetime_obj.isValid():
-                    datetime_obj = QDateTime.fromString(date_str, "yyyy-MM-dd hh:mm:ss")
-                if datetime_obj.isValid():
-                    return datetime_obj, coin, symbol, cap, age
-                else:
-                    print(f"Warning: Could not parse date: {date_str}")
-                    return None
-            except Exception as e:
-                print(f"Error parsing date '{date_str}': {e}")
-                return None
-        return None
-
-    def load_and_process_file(self):
-        filename = "telegram-scraper/TheDegenBoysLounge/TheDegenBoysLounge.json"
-        if filename:
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            messages = data if isinstance(data, list) else data.get("messages", [])
-            processed_messages = []
-
-            for msg in messages:
-                print(msg)
-                print("===" * 20)
-                parsed_data = self.parse_message_data(msg)
-                if parsed_data:
-                    processed_messages.append(parsed_data)
-
-            # Sort messages by date (newest to oldest)
-            processed_messages.sort(key=lambda item: item[0], reverse=True)
-
-            # Clear old content
-            while self.scroll_content.count():
-                child = self.scroll_content.takeAt(0)
-                if child.widget():
-                    child.widget().deleteLater()
-
-            # Display processed messages
-            font = QFont()
-            font.setPointSize(10)
-            for date_obj, coin, symbol, cap, age in processed_messages[:30]:
-                date_str_readable = date_obj.toString("yyyy-MM-dd hh:mm:ss")
-                output_text = f"<b>Date:</b> {date_str_readable}<br>"
-                output_text += f"<b>Coin:</b> {coin}, <b>Symbol:</b> {symbol}, <b>Cap:</b> {cap}, <b>Age:</b> {age}<br><br>"
-
-                label = QLabel(output_text)
-                label.setFont(font)
-                label.setWordWrap(True)
-                self.scroll_content.addWidget(label)
-                container = QWidget()
-                container.setLayout(self.scroll_content)
-                self.scroll_area.setWidget(container)
-
-                # Optional: Ensure scroll to top after loading new data
-                self.scroll_area.verticalScrollBar().setValue(0)
+        rows = message_rows([msg], channel_name(self.filename))
+        return rows[0][:5] if rows else None
+
+    def load_and_process_file(self, filename=None):
+        """Starts streaming the dump on the thread pool; the panel fills in as chunks arrive."""
+        self.cancel_load()
+        if filename is not None:
+            self.filename = filename
+        self.message_model.clear()
+
+        parse = partial(message_rows, channel=channel_name(self.filename))
+        worker = TelegramLoadWorker(self.filename, parse, limit=TELEGRAM_MESSAGE_LIMIT, key=self.message_sort_key)
+        worker.signals.chunk.connect(self.add_message_chunk)
+        worker.signals.finished.connect(self.finish_load)
+        worker.signals.failed.connect(self.fail_load)
+        self.load_worker = worker
+        self.status_label.setText(f"Loading {os.path.basename(self.filename)}...")
+        self.load_progress.show()
+        QThreadPool.globalInstance().start(worker)
+
+    @staticmethod
+    def message_sort_key(item):
+        return item[0].toMSecsSinceEpoch()
+
+    def is_current(self):
+        # Chunks already queued by a cancelled worker still arrive; they are dropped here
+        return self.load_worker is not None and self.sender() is self.load_worker.signals
+
+    def add_message_chunk(self, rows, read):
+        if not self.is_current():
+            return
+        self.status_label.setText(f"Loading {os.path.basename(self.filename)}... {read} messages read")
+        if rows:
+            # Merged into the current sort, then cut back to the newest messages
+            self.message_model.add_rows(rows)
+            self.message_model.trim(TELEGRAM_MESSAGE_LIMIT, self.message_sort_key)
+
+    def finish_load(self, read):
+        if not self.is_current():
+            return
+        self.load_worker = None
+        self.load_progress.hide()
+        self.status_label.setText(f"Newest {len(self.message_model.rows)} of {read} messages "
+                                  f"from {os.path.basename(self.filename)}")
+
+    def fail_load(self, error):
+        if not self.is_current():
+            return
+        self.load_worker = None
+        self.load_progress.hide()
+        self.status_label.setText(error)
+
+    def cancel_load(self):
+        if self.load_worker is not None:
+            self.load_worker.cancel()
+            self.load_worker = None
+        self.load_progress.hide()
 
 
 class MainWindow(QMainWindow):
@@ -452,6 +723,11 @@ class MainWindow(QMainWindow):
         self.main_layout.addWidget(self.telegram_message_display)
         self.main_layout.addWidget(self.websocket_display)
 
+    def closeEvent(self, event):
+        self.telegram_message_display.cancel_load()
+        self.websocket_display.shutdown()
+        event.accept()
+
 
 async def main():
     app = QApplication([])
@@ -0,0 +1,183 @@
+import sys
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+MODES = ("global", "rolling", "multiscale")
+DEFAULT_WINDOW = 30
+DEFAULT_WINDOWS = (7, 30, 90)
+EVENT_COLUMNS = ['Close', 'Price_Change', 'zscore', 'kind']
+
+
+def build_close_frame(csv_data, column='Close'):
+    """Aligns one column of every coin into a single Date x coin frame, oldest date first."""
+    series = {}
+    for coin_name, df in csv_data.items():
+        values = df[column]
+        series[coin_name] = values[~values.index.duplicated(keep='last')]
+    if not series:
+        return pd.DataFrame()
+    return pd.concat(series, axis=1, sort=True)
+
+
+def price_changes(closes):
+    """Change from each coin's previous close, skipping dates a coin has no data for."""
+    return closes.ffill().diff().where(closes.notna())
+
+
+def _rolling_zscores(changes, window):
+    # Score each change against the window that ends just before it
+    min_periods = max(3, window // 2)
+    rolling = changes.rolling(window, min_periods=min_periods)
+    mean = rolling.mean().shift(1)
+    std = rolling.std().shift(1)
+    return (changes - mean) / std.where(std > 0)
+
+
+def zscores(changes, mode="global", window=DEFAULT_WINDOW, windows=DEFAULT_WINDOWS):
+    """Z-scores of price changes for every coin column at once.
+
+    global     -- against each coin's whole-history mean and std (the original plot rule)
+    rolling    -- against a trailing window of `window` rows
+    multiscale -- the strongest of the trailing-window scores over `windows`
+    """
+    if mode == "global":
+        std = changes.std()
+        return (changes - changes.mean()) / std.where(std > 0)
+    if mode == "rolling":
+        return _rolling_zscores(changes, window)
+    if mode == "multiscale":
+        scores = multiscale_zscores(changes, windows)
+        return pd.DataFrame(scores, index=changes.index, columns=changes.columns)
+    raise ValueError(f"Unknown detection mode: {mode}")
+
+
+def multiscale_zscores(changes, windows=DEFAULT_WINDOWS):
+    """Returns an array holding, per cell, the window score with the largest magnitude."""
+    stack = np.stack([_rolling_zscores(changes, w).to_numpy() for w in windows])
+    strongest = np.nan_to_num(np.abs(stack), nan=-1.0).argmax(axis=0)
+    return np.take_along_axis(stack, strongest[np.newaxis], axis=0)[0]
+
+
+def detect_events(closes, threshold_multiplier=0.5, mode="global",
+                  window=DEFAULT_WINDOW, windows=DEFAULT_WINDOWS):
+    """Flags pumps and dumps for every coin in a Date x coin close frame.
+
+    Returns {coin_name: DataFrame} with one row per flagged date and the columns
+    Close, Price_Change, zscore and kind ('pump' or 'dump'). Coins without events
+    get an empty frame.
+    """
+    changes = price_changes(closes)
+    scores = zscores(changes, mode=mode, window=window, windows=windows)
+    return events_from_scores(closes, changes, scores, threshold_multiplier)
+
+
+def events_from_scores(closes, changes, scores, threshold_multiplier):
+    """Applies a threshold to precomputed z-scores; see detect_events for the result."""
+    flagged = scores.where(scores.abs() > threshold_multiplier)
+
+    # Long format over the flagged cells only, so the cost follows the number of events
+    stacked = flagged.stack().dropna()
+    stacked.index.names = ['Date', 'coin']
+    events = pd.DataFrame({
+        'Close': closes.stack().reindex(stacked.index),
+        'Price_Change': changes.stack().reindex(stacked.index),
+        'zscore': stacked,
+    })
+    events['kind'] = np.where(events['zscore'] > 0, 'pump', 'dump')
+
+    by_coin = {coin: group.droplevel('coin') for coin, group in events.groupby(level='coin', sort=False)}
+    empty = pd.DataFrame(columns=EVENT_COLUMNS, index=pd.DatetimeIndex([], name='Date'))
+    return {coin: by_coin.get(coin, empty) for coin in closes.columns}
+
+
+def detect_coin_events(df, threshold_multiplier=0.5, mode="global",
+                       window=DEFAULT_WINDOW, windows=DEFAULT_WINDOWS):
+    """detect_events for a single coin's frame; the frame itself is left untouched."""
+    closes = build_close_frame({'coin': df})
+    return detect_events(closes, threshold_multiplier, mode, window, windows)['coin']
+
+
+class DetectionCache:
+    """Bounded LRU memo of per-coin detection results.
+
+    Z-scores are kept per (coin, mode, window, windows) and event tables per
+    (coin, threshold, mode, window, windows), so moving the threshold only re-applies
+    the cut to scores that are already computed. Call clear() when the coin data
+    behind a name changes.
+    """
+
+    def __init__(self, max_coins=64, max_results=512):
+        self.max_coins = max_coins
+        self.max_results = max_results
+        self._scores = OrderedDict()
+        self._events = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def events(self, coin_name, df, threshold_multiplier=0.5, mode="global",
+               window=DEFAULT_WINDOW, windows=DEFAULT_WINDOWS):
+        settings = (mode, window, tuple(windows))
+        key = (coin_name, round(threshold_multiplier, 6)) + settings
+        if key in self._events:
+            self._events.move_to_end(key)
+            self.hits += 1
+            return self._events[key]
+
+        self.misses += 1
+        closes, changes, scores = self._coin_scores(coin_name, df, settings)
+        events = events_from_scores(closes, changes, scores, threshold_multiplier)['coin']
+        self._remember(self._events, key, events, self.max_results)
+        return events
+
+    def _coin_scores(self, coin_name, df, settings):
+        key = (coin_name,) + settings
+        if key in self._scores:
+            self._scores.move_to_end(key)
+            return self._scores[key]
+
+        mode, window, windows = settings
+        closes = build_close_frame({'coin': df})
+        changes = price_changes(closes)
+        scores = zscores(changes, mode=mode, window=window, windows=windows)
+        self._remember(self._scores, key, (closes, changes, scores), self.max_coins)
+        return closes, changes, scores
+
+    @staticmethod
+    def _remember(store, key, value, limit):
+        store[key] = value
+        while len(store) > limit:
+            store.popitem(last=False)
+
+    def clear(self):
+        self._scores.clear()
+        self._events.clear()
+
+
+def screen_coins(csv_data, threshold_multiplier=0.5, mode="global",
+                 window=DEFAULT_WINDOW, windows=DEFAULT_WINDOWS):
+    """Summarizes detected events per coin, most active coins first."""
+    events = detect_events(build_close_frame(csv_data), threshold_multiplier, mode, window, windows)
+    rows = []
+    for coin_name, coin_events in events.items():
+        kinds = coin_events['kind']
+        rows.append({
+            'coin': coin_name,
+            'pumps': int((kinds == 'pump').sum()),
+            'dumps': int((kinds == 'dump').sum()),
+            'max_abs_zscore': coin_events['zscore'].abs().max() if len(coin_events) else np.nan,
+            'last_event': coin_events.index.max() if len(coin_events) else pd.NaT,
+        })
+    summary = pd.DataFrame(rows, columns=['coin', 'pumps', 'dumps', 'max_abs_zscore', 'last_event'])
+    summary['events'] = summary['pumps'] + summary['dumps']
+    return summary.sort_values('events', ascending=False).set_index('coin')
+
+
+if __name__ == "__main__":
+    from csvfile import load_and_merge_data
+    from csv_cache import CsvCache
+
+    folder_path = sys.argv[1] if len(sys.argv) > 1 else "Meme Coin"
+    detection_mode = sys.argv[2] if len(sys.argv) > 2 else "global"
+    coin_data = load_and_merge_data(folder_path, cache=CsvCache())
+    print(screen_coins(coin_data, mode=detection_mode).to_string())
@@ -0,0 +1,101 @@
+import json
+
+# orjson decodes straight from bytes or str several times faster than the stdlib
+try:
+    import orjson
+    loads = orjson.loads
+except ImportError:
+    orjson = None
+    loads = json.loads
+
+
+class CreateEvent:
+    """A new pump.fun token (txType "create")."""
+    __slots__ = ('mint', 'signature', 'trader', 'name', 'symbol', 'uri', 'pool', 'initial_buy',
+                 'sol_amount', 'market_cap_sol', 'v_tokens_in_bonding_curve', 'v_sol_in_bonding_curve',
+                 'bonding_curve_key')
+    tx_type = "create"
+
+    def __init__(self, data):
+        self.mint = data.get("mint")
+        self.signature = data.get("signature")
+        self.trader = data.get("traderPublicKey")
+        self.name = data.get("name", "")
+        self.symbol = data.get("symbol", "")
+        self.uri = data.get("uri")
+        self.pool = data.get("pool")
+        self.initial_buy = data.get("initialBuy", 0.0)
+        self.sol_amount = data.get("solAmount", 0.0)
+        self.market_cap_sol = data.get("marketCapSol", 0.0)
+        self.v_tokens_in_bonding_curve = data.get("vTokensInBondingCurve", 0.0)
+        self.v_sol_in_bonding_curve = data.get("vSolInBondingCurve", 0.0)
+        self.bonding_curve_key = data.get("bondingCurveKey")
+
+
+class TradeEvent:
+    """A buy or sell on a subscribed token (txType "buy" / "sell")."""
+    __slots__ = ('mint', 'signature', 'trader', 'tx_type', 'pool', 'token_amount', 'sol_amount',
+                 'new_token_balance', 'market_cap_sol', 'v_tokens_in_bonding_curve',
+                 'v_sol_in_bonding_curve')
+
+    def __init__(self, data):
+        self.mint = data.get("mint")
+        self.signature = data.get("signature")
+        self.trader = data.get("traderPublicKey")
+        self.tx_type = data.get("txType")
+        self.pool = data.get("pool")
+        self.token_amount = data.get("tokenAmount", 0.0)
+        self.sol_amount = data.get("solAmount", 0.0)
+        self.new_token_balance = data.get("newTokenBalance", 0.0)
+        self.market_cap_sol = data.get("marketCapSol", 0.0)
+        self.v_tokens_in_bonding_curve = data.get("vTokensInBondingCurve", 0.0)
+        self.v_sol_in_bonding_curve = data.get("vSolInBondingCurve", 0.0)
+
+    @property
+    def is_buy(self):
+        return self.tx_type == "buy"
+
+
+class MigrationEvent:
+    """A token leaving the bonding curve for an AMM pool (txType "migrate")."""
+    __slots__ = ('mint', 'signature', 'pool')
+    tx_type = "migrate"
+
+    def __init__(self, data):
+        self.mint = data.get("mint")
+        self.signature = data.get("signature")
+        self.pool = data.get("pool")
+
+
+class StatusEvent:
+    """A server notice such as a subscription acknowledgement."""
+    __slots__ = ('message',)
+    tx_type = None
+
+    def __init__(self, data):
+        self.message = data.get("message", "")
+
+
+EVENT_TYPES = {
+    "create": CreateEvent,
+    "buy": TradeEvent,
+    "sell": TradeEvent,
+    "migrate": MigrationEvent,
+}
+
+
+def event_from_dict(data):
+    """Builds the typed event for a decoded message; None for anything unrecognised."""
+    if not isinstance(data, dict):
+        return None
+    event_type = EVENT_TYPES.get(data.get("txType"))
+    if event_type is not None:
+        return event_type(data)
+    if "message" in data:
+        return StatusEvent(data)
+    return None
+
+
+def decode_event(raw):
+    """Decodes one pumpportal frame (bytes or str). Raises ValueError on invalid JSON."""
+    return event_from_dict(loads(raw))
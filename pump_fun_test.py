@@ -1,17 +1,14 @@
 import asyncio
-import websockets
 import json
-import ssl
-import certifi
 import platform
-import traceback  # For detailed error tracing
 
 from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QTextEdit, QLineEdit, QPushButton, QHBoxLayout, QLabel
 from PyQt5.QtGui import QCloseEvent
 from PyQt5.QtCore import QTimer
 
 from qasync import QEventLoop
-from websockets import protocol
+
+from connection_supervisor import ConnectionSupervisor
 
 # Windows event loop fix
 if platform.system() == "Windows":
@@ -54,10 +51,8 @@ class WebSocketDisplay(QWidget):
 
         self.setLayout(self.main_layout)
 
-        self.websocket = None
-        self.is_connected = False
+        self.supervisor = ConnectionSupervisor(self.handle_raw_message)
         self.connection_task = None
-        self.subscribed_tokens = set()  # Keep track of subscribed tokens for search
         self.known_coins = {}  # Key will be the mint address, value will be coin info
         self.searched_symbol = None
 
@@ -67,94 +62,24 @@ class WebSocketDisplay(QWidget):
         self.timer = QTimer()
         self.timer.timeout.connect(self.check_connection)
         self.timer.start(5000)
-        print("Connection check timer started (every 5 seconds)")
-
-    async def connect_websocket_async(self):
-        uri = "wss://pumpportal.fun/api/data"
-        ssl_context = ssl.create_default_context(cafile=certifi.where())
-
-        while True:  # Keep trying to connect
-            print(f"Attempting to connect to WebSocket URI: {uri}")
-            websocket_attempt = None  # Local variable for the current connection attempt
-            try:
-                print("About to call websockets.connect()")
-                websocket_attempt = await websockets.connect(uri, ssl=ssl_context)
-                self.websocket = websocket_attempt  # Assign to the class attribute only on success
-                print("websockets.connect() call successful.")
-                print("WebSocket connection established successfully.")
-                self.is_connected = True
-                await self.subscribe_initial()  # Subscribe to initial streams
-                try:
-                    async for message in self.websocket:
-                        print("Received message from WebSocket.")
-                        try:
-                            message_data = json.loads(message)
-                            print("Message received and parsed successfully.")
-                            self.process_realtime_message(message_data)
-                        except json.JSONDecodeError:
-                            print(f"Error decoding JSON from message: {message}")
-                            self.realtime_text_edit.append(f"Error decoding JSON: {message}")
-                except websockets.exceptions.ConnectionClosedOK:
-                    print("WebSocket connection closed by the server.")
-                    # No break here, we want to reconnect
-                except websockets.exceptions.ConnectionClosedError as e:
-                    print(f"WebSocket connection closed unexpectedly: {e}")
-                    # No break here, we want to reconnect
-                except asyncio.CancelledError:
-                    print("WebSocket task was cancelled.")
-                    break  # Break out of the outer while loop
-                except Exception as e:
-                    print("An unexpected error occurred while processing messages:")
-                    traceback.print_exc()
-                    break  # Break out of the outer while loop
-            except websockets.exceptions.InvalidStatusCode as e:
-                print(f"WebSocket connection failed with status code: {e.status_code}")
-            except ConnectionRefusedError as e:
-                print(f"Connection refused: {e}")
-            except Exception as e:
-                print("An unexpected error occurred during initial WebSocket connection:")
-                traceback.print_exc()
-            finally:
-                print("Exiting WebSocket connection attempt (inner loop).")
-                self.is_connected = False
-                if websocket_attempt:
-                    await websocket_attempt.close()
-                self.websocket = None
-                print("Waiting 5 seconds before attempting reconnection...")
-                await asyncio.sleep(5)
-                print("Attempting to reconnect...")
+        print("Connection status timer started (every 5 seconds)")
+
+    def handle_raw_message(self, message):
+        try:
+            message_data = json.loads(message)
+            self.process_realtime_message(message_data)
+        except json.JSONDecodeError:
+            print(f"Error decoding JSON from message: {message}")
+            self.realtime_text_edit.append(f"Error decoding JSON: {message}")
 
     def connect_websocket(self):
         print("Attempting to start WebSocket connection task.")
-        self.connection_task = asyncio.create_task(self.connect_websocket_async())
+        self.connection_task = self.supervisor.start()
         print("WebSocket connection task started.")
 
-    async def subscribe_initial(self):
-        if self.websocket and self.websocket.state == protocol.State.OPEN:
-            print("Sending initial subscription payloads to WebSocket...")
-            initial_payloads = [
-                {"method": "subscribeNewToken"},
-                {"method": "subscribeMigration"},
-            ]
-            for payload in initial_payloads:
-                print(f"Sending initial payload: {payload}")
-                await self.websocket.send(json.dumps(payload))
-        else:
-            print("WebSocket is not open, cannot send initial subscription payloads.")
-
-    async def subscribe_token_trade(self, symbol):
-        if self.websocket and self.websocket.state == protocol.State.OPEN and symbol not in self.subscribed_tokens:
-            payload = {"method": "subscribeTokenTrade", "keys": [symbol]}
-            print(f"Sending subscription request for symbol: {symbol}")
-            await self.websocket.send(json.dumps(payload))
-            self.subscribed_tokens.add(symbol)
-
-    async def unsubscribe_token_trade(self, symbol):
-        if self.websocket and self.websocket.state == protocol.State.OPEN and symbol in self.subscribed_tokens:
-            payload = {"method": "unsubscribeTokenTrade", "keys": [symbol]}
-            print(f"Sending unsubscription request for symbol: {symbol}")
-            await self.websocket.send(json.dumps(payload))
-            self.subscribed_tokens.discard(symbol)
+    async def subscribe_token_trade(self, mints):
+        print(f"Watching trades for {len(mints)} mints")
+        await self.supervisor.set_tokens(mints)
 
     def process_realtime_message(self, message_data):
         formatted_text = ""
@@ -211,7 +136,8 @@ class WebSocketDisplay(QWidget):
 
     async def search_token_data(self, symbol):
         symbol = symbol.upper()
-        found_coins = [info for mint, info in self.known_coins.items() if info.get("symbol") == symbol]
+        found_mints = [mint for mint, info in self.known_coins.items() if info.get("symbol", "").upper() == symbol]
+        found_coins = [self.known_coins[mint] for mint in found_mints]
 
         self.search_results_text_edit.clear()
         if found_coins:
@@ -226,8 +152,8 @@ class WebSocketDisplay(QWidget):
         else:
             self.search_results_text_edit.append(f"No previously seen coins found with symbol: {symbol}\n")
 
-        await self.unsubscribe_token_trade(symbol)
-        await self.subscribe_token_trade(symbol)
+        # pumpportal subscribes trades by mint; the previous search's mints are dropped
+        await self.subscribe_token_trade(found_mints)
         if not found_coins:
             self.search_results_text_edit.append("Waiting for real-time updates for this symbol...\n")
         self.searched_symbol = symbol
@@ -239,18 +165,14 @@ class WebSocketDisplay(QWidget):
             asyncio.create_task(self.search_token_data(symbol))
 
     def check_connection(self):
-        if not self.websocket or self.websocket.state != protocol.State.OPEN:
-            print("WebSocket disconnected or not open. Reconnecting...")
-            self.is_connected = False
-            self.connect_websocket()
-        else:
-            print("WebSocket is still open.")
+        # The supervisor reconnects on its own; this only reports its state
+        print(f"Connection stats: {self.supervisor.stats()}")
 
     def closeEvent(self, event: QCloseEvent):
         print("Closing PyQt window...")
-        if self.websocket and self.websocket.state == protocol.State.OPEN:
+        if self.supervisor.is_connected:
             print("Closing WebSocket connection...")
-            asyncio.create_task(self.websocket.close())
+            asyncio.ensure_future(self.supervisor.stop())
         event.accept()
         QApplication.quit()
 
@@ -0,0 +1,171 @@
+import os
+import time
+
+import numpy as np
+
+from coin_registry import normalize_symbol
+from pump_events import CreateEvent
+
+DEFAULT_SNAPSHOT_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pump_screener", "registry")
+
+# Fixed-width rows so the file can be memory-mapped and binary searched in place.
+# Text is UTF-8, truncated to the field width.
+COIN_DTYPE = np.dtype([
+    ('key', 'S32'),  # normalized symbol, the sort key
+    ('symbol', 'S32'),
+    ('name', 'S64'),
+    ('mint', 'S48'),
+    ('signature', 'S88'),
+    ('sol_amount', 'f8'),
+    ('market_cap_sol', 'f8'),
+    ('initial_buy', 'f8'),
+    ('last_seen', 'f8'),  # unix time
+])
+KEY_WIDTH = COIN_DTYPE['key'].itemsize
+MINT_DTYPE = np.dtype('S48')
+
+
+def _encode(text, width):
+    return (text or "").encode("utf-8")[:width]
+
+
+def _decode(raw):
+    # A truncated multi-byte character is dropped rather than failing the row
+    return raw.decode("utf-8", errors="ignore")
+
+
+def symbol_key(symbol):
+    return _encode(normalize_symbol(symbol), KEY_WIDTH)
+
+
+def coin_row(event, last_seen):
+    return (symbol_key(event.symbol), _encode(event.symbol, 32), _encode(event.name, 64),
+            _encode(event.mint, 48), _encode(event.signature, 88), event.sol_amount or 0.0,
+            event.market_cap_sol or 0.0, event.initial_buy or 0.0, last_seen)
+
+
+def row_event(row):
+    return CreateEvent({
+        "mint": _decode(row['mint']),
+        "symbol": _decode(row['symbol']),
+        "name": _decode(row['name']),
+        "signature": _decode(row['signature']) or None,
+        "solAmount": float(row['sol_amount']),
+        "marketCapSol": float(row['market_cap_sol']),
+        "initialBuy": float(row['initial_buy']),
+        "txType": "create",
+    })
+
+
+class RegistrySnapshot:
+    """Memory-mapped snapshot of the coin registry and the token-trade subscriptions.
+
+    coins.npy holds one fixed-width row per coin, sorted by normalized symbol, so
+    lookups are a binary search over the mapped file and only the matching rows are
+    ever read. Nothing is opened until the first lookup.
+    """
+
+    def __init__(self, directory=DEFAULT_SNAPSHOT_DIR, ttl=None):
+        self.directory = directory
+        self.ttl = ttl
+        self.coins_path = os.path.join(directory, "coins.npy")
+        self.subscriptions_path = os.path.join(directory, "subscriptions.npy")
+        self._coins = None
+
+    @property
+    def coins(self):
+        if self._coins is None:
+            self._coins = self._map(self.coins_path, COIN_DTYPE)
+        return self._coins
+
+    def __len__(self):
+        return len(self.coins)
+
+    def _map(self, path, dtype):
+        if not os.path.exists(path):
+            return np.empty(0, dtype=dtype)
+        try:
+            array = np.load(path, mmap_mode='r', allow_pickle=False)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable snapshot {path}: {e}")
+            return np.empty(0, dtype=dtype)
+        if array.dtype != dtype:
+            print(f"Ignoring snapshot {path} with an unexpected layout")
+            return np.empty(0, dtype=dtype)
+        return array
+
+    def _live(self, rows, now=None):
+        if self.ttl is None or not len(rows):
+            return rows
+        if now is None:
+            now = time.time()
+        return rows[rows['last_seen'] > now - self.ttl]
+
+    def find_symbol(self, symbol):
+        """Snapshot coins with exactly this symbol (any case), oldest first."""
+        key = symbol_key(symbol)
+        if not key:
+            return []
+        keys = self.coins['key']
+        start = np.searchsorted(keys, key, side='left')
+        stop = np.searchsorted(keys, key, side='right')
+        return [row_event(row) for row in self._live(self.coins[start:stop])]
+
+    def _prefix_rows(self, prefix):
+        key = symbol_key(prefix)
+        if not key:
+            return self.coins[:0]
+        keys = self.coins['key']
+        start = np.searchsorted(keys, key, side='left')
+        if len(key) < KEY_WIDTH:
+            # Every key with this prefix sorts below the prefix followed by 0xff
+            stop = np.searchsorted(keys, key + b'\xff', side='left')
+        else:
+            stop = np.searchsorted(keys, key, side='right')
+        return self._live(self.coins[start:stop])
+
+    def find_prefix(self, prefix, limit=20):
+        """Up to limit snapshot coins whose symbol starts with prefix, in symbol order."""
+        return [row_event(row) for row in self._prefix_rows(prefix)[:limit]]
+
+    def symbols_starting_with(self, prefix):
+        return [_decode(key) for key in np.unique(self._prefix_rows(prefix)['key'])]
+
+    def subscriptions(self):
+        return [_decode(mint) for mint in self._map(self.subscriptions_path, MINT_DTYPE)]
+
+    def save(self, registry, token_keys=(), max_coins=None):
+        """Writes the registry merged with the coins already in the snapshot.
+
+        Live entries win over snapshot rows for the same mint; past max_coins the
+        least recently seen coins are dropped.
+        """
+        now = time.time()
+        # The registry keeps last_seen on its own (monotonic) clock
+        offset = now - registry.clock()
+        live = np.array([coin_row(event, last_seen + offset) for event, last_seen in registry.coins.values()],
+                        dtype=COIN_DTYPE)
+        previous = self._live(self.coins, now)
+        if len(previous):
+            previous = previous[~np.isin(previous['mint'], live['mint'])]
+        merged = np.concatenate([np.asarray(previous), live])
+        del previous
+
+        if max_coins is not None and len(merged) > max_coins:
+            newest = np.argsort(merged['last_seen'], kind='stable')[-max_coins:]
+            merged = merged[newest]
+        # Symbol order for binary search; equal symbols oldest first
+        merged = merged[np.lexsort((merged['last_seen'], merged['key']))]
+
+        os.makedirs(self.directory, exist_ok=True)
+        # Release the old mapping before the file under it is replaced
+        self._coins = None
+        self._write(self.coins_path, merged)
+        self._write(self.subscriptions_path,
+                    np.array([_encode(key, 48) for key in sorted(token_keys)], dtype=MINT_DTYPE))
+        return len(merged)
+
+    def _write(self, path, array):
+        tmp_path = f"{path}.{os.getpid()}.tmp.npy"
+        np.save(tmp_path, array, allow_pickle=False)
+        os.replace(tmp_path, path)
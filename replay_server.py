@@ -0,0 +1,254 @@
+import argparse
+import asyncio
+import json
+import random
+import string
+import threading
+
+import websockets
+
+from feed_recorder import read_recording
+from pump_events import loads
+
+# Which subscription a frame belongs to, by txType
+STREAMS = {
+    "create": "subscribeNewToken",
+    "migrate": "subscribeMigration",
+    "buy": "subscribeTokenTrade",
+    "sell": "subscribeTokenTrade",
+}
+BASE58 = "".join(c for c in string.ascii_letters + string.digits if c not in "0OIl")
+
+
+def apply_control(message, streams, keys):
+    """Applies one client control frame to its stream and trade-key sets; returns the method or None."""
+    try:
+        control = json.loads(message)
+        method = control["method"]
+    except (ValueError, KeyError, TypeError):
+        return None
+    if method == "subscribeTokenTrade":
+        keys.update(control.get("keys", ()))
+    elif method == "unsubscribeTokenTrade":
+        keys.difference_update(control.get("keys", ()))
+    elif method.startswith("subscribe"):
+        streams.add(method)
+    elif method.startswith("unsubscribe"):
+        streams.discard("subscribe" + method[len("unsubscribe"):])
+    else:
+        return None
+    return method
+
+
+def wants(stream, mint, streams, keys):
+    """Whether a client with these subscriptions gets a frame of this stream and mint."""
+    if stream == "subscribeTokenTrade":
+        return mint in keys
+    return stream in streams
+
+
+def classify(frames):
+    """(t, stream, mint, raw) for every (t, raw) frame; frames of no known stream are dropped."""
+    classified = []
+    for t, raw in frames:
+        try:
+            data = loads(raw)
+        except ValueError:
+            continue
+        if not isinstance(data, dict):
+            continue
+        stream = STREAMS.get(data.get("txType"))
+        if stream is not None:
+            classified.append((t, stream, data.get("mint"), raw))
+    return classified
+
+
+def synthetic_frames(coins=1000, trades_per_coin=10, rate=200.0, seed=0):
+    """Pumpportal-like create and trade frames as (t, raw), rate frames per second.
+
+    Trades follow the constant-product bonding curve, so prices and market caps move
+    the way the real feed's do.
+    """
+    rng = random.Random(seed)
+
+    def key(length=44):
+        return "".join(rng.choice(BASE58) for _ in range(length))
+
+    frames = []
+    active = []  # [mint, v_sol, v_tokens, trades_left]
+    created = 0
+    while created < coins or active:
+        t = len(frames) / rate
+        if created < coins and (not active or rng.random() < 1.0 / (trades_per_coin + 1)):
+            created += 1
+            mint = key(40) + "pump"
+            symbol = "".join(rng.choice(string.ascii_uppercase) for _ in range(rng.randint(3, 6)))
+            initial_buy = rng.uniform(0.1, 3.0)
+            v_sol = 30.0 + initial_buy
+            v_tokens = 30.0 * 1_073_000_000 / v_sol
+            frames.append((t, json.dumps({
+                "signature": key(88), "mint": mint, "traderPublicKey": key(), "txType": "create",
+                "initialBuy": 1_073_000_000 - v_tokens, "solAmount": initial_buy,
+                "bondingCurveKey": key(), "vTokensInBondingCurve": v_tokens,
+                "vSolInBondingCurve": v_sol, "marketCapSol": v_sol / v_tokens * 1e9,
+                "name": symbol.title() + " Coin", "symbol": symbol,
+                "uri": f"https://ipfs.io/ipfs/{key(46)}", "pool": "pump",
+            })))
+            if trades_per_coin > 0:
+                active.append([mint, v_sol, v_tokens, trades_per_coin])
+            continue
+
+        coin = rng.choice(active)
+        mint, v_sol, v_tokens, _ = coin
+        is_buy = rng.random() < 0.6
+        sol_amount = rng.uniform(0.01, 2.0) if is_buy else min(rng.uniform(0.01, 2.0), v_sol - 30.0 + 0.01)
+        k = v_sol * v_tokens
+        new_v_sol = v_sol + sol_amount if is_buy else max(v_sol - sol_amount, 1.0)
+        new_v_tokens = k / new_v_sol
+        coin[1], coin[2] = new_v_sol, new_v_tokens
+        coin[3] -= 1
+        if coin[3] <= 0:
+            active.remove(coin)
+        frames.append((t, json.dumps({
+            "signature": key(88), "mint": mint, "traderPublicKey": key(),
+            "txType": "buy" if is_buy else "sell", "tokenAmount": abs(new_v_tokens - v_tokens),
+            "solAmount": sol_amount, "newTokenBalance": rng.uniform(0, 5e7),
+            "bondingCurveKey": key(), "vTokensInBondingCurve": new_v_tokens,
+            "vSolInBondingCurve": new_v_sol, "marketCapSol": new_v_sol / new_v_tokens * 1e9,
+            "pool": "pump",
+        })))
+    return frames
+
+
+class ReplayServer:
+    """Local stand-in for the pumpportal websocket that replays (t, raw) frames.
+
+    Every connection gets its own playback, started settle seconds after its first
+    subscription so the client's other subscriptions are in, and paced by the frames'
+    timestamps divided by speed (speed=None sends as fast as the socket takes them).
+    Only frames the connection is subscribed to are sent: creates for subscribeNewToken,
+    migrations for subscribeMigration and trades for the mints given to
+    subscribeTokenTrade, which can change while the playback runs.
+    """
+
+    def __init__(self, frames, speed=1.0, host="127.0.0.1", port=0, settle=0.1):
+        self.frames = classify(frames)
+        self.speed = speed
+        self.settle = settle
+        self.host = host
+        self.port = port
+        self.server = None
+        self.sent = 0
+        self.sessions_done = 0
+        self.thread = None
+        self.loop = None
+
+    @property
+    def uri(self):
+        return f"ws://{self.host}:{self.port}"
+
+    async def start(self):
+        self.server = await websockets.serve(self.handler, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self.uri
+
+    async def stop(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+    async def handler(self, websocket):
+        streams = set()
+        keys = set()
+        subscribed = asyncio.Event()
+        reader = asyncio.ensure_future(self.read_controls(websocket, streams, keys, subscribed))
+        try:
+            await subscribed.wait()
+            await asyncio.sleep(self.settle)
+            await self.play(websocket, streams, keys)
+            self.sessions_done += 1
+            await websocket.wait_closed()
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            reader.cancel()
+
+    async def read_controls(self, websocket, streams, keys, subscribed):
+        async for message in websocket:
+            method = apply_control(message, streams, keys)
+            if method is None:
+                continue
+            await websocket.send(json.dumps({"message": f"Successfully handled {method}."}))
+            subscribed.set()
+
+    async def play(self, websocket, streams, keys):
+        if not self.frames:
+            return
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        first_t = self.frames[0][0]
+        for i, (t, stream, mint, raw) in enumerate(self.frames):
+            if self.speed:
+                delay = started + (t - first_t) / self.speed - loop.time()
+                if delay > 0.001:
+                    await asyncio.sleep(delay)
+            elif i % 256 == 0:
+                await asyncio.sleep(0)  # let subscription changes in at full speed
+            if not wants(stream, mint, streams, keys):
+                continue
+            await websocket.send(raw)
+            self.sent += 1
+
+    def start_in_thread(self):
+        """Serves from a daemon thread with its own event loop; returns the uri."""
+        ready = threading.Event()
+
+        def serve():
+            self.loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self.loop)
+            self.loop.run_until_complete(self.start())
+            ready.set()
+            self.loop.run_forever()
+            self.loop.run_until_complete(self.stop())
+            self.loop.close()
+
+        self.thread = threading.Thread(target=serve, name="replay-server", daemon=True)
+        self.thread.start()
+        ready.wait(10)
+        return self.uri
+
+    def stop_thread(self, timeout=5.0):
+        if self.thread is not None:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(timeout)
+            self.thread = None
+
+
+async def serve_forever(server):
+    print(f"Replaying {len(server.frames)} frames on {await server.start()}")
+    try:
+        await asyncio.Future()
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay recorded or synthetic pumpportal traffic locally.")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--recording", help="Folder of segments written by FeedRecorder")
+    source.add_argument("--synthetic", type=int, default=1000, help="Number of synthetic coins")
+    parser.add_argument("--trades-per-coin", type=int, default=10)
+    parser.add_argument("--speed", type=float, default=1.0, help="Playback speed; 0 sends as fast as possible")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    if args.recording:
+        frames = list(read_recording(args.recording))
+    else:
+        frames = synthetic_frames(args.synthetic, args.trades_per_coin)
+    try:
+        asyncio.run(serve_forever(ReplayServer(frames, speed=args.speed or None, host=args.host, port=args.port)))
+    except KeyboardInterrupt:
+        pass
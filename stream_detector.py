@@ -0,0 +1,228 @@
+import argparse
+import math
+import time
+from collections import OrderedDict, deque
+
+from pump_events import MigrationEvent, TradeEvent, decode_event
+
+
+class SlidingStats:
+    """Mean and variance of the last `window` values, updated in O(1) (Welford add/remove)."""
+    __slots__ = ('values', 'mean', 'm2')
+
+    def __init__(self, window):
+        self.values = deque(maxlen=window)
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def __len__(self):
+        return len(self.values)
+
+    def push(self, x):
+        values = self.values
+        if len(values) == values.maxlen:
+            # Take the oldest value back out before the deque drops it
+            old = values[0]
+            n = len(values) - 1
+            if n == 0:
+                self.mean = self.m2 = 0.0
+            else:
+                old_mean = self.mean
+                self.mean = old_mean + (old_mean - old) / n
+                self.m2 = max(self.m2 - (old - old_mean) * (old - self.mean), 0.0)
+        values.append(x)
+        n = len(values)
+        delta = x - self.mean
+        self.mean += delta / n
+        self.m2 += delta * (x - self.mean)
+
+    @property
+    def std(self):
+        n = len(self.values)
+        return math.sqrt(self.m2 / (n - 1)) if n > 1 else 0.0
+
+    def zscore(self, x):
+        std = self.std
+        return (x - self.mean) / std if std > 0 else 0.0
+
+
+class Anomaly:
+    __slots__ = ('mint', 'kind', 'score', 'value', 'at')
+
+    def __init__(self, mint, kind, score, value, at):
+        self.mint = mint
+        self.kind = kind  # "pump", "dump", "volume_burst" or "trader_surge"
+        self.score = score
+        self.value = value
+        self.at = at
+
+    def __repr__(self):
+        return f"Anomaly({self.kind} {self.mint} score={self.score:.2f} value={self.value:.6g})"
+
+
+class MintWindow:
+    """Detector state of one mint; fixed size whatever the number of trades."""
+    __slots__ = ('last_price', 'returns', 'volume_mean', 'volume_var', 'trades', 'bucket_start',
+                 'bucket_traders', 'seen_traders', 'previous_bucket', 'last_alert')
+
+    def __init__(self, window, trader_memory):
+        self.last_price = None
+        self.returns = SlidingStats(window)
+        self.volume_mean = None  # EWMA of SOL per trade
+        self.volume_var = 0.0
+        self.trades = 0
+        self.bucket_start = None
+        self.bucket_traders = 0  # first-time traders in the current bucket
+        self.seen_traders = OrderedDict()  # recent trader hashes, capped at trader_memory
+        self.previous_bucket = 0
+        self.last_alert = {}
+
+
+class StreamDetector:
+    """Flags live pumps, dumps, volume bursts and trader surges, per mint, as trades arrive.
+
+    - pump / dump: the log price return of a trade is z_threshold standard deviations
+      from the mean of the mint's last `window` returns (sliding Welford statistics).
+    - volume_burst: the SOL of a trade is volume_z deviations above an exponentially
+      weighted mean and variance of the mint's trade sizes.
+    - trader_surge: first-time traders in the current bucket_seconds bucket reach
+      surge_ratio times the previous bucket's.
+
+    Every statistic is compared before the trade is added to it. A mint reports each
+    kind at most once per cooldown seconds, and past max_mints the least recently
+    traded mint is forgotten. No Qt here, so the dashboard and headless processes share it.
+    """
+
+    def __init__(self, window=50, z_threshold=4.0, volume_z=4.0, ewma_alpha=0.1, bucket_seconds=10.0,
+                 surge_ratio=3.0, min_trades=20, min_traders=5, cooldown=30.0, max_mints=10000,
+                 trader_memory=500, clock=time.time):
+        self.window = window
+        self.z_threshold = z_threshold
+        self.volume_z = volume_z
+        self.ewma_alpha = ewma_alpha
+        self.bucket_seconds = bucket_seconds
+        self.surge_ratio = surge_ratio
+        self.min_trades = min_trades
+        self.min_traders = min_traders
+        self.cooldown = cooldown
+        self.max_mints = max_mints
+        self.trader_memory = trader_memory
+        self.clock = clock
+        self.mints = OrderedDict()  # mint -> MintWindow, least recently traded first
+        self.trades_seen = 0
+        self.anomalies_found = 0
+
+    def update(self, event, now=None):
+        """Feeds one event; returns the anomalies it triggered (usually none)."""
+        event_type = type(event)
+        if event_type is MigrationEvent:
+            # Trades after migration come from an AMM pool with different dynamics
+            self.mints.pop(event.mint, None)
+            return []
+        if event_type is not TradeEvent or not event.mint or not event.v_tokens_in_bonding_curve:
+            return []
+        if now is None:
+            now = self.clock()
+        self.trades_seen += 1
+
+        state = self.mints.get(event.mint)
+        if state is None:
+            state = self.mints[event.mint] = MintWindow(self.window, self.trader_memory)
+            if len(self.mints) > self.max_mints:
+                self.mints.popitem(last=False)
+        else:
+            self.mints.move_to_end(event.mint)
+
+        found = []
+        state.trades += 1
+        warm = state.trades > self.min_trades
+
+        price = event.v_sol_in_bonding_curve / event.v_tokens_in_bonding_curve
+        if state.last_price and price > 0:
+            log_return = math.log(price / state.last_price)
+            if warm and len(state.returns) >= self.min_trades:
+                z = state.returns.zscore(log_return)
+                if abs(z) >= self.z_threshold:
+                    self._flag(found, state, event.mint, "pump" if z > 0 else "dump", z, log_return, now)
+            state.returns.push(log_return)
+        state.last_price = price
+
+        volume = event.sol_amount or 0.0
+        if state.volume_mean is None:
+            state.volume_mean = volume
+        else:
+            deviation = volume - state.volume_mean
+            std = math.sqrt(state.volume_var)
+            if warm and std > 0 and deviation / std >= self.volume_z:
+                self._flag(found, state, event.mint, "volume_burst", deviation / std, volume, now)
+            # Exponentially weighted mean and variance of the trade size
+            increment = self.ewma_alpha * deviation
+            state.volume_mean += increment
+            state.volume_var = (1 - self.ewma_alpha) * (state.volume_var + deviation * increment)
+
+        self._count_trader(found, state, event, now)
+        return found
+
+    def _count_trader(self, found, state, event, now):
+        if state.bucket_start is None:
+            state.bucket_start = now
+        elif now - state.bucket_start >= self.bucket_seconds:
+            # An empty bucket in between means the previous bucket had no traders
+            elapsed = int((now - state.bucket_start) // self.bucket_seconds)
+            state.previous_bucket = state.bucket_traders if elapsed == 1 else 0
+            state.bucket_traders = 0
+            state.bucket_start += elapsed * self.bucket_seconds
+
+        if not event.trader:
+            return
+        trader = hash(event.trader)
+        if trader in state.seen_traders:
+            state.seen_traders.move_to_end(trader)
+            return
+        state.seen_traders[trader] = None
+        if len(state.seen_traders) > self.trader_memory:
+            state.seen_traders.popitem(last=False)
+        state.bucket_traders += 1
+
+        threshold = max(self.min_traders, self.surge_ratio * state.previous_bucket)
+        if state.trades > self.min_trades and state.bucket_traders == math.ceil(threshold):
+            ratio = state.bucket_traders / max(state.previous_bucket, 1)
+            self._flag(found, state, event.mint, "trader_surge", ratio, state.bucket_traders, now)
+
+    def _flag(self, found, state, mint, kind, score, value, now):
+        last = state.last_alert.get(kind)
+        if last is not None and now - last < self.cooldown:
+            return
+        state.last_alert[kind] = now
+        self.anomalies_found += 1
+        found.append(Anomaly(mint, kind, score, value, now))
+
+    def stats(self):
+        return {
+            "mints": len(self.mints),
+            "trades": self.trades_seen,
+            "anomalies": self.anomalies_found,
+        }
+
+
+if __name__ == "__main__":
+    from feed_recorder import read_recording
+
+    parser = argparse.ArgumentParser(description="Run the stream detector over a recorded feed.")
+    parser.add_argument("recording", help="Folder of segments written by FeedRecorder")
+    parser.add_argument("--z-threshold", type=float, default=4.0)
+    parser.add_argument("--volume-z", type=float, default=4.0)
+    args = parser.parse_args()
+
+    detector = StreamDetector(z_threshold=args.z_threshold, volume_z=args.volume_z)
+    started = time.perf_counter()
+    for received_at, frame in read_recording(args.recording):
+        try:
+            event = decode_event(frame)
+        except ValueError:
+            continue
+        for anomaly in detector.update(event, now=received_at):
+            print(f"{time.strftime('%H:%M:%S', time.localtime(anomaly.at))} {anomaly!r}")
+    elapsed = time.perf_counter() - started
+    stats = detector.stats()
+    print(f"{stats['trades']} trades over {stats['mints']} mints, {stats['anomalies']} anomalies in {elapsed:.2f}s")
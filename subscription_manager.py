@@ -0,0 +1,81 @@
+import asyncio
+import time
+
+
+class SubscriptionManager:
+    """Keeps the token-trade subscriptions of one socket in line with a desired set of mints.
+
+    watch(), unwatch() and set_desired() only change the desired set; sync() sends the
+    difference against what the session is currently subscribed to, as batched
+    subscribeTokenTrade / unsubscribeTokenTrade frames of at most batch_size keys and
+    no more than one frame per min_interval seconds. Calls made while a sync is running
+    are folded into the frames it has still to send.
+
+    send(payload) is a coroutine returning whether the frame went out; if it did not,
+    the rest of the diff waits for the next sync().
+    """
+
+    def __init__(self, send, batch_size=100, min_interval=0.25, clock=time.monotonic):
+        self.send = send
+        self.batch_size = batch_size
+        self.min_interval = min_interval
+        self.clock = clock
+        self.desired = set()
+        self.current = set()
+        self.lock = asyncio.Lock()
+        self.last_frame_at = None
+        self.frames_sent = 0
+
+    def watch(self, mints):
+        self.desired.update(mint for mint in mints if mint)
+
+    def unwatch(self, mints):
+        self.desired.difference_update(mints)
+
+    def set_desired(self, mints):
+        self.desired = set(mint for mint in mints if mint)
+
+    def pending(self):
+        """(mints to subscribe, mints to unsubscribe) for the next sync."""
+        return self.desired - self.current, self.current - self.desired
+
+    async def sync(self):
+        async with self.lock:
+            while True:
+                to_add, to_remove = self.pending()
+                # Unsubscribing first keeps the server-side set from overshooting
+                if to_remove:
+                    method, keys = "unsubscribeTokenTrade", sorted(to_remove)[:self.batch_size]
+                elif to_add:
+                    method, keys = "subscribeTokenTrade", sorted(to_add)[:self.batch_size]
+                else:
+                    return
+                await self.wait_for_slot()
+                if not await self.send({"method": method, "keys": keys}):
+                    return
+                self.last_frame_at = self.clock()
+                self.frames_sent += 1
+                if method == "subscribeTokenTrade":
+                    self.current.update(keys)
+                else:
+                    self.current.difference_update(keys)
+
+    async def resubscribe(self):
+        """Subscribes a fresh session, which starts with no subscriptions, to the desired set."""
+        async with self.lock:
+            self.current.clear()
+            self.last_frame_at = None
+        await self.sync()
+
+    async def wait_for_slot(self):
+        if self.last_frame_at is not None:
+            delay = self.last_frame_at + self.min_interval - self.clock()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+    def stats(self):
+        return {
+            "desired": len(self.desired),
+            "subscribed": len(self.current),
+            "control_frames": self.frames_sent,
+        }
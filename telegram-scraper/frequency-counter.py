@@ -1,8 +1,13 @@
 import json
 import os
 import re
+import sys
 from collections import Counter
 
+# The channel parsers live with the dashboard, one folder up
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from alert_parser import CHANNEL_PARSERS, PARSERS
+
 def extract_ticker_name(message):
     """
     Extracts a potential ticker name from a message string for the COUNTING phase.
@@ -45,6 +50,29 @@ def extract_ticker_name(message):
 
     return None
 
+def extract_channel_ticker(message, channel):
+    """
+    Extracts the ticker of a message using the parser registered for its channel.
+
+    Channels with a registered format (see alert_parser.CHANNEL_PARSERS) are parsed
+    with that format only; its literal pre-filter skips non-matching messages without
+    running any regex. Other channels fall back to `extract_ticker_name`.
+
+    Args:
+        message (str): The message string to parse.
+        channel (str): The channel folder the message was scraped from.
+
+    Returns:
+        str or None: The ticker symbol in lowercase, or None if there is none.
+    """
+    parser_name = CHANNEL_PARSERS.get(channel)
+    if parser_name is None:
+        return extract_ticker_name(message)
+    if not isinstance(message, str):
+        return None
+    alert = PARSERS[parser_name].parse(message)
+    return alert[1].lower() if alert else None
+
 def extract_tickers_from_source(source_file_path):
     """
     Reads the specific source JSON file and extracts ticker names that appear
@@ -111,7 +139,7 @@ def count_target_tickers_recursive(root_directory, target_tickers, source_file_p
     """
     Recursively analyzes JSON files (excluding the source file) in a directory
     and counts occurrences of the pre-defined target tickers using the general
-    extraction logic (`extract_ticker_name`).
+    extraction logic (`extract_channel_ticker`).
 
     Args:
         root_directory (str): The path to the root directory to start searching from.
@@ -144,6 +172,7 @@ def count_target_tickers_recursive(root_directory, target_tickers, source_file_p
     normalized_exclude_path = os.path.normpath(source_file_path_to_exclude)
 
     for dirpath, dirnames, filenames in os.walk(root_directory):
+        channel = os.path.basename(dirpath)
         # Optional: Add print statement here if needed for debugging directory traversal
         # print(f"\nSearching in: {dirpath}")
         json_files_in_dir = [f for f in filenames if f.lower().endswith(".json")]
@@ -179,8 +208,8 @@ def count_target_tickers_recursive(root_directory, target_tickers, source_file_p
                         processed_entries += 1
                         if isinstance(entry, dict) and 'message' in entry:
                             message_content = entry.get('message')
-                            # Extract potential ticker from this message using general method
-                            ticker_in_message = extract_ticker_name(message_content)
+                            # Extract potential ticker using the channel's parser, or the general method
+                            ticker_in_message = extract_channel_ticker(message_content, channel)
                             # Check if it's one of the target tickers we're looking for
                             if ticker_in_message and ticker_in_message in target_tickers:
                                 ticker_counts[ticker_in_message] += 1
@@ -0,0 +1,116 @@
+import heapq
+import json
+import os
+from itertools import count
+
+CHUNK_SIZE = 1 << 16  # characters read per step
+WHITESPACE = " \t\r\n"
+SCALAR_ENDS = tuple(WHITESPACE + ",]}:")  # what may follow a complete number or literal
+
+
+def channel_name(path):
+    """telegram-scraper keeps each channel in <channel>/<channel>.json."""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def iter_json_messages(path, chunk_size=CHUNK_SIZE):
+    """Yields the message dicts of a telegram-scraper dump one at a time.
+
+    The dump is either a JSON list of messages or an object with a "messages" list.
+    Each message is decoded with raw_decode as soon as it is complete in the read
+    buffer, so memory stays at a chunk plus one message whatever the file size.
+    Raises ValueError if the file is not such a dump or ends mid-message.
+    """
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as f:
+        buffer = ""
+        pos = 0
+        eof = False
+
+        def fill():
+            # Drops what was consumed and appends the next chunk; False at end of file
+            nonlocal buffer, pos, eof
+            chunk = f.read(chunk_size)
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            eof = not chunk
+            return not eof
+
+        def skip_whitespace():
+            nonlocal pos
+            while True:
+                while pos < len(buffer) and buffer[pos] in WHITESPACE:
+                    pos += 1
+                if pos < len(buffer) or not fill():
+                    return
+
+        def decode(what):
+            # Decodes the JSON value at pos, reading on until it is complete
+            nonlocal pos
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    # Most likely the value continues in the next chunk
+                    if not fill():
+                        raise ValueError(f"{path} ends in the middle of {what}") from None
+                    continue
+                if not isinstance(value, (dict, list, str)) and buffer[end:end + 1] not in SCALAR_ENDS and not eof:
+                    # A number or literal cut by the chunk end ("12." of "12.5") decodes early;
+                    # it is only complete once the delimiter after it has been read
+                    if fill():
+                        continue
+                pos = end
+                if pos > chunk_size:
+                    fill()
+                return value
+
+        skip_whitespace()
+        if buffer[pos:pos + 1] == "{":
+            # Walks the wrapper object's members up to "messages"; the values before it are
+            # decoded and dropped, so a "messages" string inside one of them is not mistaken for the key
+            pos += 1
+            while True:
+                skip_whitespace()
+                if buffer[pos:pos + 1] == ",":
+                    pos += 1
+                    skip_whitespace()
+                if buffer[pos:pos + 1] != '"':
+                    raise ValueError(f"{path} has no \"messages\" list")
+                key = decode("a key")
+                skip_whitespace()
+                if buffer[pos:pos + 1] != ":":
+                    raise ValueError(f"{path} is not a JSON object")
+                pos += 1
+                skip_whitespace()
+                if key == "messages":
+                    break
+                decode(f"the {key!r} value")
+        if buffer[pos:pos + 1] != "[":
+            raise ValueError(f"{path} is not a JSON list of messages")
+        pos += 1
+
+        while True:
+            skip_whitespace()
+            if buffer[pos:pos + 1] == "]":
+                return
+            if buffer[pos:pos + 1] == ",":
+                pos += 1
+                skip_whitespace()
+            message = decode("a message")
+            if isinstance(message, dict):
+                yield message
+
+
+def newest(items, n, key):
+    """The n items with the largest key, largest first, holding only n at a time."""
+    heap = []
+    tiebreak = count()  # keeps equal keys from comparing the items themselves
+    for item in items:
+        entry = (key(item), next(tiebreak), item)
+        if len(heap) < n:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+    heap.sort(reverse=True)
+    return [item for _, _, item in heap]
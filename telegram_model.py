@@ -0,0 +1,189 @@
+from PyQt5.QtCore import QAbstractTableModel, QDateTime, QModelIndex, Qt
+from PyQt5.QtWidgets import QAbstractItemView, QHeaderView, QTableView
+
+from alert_parser import age_seconds, parse_messages
+from telegram_loader import newest
+
+COLUMNS = ("Date", "Coin", "Symbol", "Cap", "Age")
+FETCH_BATCH = 500  # rows handed to the view per fetchMore
+
+def message_rows(messages, channel=None):
+    """Parses a batch of message dicts into the model's (QDateTime, coin, symbol, cap, age, market_cap) rows.
+
+    The first five fields are the table's columns; market_cap is cap as a number (or
+    None), kept for sorting the Cap column.
+    """
+    return [(QDateTime.fromMSecsSinceEpoch(date_ms, Qt.UTC), coin, symbol, cap, age, market_cap)
+            for date_ms, coin, symbol, cap, market_cap, age in parse_messages(messages, channel)]
+
+
+def _number_or_lowest(value):
+    return float("-inf") if value is None else value
+
+
+# Sort key of each column, over a (QDateTime, coin, symbol, cap, age, market_cap) row
+SORT_KEYS = (
+    lambda row: row[0].toMSecsSinceEpoch(),
+    lambda row: row[1].casefold(),
+    lambda row: row[2].casefold(),
+    lambda row: _number_or_lowest(row[5]),
+    lambda row: _number_or_lowest(age_seconds(row[4])),
+)
+
+
+class TelegramMessageModel(QAbstractTableModel):
+    """Parsed Telegram alerts as a sortable table, for a QTableView.
+
+    Rows are kept as the raw message_rows tuples and only
+    formatted when the view asks for a visible cell. Added rows are held back and
+    handed to the view FETCH_BATCH at a time through fetchMore, so the view never
+    lays out more rows than have been scrolled to. Rows added while a sort is active
+    are merged into the sort order, and trim() caps the rows held.
+    """
+
+    def __init__(self, fetch_batch=FETCH_BATCH, parent=None):
+        super().__init__(parent)
+        self.fetch_batch = fetch_batch
+        self.rows = []
+        self.loaded = 0  # rows the view knows about, a prefix of self.rows
+        self.sort_column = None
+        self.sort_order = Qt.AscendingOrder
+        self.sort_keys = []  # key of each row for sort_column, in row order
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        value = self.rows[index.row()][index.column()]
+        if index.column() == 0:
+            return value.toString("yyyy-MM-dd hh:mm:ss")
+        return value
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.loaded < len(self.rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.fetch_batch, len(self.rows) - self.loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self.loaded, self.loaded + count - 1)
+        self.loaded += count
+        self.endInsertRows()
+
+    def add_rows(self, rows):
+        """Adds parsed rows; the first batch is shown at once, the rest on demand."""
+        if not rows:
+            return
+        self.rows.extend(rows)
+        if self.loaded < self.fetch_batch:
+            self.fetchMore()
+        if self.sort_column is not None:
+            # Keys are only computed for the new rows, and the rows already held are one
+            # sorted run, so this costs about a sort of the new rows
+            self.sort_keys.extend(map(SORT_KEYS[self.sort_column], rows))
+            self._sort_with_layout()
+
+    def trim(self, max_rows, key):
+        """Keeps only the max_rows rows with the largest key(row), in their current order."""
+        if len(self.rows) <= max_rows:
+            return
+        rows = self.rows
+        kept = set(newest(range(len(rows)), max_rows, lambda i: key(rows[i])))
+        # Rows past the loaded prefix are not in the view yet and simply go
+        tail = [i for i in range(self.loaded, len(rows)) if i in kept]
+        self.rows[self.loaded:] = [rows[i] for i in tail]
+        if self.sort_column is not None:
+            self.sort_keys[self.loaded:] = [self.sort_keys[i] for i in tail]
+        # Dropped rows the view knows about go in runs, last first so earlier positions hold
+        end = self.loaded
+        while end > 0:
+            if end - 1 in kept:
+                end -= 1
+                continue
+            start = end - 1
+            while start > 0 and start - 1 not in kept:
+                start -= 1
+            self.beginRemoveRows(QModelIndex(), start, end - 1)
+            del self.rows[start:end]
+            if self.sort_column is not None:
+                del self.sort_keys[start:end]
+            self.loaded -= end - start
+            self.endRemoveRows()
+            end = start
+        if self.loaded < self.fetch_batch:
+            self.fetchMore()
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self.rows = list(rows)
+        if self.sort_column is not None:
+            self.sort_keys = list(map(SORT_KEYS[self.sort_column], self.rows))
+            self._sort_rows()
+        self.loaded = min(self.fetch_batch, len(self.rows))
+        self.endResetModel()
+
+    def clear(self):
+        self.set_rows([])
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        if not 0 <= column < len(COLUMNS):
+            return
+        self.sort_column = column
+        self.sort_order = order
+        self.sort_keys = list(map(SORT_KEYS[column], self.rows))
+        self._sort_with_layout()
+
+    def _sort_with_layout(self):
+        # Re-sorts as a layout change, moving persistent indexes (selection, current cell) with their rows
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        order = self._sort_rows()
+        if persistent:
+            new_row = [0] * len(order)
+            for new, old in enumerate(order):
+                new_row[old] = new
+            moved = []
+            for index in persistent:
+                row = new_row[index.row()]
+                # A row sorted past the loaded prefix is no longer in the view
+                moved.append(self.index(row, index.column()) if row < self.loaded else QModelIndex())
+            self.changePersistentIndexList(persistent, moved)
+        self.layoutChanged.emit()
+
+    def _sort_rows(self):
+        # Sorts row positions by the cached keys, then reorders rows and keys to match;
+        # returns the old position of each new row
+        keys = self.sort_keys
+        order = sorted(range(len(keys)), key=keys.__getitem__, reverse=self.sort_order == Qt.DescendingOrder)
+        self.rows = list(map(self.rows.__getitem__, order))
+        self.sort_keys = list(map(keys.__getitem__, order))
+        return order
+
+
+def make_message_table(model):
+    """A QTableView over a TelegramMessageModel, newest alerts first."""
+    table = QTableView()
+    table.setModel(model)
+    table.setSelectionBehavior(QAbstractItemView.SelectRows)
+    table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+    table.setWordWrap(False)
+    table.setAlternatingRowColors(True)
+    table.verticalHeader().hide()
+    # Fixed row heights keep the view from measuring every row it lays out
+    table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+    table.horizontalHeader().setStretchLastSection(True)
+    table.horizontalHeader().setSortIndicator(0, Qt.DescendingOrder)
+    table.setSortingEnabled(True)
+    return table
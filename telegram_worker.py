@@ -0,0 +1,67 @@
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from telegram_loader import CHUNK_SIZE, iter_json_messages, newest
+
+CHUNK_MESSAGES = 5000  # messages read between two chunk signals
+
+
+class TelegramLoadSignals(QObject):
+    # rows parsed since the last chunk, messages read so far
+    chunk = pyqtSignal(list, int)
+    # messages read in total
+    finished = pyqtSignal(int)
+    failed = pyqtSignal(str)
+
+
+class TelegramLoadWorker(QRunnable):
+    """Streams a channel dump on a QThreadPool thread and hands rows back in chunks.
+
+    parse(messages) runs on the worker thread once per chunk of message dicts and
+    returns the rows parsed from them, so dates can be converted in bulk. With a limit,
+    each chunk is cut down to its `limit` largest rows by key before it is sent, so
+    the receiver only has to merge small chunks into its own top rows. The signals
+    live on a QObject created by the caller, so they are delivered on its thread.
+    """
+
+    def __init__(self, path, parse, limit=None, key=None, chunk_messages=CHUNK_MESSAGES, chunk_size=CHUNK_SIZE):
+        super().__init__()
+        self.path = path
+        self.parse = parse
+        self.limit = limit
+        self.key = key
+        self.chunk_messages = chunk_messages
+        self.chunk_size = chunk_size
+        self.signals = TelegramLoadSignals()
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    def send(self, rows, read):
+        if self.limit is not None:
+            rows = newest(rows, self.limit, self.key)
+        self.signals.chunk.emit(rows, read)
+
+    def run(self):
+        messages = []
+        read = 0
+        try:
+            for message in iter_json_messages(self.path, self.chunk_size):
+                if self.cancelled:
+                    return
+                read += 1
+                messages.append(message)
+                if read % self.chunk_messages == 0:
+                    self.send(self.parse(messages), read)
+                    messages = []
+        except FileNotFoundError:
+            self.signals.failed.emit(f"No Telegram dump at {self.path}")
+            return
+        except (OSError, ValueError) as e:
+            self.signals.failed.emit(f"Could not read {self.path}: {e}")
+            return
+        if self.cancelled:
+            return
+        if messages:
+            self.send(self.parse(messages), read)
+        self.signals.finished.emit(read)
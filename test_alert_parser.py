@@ -0,0 +1,120 @@
+import json
+
+import pytest
+from alert_parser import (
+    CHANNEL_PARSERS, PARSERS, AlertParser, age_seconds, cap_value, parse_alert, parse_dates, parse_messages,
+    parser_for, register_parser,
+)
+
+CORPUS_PATH = "alert_parser_corpus.json"
+
+
+# === Fixtures ===
+
+@pytest.fixture(scope="module")
+def corpus():
+    with open(CORPUS_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# === Tests ===
+
+def test_parses_alert_fields():
+    text = "🔔 CoinA COA | Marketcap: $1.2M | Age: 2 hours\nMarketcap: $1.2M\nAge: 2 hours"
+    assert parse_alert(text) == ("CoinA", "COA", "$1.2M", pytest.approx(1.2e6), "2 hours")
+    # One word is both coin and symbol; text before the bell still counts as the head
+    assert parse_alert("🔔 Solo | x")[:2] == ("Solo", "Solo")
+    assert parse_alert("New 🔔🔔 Pepe PEPE | 2x")[:2] == ("New", "PEPE")
+
+
+def test_non_alerts_keep_defaults():
+    assert parse_alert("No actual coin info here.") == ("N/A", "N/A", "N/A", None, "N/A")
+    assert parse_alert(None) == ("N/A", "N/A", "N/A", None, "N/A")
+    # A bell without a "|" on its line is not a head
+    assert parse_alert("🔔 AMA at 16:00\nToken | x")[:2] == ("N/A", "N/A")
+
+
+def test_bulk_dates():
+    millis = parse_dates(["2024-10-10T15:30:00", "2025-05-07 19:09:16", "invalid-date-string", None])
+    assert millis == [1728574200000, 1746644956000, -1, -1]
+    # The numpy path for scraper dates, and its fallback when one of them is bad
+    assert parse_dates(["2025-05-07 19:09:16", "2024-10-10T15:30:00"]) == [1746644956000, 1728574200000]
+    assert parse_dates(["2025-05-07 19:09:16", "2025-05-07 19:09:1x"]) == [1746644956000, -1]
+    assert parse_dates(["2024-10-10T17:30:00+02:00"]) == [1728574200000]
+
+
+def test_parse_messages_skips_unusable_messages():
+    rows = parse_messages([
+        {"date": "2024-10-10T15:30:00", "message": "🔔 CoinX XYZ | Marketcap: $100K | Age: 5 minutes"},
+        {"date": "invalid-date-string", "message": "🔔 CoinY Y | x"},
+        {"message": "no date"},
+        {"date": "2024-10-10T15:30:00"},
+    ])
+    assert rows == [(1728574200000, "CoinX", "XYZ", "$100K", 100000.0, "5 minutes")]
+
+
+def test_numeric_cap_and_age():
+    assert cap_value("$1,250k") == pytest.approx(1.25e6)
+    assert cap_value("$593B") == pytest.approx(5.93e11)
+    assert cap_value("N/A") is None
+    assert age_seconds("1h 20m") == 4800
+    assert age_seconds("3 months") == 3 * 30 * 86400
+    assert age_seconds("N/A") is None
+
+
+def test_regression_corpus(corpus):
+    # Rebuild with `python bench_alert_parser.py --build-corpus` when a change is intended
+    for entry in corpus:
+        rows = parse_messages([{"date": entry["date"], "message": entry["message"]}], entry["channel"])
+        expected = entry["expected"]
+        if expected is None:
+            assert rows == [], entry["message_id"]
+        else:
+            assert rows == [(expected["date_ms"], expected["coin"], expected["symbol"], expected["cap"],
+                             expected["market_cap"], expected["age"])], (entry["channel"], entry["message_id"])
+
+
+@pytest.mark.parametrize("channel, text, expected", [
+    ("DEXTNewPairsBot", "New pair at Uniswap V2 v2 \n\nMOO POO (MOOPOO/WETH)\n\nInitial Liquidity: $3,622",
+     ("MOO POO", "MOOPOO", "N/A", None, "N/A")),
+    ("binance_futures_5m_pump", "#DEGENUSDT price UP on 2.7% \nVolume up on 3323.8%",
+     ("DEGEN", "DEGEN", "N/A", None, "N/A")),
+    ("cmcal_bot", "🆕\xa0New Virtuals Protocol (VIRTUAL) event! \n \n07 May 2025",
+     ("Virtuals Protocol", "VIRTUAL", "N/A", None, "N/A")),
+    ("coindar", "🗓 Axie Infinity #AXS\n\nClassic Competitive 9", ("Axie Infinity", "AXS", "N/A", None, "N/A")),
+    ("Insider_ECA", "#SOL 🪙 🪙$BBW\n\nDyor/NFA 70K MCAP\n\nCA: 7orK", ("BBW", "BBW", "70K", 70000.0, "N/A")),
+    ("POSEIDON_DEGEN_CALLS", "🆕  🔔🔔🔔\n\n🪙 $pitcoin\n\n💰Mcap: 35K\n\n🦅DEXS",
+     ("pitcoin", "pitcoin", "35K", 35000.0, "N/A")),
+    ("Maestrosdegen", "SATO Buy!\n😎😎\n\n💵 0.192 ETH ($353.17)\n🔼 Market Cap $7,082,075",
+     ("SATO", "SATO", "$7,082,075", 7082075.0, "N/A")),
+])
+def test_channel_parsers(channel, text, expected):
+    assert parse_alert(text, channel) == expected
+
+
+def test_parsers_prefilter_on_markers():
+    calls = []
+
+    def parse_text(text):
+        calls.append(text)
+        return ("X", "X", "N/A", None, "N/A") if "X" in text else None
+
+    parser = AlertParser("test", ("🚀",), parse_text)
+    assert parser.parse("nothing here") is None
+    assert parser.parse("🚀 but no ticker") is None
+    assert parser.parse("🚀 X") == ("X", "X", "N/A", None, "N/A")
+    assert calls == ["🚀 but no ticker", "🚀 X"]
+    assert not parser.accepts("nothing here") and not parser.accepts(None)
+    assert parser.accepts("🚀 X")
+
+
+def test_register_parser_routes_channels():
+    try:
+        register_parser("test_rocket", ("🚀",), lambda text: ("R", "R", "N/A", None, "N/A"), channels=("RocketChannel",))
+        assert parser_for("RocketChannel").name == "test_rocket"
+        assert parse_alert("🚀 go", "RocketChannel")[:2] == ("R", "R")
+        # Unrouted channels keep the bell format
+        assert parser_for("SomeOtherChannel").name == "bell"
+    finally:
+        PARSERS.pop("test_rocket", None)
+        CHANNEL_PARSERS.pop("RocketChannel", None)
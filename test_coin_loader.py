@@ -0,0 +1,55 @@
+import asyncio
+import shutil
+import pytest
+from coin_loader import CoinLoader, list_coin_files
+
+
+# === Fixtures ===
+
+@pytest.fixture
+def coin_folder(tmp_path):
+    folder = tmp_path / "coins"
+    folder.mkdir()
+    for name in ["Dogecoin", "Shiba INU", "Husky"]:
+        shutil.copy(f"Meme Coin/{name}.csv", folder / f"{name}.csv")
+    (folder / "notes.txt").write_text("not a coin")
+    (folder / "Broken.csv").write_text("no,date,column\n1,2,3\n")
+    return str(folder)
+
+@pytest.fixture
+def loader(tmp_path):
+    loader = CoinLoader(str(tmp_path / "cache"), max_workers=2)
+    yield loader
+    loader.shutdown()
+
+
+# === Tests ===
+
+def test_list_coin_files(coin_folder):
+    names = [path.rsplit("/", 1)[-1] for path in list_coin_files(coin_folder)]
+    assert names == ["Broken.csv", "Dogecoin.csv", "Husky.csv", "Shiba INU.csv"]
+
+
+def test_load_folder_streams_coins_and_progress(coin_folder, loader):
+    seen = []
+    progress = []
+    result = asyncio.run(loader.load_folder(
+        coin_folder,
+        on_coin=lambda name, df: seen.append(name),
+        on_progress=lambda done, total: progress.append((done, total)),
+    ))
+
+    assert sorted(result) == ["Dogecoin", "Husky", "Shiba INU"]
+    assert sorted(seen) == sorted(result)
+    # Broken.csv still counts towards progress
+    assert progress[0] == (0, 4)
+    assert progress[-1] == (4, 4)
+
+
+def test_second_load_is_served_from_cache(coin_folder, loader):
+    first = asyncio.run(loader.load_folder(coin_folder))
+    hits_before = loader.cache.hits
+    second = asyncio.run(loader.load_folder(coin_folder))
+
+    assert loader.cache.hits - hits_before == 3
+    assert second["Dogecoin"].equals(first["Dogecoin"])
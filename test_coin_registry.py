@@ -0,0 +1,72 @@
+import pytest
+from coin_registry import CoinRegistry
+from pump_events import CreateEvent
+
+
+# === Fixtures ===
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+def coin(mint, symbol):
+    return CreateEvent({"txType": "create", "mint": mint, "symbol": symbol, "name": symbol.title()})
+
+
+# === Tests ===
+
+def test_find_symbol_is_case_insensitive():
+    registry = CoinRegistry()
+    registry.add(coin("m1", "Pepe"))
+    registry.add(coin("m2", "PEPE"))
+    registry.add(coin("m3", "DOGE"))
+    assert [c.mint for c in registry.find_symbol("pepe")] == ["m1", "m2"]
+    assert registry.find_symbol("SHIB") == []
+
+
+def test_first_create_event_wins():
+    registry = CoinRegistry()
+    registry.add(coin("m1", "PEPE"))
+    registry.add(coin("m1", "OTHER"))
+    assert registry.get("m1").symbol == "PEPE"
+    assert registry.find_symbol("OTHER") == []
+
+
+def test_find_prefix_and_suggestions():
+    registry = CoinRegistry()
+    for i, symbol in enumerate(["PEPE", "PEPE2", "PENGU", "POPCAT", "BONK"]):
+        registry.add(coin(f"m{i}", symbol))
+    assert [c.symbol for c in registry.find_prefix("pep")] == ["PEPE", "PEPE2"]
+    assert [c.symbol for c in registry.find_prefix("P", limit=2)] == ["PENGU", "PEPE"]
+    assert "PEPE" in registry.suggest_symbols("PEEP")
+
+
+def test_lru_cap_evicts_least_recently_used():
+    registry = CoinRegistry(max_coins=2)
+    registry.add(coin("m1", "AAA"))
+    registry.add(coin("m2", "BBB"))
+    registry.find_symbol("AAA")  # m1 is now the most recently used
+    registry.add(coin("m3", "CCC"))
+
+    assert "m1" in registry and "m3" in registry and "m2" not in registry
+    assert registry.find_symbol("BBB") == []
+    assert "BBB" not in registry.sorted_symbols
+    assert registry.stats() == {"coins": 2, "symbols": 2, "evicted": 1}
+
+
+def test_ttl_expires_unseen_coins(clock):
+    registry = CoinRegistry(ttl=60, clock=clock)
+    registry.add(coin("m1", "OLD"))
+    clock.now = 30
+    registry.add(coin("m2", "NEW"))
+    clock.now = 70
+    assert registry.find_symbol("OLD") == []
+    assert [c.mint for c in registry.find_symbol("NEW")] == ["m2"]
+    assert len(registry) == 1
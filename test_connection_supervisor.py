@@ -0,0 +1,90 @@
+import asyncio
+import json
+import websockets
+from connection_supervisor import ConnectionSupervisor
+
+
+# === Fixtures ===
+
+class FakePumpPortal:
+    """Records every control frame and drops the first session after one message."""
+
+    def __init__(self):
+        self.sessions = []
+        self.active = 0
+        self.max_active = 0
+
+    async def handler(self, websocket):
+        frames = []
+        self.sessions.append(frames)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await websocket.send(json.dumps({"txType": "create", "mint": f"mint{len(self.sessions)}"}))
+            if len(self.sessions) == 1:
+                frames.append(json.loads(await websocket.recv()))
+                frames.append(json.loads(await websocket.recv()))
+                return
+            async for frame in websocket:
+                frames.append(json.loads(frame))
+        finally:
+            self.active -= 1
+
+
+async def run_against_fake_portal(check):
+    portal = FakePumpPortal()
+    async with websockets.serve(portal.handler, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        messages = []
+        supervisor = ConnectionSupervisor(messages.append, uri=f"ws://127.0.0.1:{port}",
+                                          base_delay=0.01, max_delay=0.05, ping_interval=0.05)
+        try:
+            await check(portal, supervisor, messages)
+        finally:
+            await supervisor.stop()
+
+
+async def wait_for(condition, timeout=5.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+# === Tests ===
+
+def test_backoff_grows_with_jitter():
+    supervisor = ConnectionSupervisor(print, base_delay=1.0, max_delay=8.0)
+    for attempt, ceiling in [(0, 1), (1, 2), (2, 4), (3, 8), (10, 8)]:
+        delay = supervisor.backoff_delay(attempt)
+        assert ceiling / 2 <= delay <= ceiling
+
+
+def test_reconnects_and_replays_subscriptions():
+    async def check(portal, supervisor, messages):
+        supervisor.token_keys.add("MintA")
+        first = supervisor.start()
+        assert supervisor.start() is first  # no second session
+
+        await wait_for(lambda: supervisor.connection_count == 2 and len(portal.sessions[1]) == 3)
+        await supervisor.subscribe_tokens(["MintB", "MintA"])
+        await wait_for(lambda: len(portal.sessions[1]) == 4)
+
+        assert portal.sessions[1][:2] == [{"method": "subscribeMigration"}, {"method": "subscribeNewToken"}]
+        assert portal.sessions[1][2] == {"method": "subscribeTokenTrade", "keys": ["MintA"]}
+        assert portal.sessions[1][3] == {"method": "subscribeTokenTrade", "keys": ["MintB"]}
+        assert supervisor.reconnect_count == 1
+        assert portal.max_active == 1
+        assert supervisor.open_connections == 1
+        assert [json.loads(m)["mint"] for m in messages] == ["mint1", "mint2"]
+
+    asyncio.run(run_against_fake_portal(check))
+
+
+def test_measures_ping_rtt():
+    async def check(portal, supervisor, messages):
+        supervisor.start()
+        await wait_for(lambda: supervisor.ping_rtt is not None)
+        assert supervisor.stats()["ping_rtt_ms"] >= 0
+
+    asyncio.run(run_against_fake_portal(check))
@@ -0,0 +1,78 @@
+import os
+import pytest
+import pandas as pd
+from csv_cache import CsvCache, parse_coin_csv
+
+
+# === Fixtures ===
+
+@pytest.fixture
+def coin_csv(tmp_path):
+    path = tmp_path / "CoinA.csv"
+    path.write_text(
+        "Date,Open,High,Low,Close,Volume,Market Cap\n"
+        "02-01-2021,1,2,1,2,100,1000\n"
+        "01-01-2021,1,1,1,1,50,500\n"
+    )
+    return str(path)
+
+@pytest.fixture
+def cache(tmp_path):
+    return CsvCache(str(tmp_path / "cache"))
+
+
+# === Tests ===
+
+def test_parse_coin_csv_types(coin_csv):
+    df = parse_coin_csv(coin_csv)
+    assert df.index.name == "Date"
+    assert pd.api.types.is_datetime64_any_dtype(df.index)
+    assert df['Close'].dtype == 'float64'
+    assert df['Volume'].dtype == 'float64'
+
+
+def test_cache_hit_after_first_load(coin_csv, cache):
+    first = cache.load(coin_csv)
+    second = cache.load(coin_csv)
+    assert (cache.misses, cache.hits) == (1, 1)
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_cache_reparses_changed_file(coin_csv, cache):
+    cache.load(coin_csv)
+    with open(coin_csv, "a") as f:
+        f.write("31-12-2020,1,1,1,0.5,10,100\n")
+    os.utime(coin_csv, ns=(0, 10**18))
+
+    df = cache.load(coin_csv)
+    assert cache.misses == 2
+    assert len(df) == 3
+    # The entry for the old version is replaced, not kept alongside
+    assert len([n for n in os.listdir(cache.cache_dir) if n.endswith(cache.extension)]) == 1
+
+
+def test_cache_recovers_from_corrupt_entry(coin_csv, cache):
+    cache.load(coin_csv)
+    with open(cache.entry_path(coin_csv), "wb") as f:
+        f.write(b"not a frame")
+
+    df = cache.load(coin_csv)
+    assert cache.misses == 2
+    assert list(df['Close']) == [2.0, 1.0]
+
+
+def test_prune_folder_drops_deleted_and_changed_files(coin_csv, tmp_path, cache):
+    other = tmp_path / "CoinB.csv"
+    other.write_text(open(coin_csv).read())
+    cache.load(coin_csv)
+    cache.load(str(other))
+    kept = cache.entry_path(coin_csv)
+    legacy = os.path.join(cache.cache_dir, "0123456789abcdef0123-12-34" + cache.extension)
+    open(legacy, "wb").close()
+
+    os.remove(other)
+    assert cache.prune_folder(str(tmp_path)) == 2
+    assert os.listdir(cache.cache_dir) == [os.path.basename(kept)]
+    # Untouched files keep their entries
+    cache.load(coin_csv)
+    assert cache.hits == 1
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from downsample import lttb, minmax_envelope, thin_points, visible_range
+
+
+# === Fixtures ===
+
+@pytest.fixture
+def series():
+    x = np.arange(100_000, dtype='float64')
+    y = np.random.default_rng(2).normal(0, 1, len(x)).cumsum()
+    y[54_321] += 1_000  # a spike that has to survive downsampling
+    return x, y
+
+
+# === Tests ===
+
+def test_minmax_envelope_keeps_extremes(series):
+    x, y = series
+    dx, dy = minmax_envelope(x, y, 500)
+    assert len(dx) <= 2 * 500 + 2
+    assert dy.max() == y.max()
+    assert dy.min() == y.min()
+    assert (dx[0], dx[-1]) == (x[0], x[-1])
+    assert np.all(np.diff(dx) > 0)
+
+
+def test_small_series_pass_through(series):
+    x, y = series[0][:50], series[1][:50]
+    assert minmax_envelope(x, y, 500)[0] is x
+    assert lttb(x, y, 500)[0] is x
+
+
+def test_lttb_returns_requested_size(series):
+    x, y = series
+    dx, dy = lttb(x, y, 1000)
+    assert len(dx) == 1000
+    assert (dx[0], dx[-1]) == (x[0], x[-1])
+    assert np.all(np.diff(dx) > 0)
+    assert 54_321 in dx
+
+
+def test_visible_range_includes_neighbours(series):
+    x, _ = series
+    assert visible_range(x, 10.5, 20.5) == (10, 22)
+    assert visible_range(x, -5, 3) == (0, 5)
+
+
+def test_thin_points_keeps_heaviest_per_slot():
+    x = np.array([0.0, 0.1, 0.2, 5.0, 5.1, 9.9])
+    weight = np.array([1.0, 3.0, 2.0, 1.0, 0.5, 4.0])
+    keep = thin_points(x, weight, 0, 10, 2)
+    assert list(keep) == [1, 5]
+    assert list(thin_points(x, weight, 0, 10, 100)) == list(range(6))
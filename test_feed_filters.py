@@ -0,0 +1,82 @@
+import json
+
+import pytest
+from feed_filters import FeedFilter, compile_rule, load_rules
+from feed_worker import FeedWorker
+from pump_events import CreateEvent, StatusEvent, TradeEvent
+
+
+# === Fixtures ===
+
+def create(name="Pepe", symbol="PEPE", market_cap_sol=40.0, trader="alice", pool="pump"):
+    return CreateEvent({"txType": "create", "mint": f"{symbol}-mint", "name": name, "symbol": symbol,
+                        "marketCapSol": market_cap_sol, "traderPublicKey": trader, "pool": pool})
+
+@pytest.fixture
+def feed_filter():
+    return FeedFilter([
+        {"name": "caps", "field": "market_cap_sol", "min": 30, "max": 500},
+        {"name": "no rugs", "field": "name", "regex": r"rug|scam", "exclude": True},
+        {"name": "no known ruggers", "field": "trader", "not_in": ["mallory"]},
+        {"name": "pump pool", "field": "pool", "in": ["pump"]},
+    ])
+
+
+# === Tests ===
+
+def test_rules_keep_only_matching_creates(feed_filter):
+    assert feed_filter(create())
+    assert not feed_filter(create(market_cap_sol=10.0))
+    assert not feed_filter(create(name="Totally Not A RUG"))
+    assert not feed_filter(create(trader="mallory"))
+    assert not feed_filter(create(pool="bonk"))
+    # Rules only look at creates by default
+    assert feed_filter(TradeEvent({"txType": "buy", "mint": "m", "marketCapSol": 1.0}))
+    assert feed_filter(StatusEvent({"message": "Successfully subscribed"}))
+
+
+def test_per_rule_counters(feed_filter):
+    for event in [create(), create(market_cap_sol=1.0), create(market_cap_sol=2.0), create(name="scam")]:
+        feed_filter(event)
+    stats = feed_filter.stats()
+    assert (stats["passed"], stats["rejected"]) == (1, 3)
+    assert [(r["name"], r["checked"], r["rejected"]) for r in stats["rules"]] == [
+        ("caps", 4, 2), ("no rugs", 2, 1), ("no known ruggers", 1, 0), ("pump pool", 1, 0)]
+
+
+@pytest.mark.parametrize("spec", [
+    {"field": "colour", "in": ["red"]},
+    {"field": "name", "min": 1},
+    {"field": "name", "regex": "("},
+    {"field": "name"},
+    {"field": "name", "regex": "x", "events": ["buy"]},
+    {"field": "market_cap_sol", "in": 5},
+    {"field": "symbol", "in": "PEPE"},
+    {"field": "symbol", "not_in": [["PEPE"]]},
+    {"field": "market_cap_sol", "min": [30]},
+    {"field": "name", "regex": 5},
+    {"field": "name", "regex": "x", "events": 5},
+    ["field", "name"],
+    "name",
+])
+def test_bad_rules_are_refused(spec):
+    with pytest.raises(ValueError):
+        compile_rule(spec)
+
+
+def test_load_rules(tmp_path):
+    assert not load_rules(tmp_path / "missing.json")
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps([{"field": "symbol", "regex": "^PE"}]))
+    feed_filter = load_rules(path)
+    assert feed_filter(create()) and not feed_filter(create(symbol="DOGE"))
+
+
+def test_worker_drops_rejected_events_before_queueing():
+    worker = FeedWorker(feed_filter=FeedFilter([{"field": "market_cap_sol", "min": 30}]))
+    worker.handle_message(json.dumps({"txType": "create", "mint": "a", "marketCapSol": 10.0}))
+    worker.handle_message(json.dumps({"txType": "create", "mint": "b", "marketCapSol": 50.0}))
+    worker.handle_message("{not json")
+    assert [event if isinstance(event, str) else event.mint for _, event in worker.drain()] == [
+        "b", "Error decoding JSON: {not json"]
+    assert worker.stats()["filtered"] == 1
@@ -0,0 +1,57 @@
+import pytest
+from PyQt5.QtCore import Qt
+from feed_model import FeedModel
+
+
+# === Fixtures ===
+
+@pytest.fixture
+def model(qapp):
+    return FeedModel(retention=5)
+
+def trade(i):
+    return (f"Coin{i}", f"C{i}", 1.5, 30.0, f"sig{i}")
+
+
+# === Tests ===
+
+def test_rows_appear_only_after_flush(model):
+    model.append(trade(1))
+    assert model.rowCount() == 0
+    assert model.flush() == 1
+    assert model.rowCount() == 1
+    assert model.flush() == 0
+
+
+def test_flush_inserts_batch_once(model, qtbot):
+    inserts = []
+    model.rowsInserted.connect(lambda parent, first, last: inserts.append((first, last)))
+    for i in range(3):
+        model.append(trade(i))
+    model.flush()
+    assert inserts == [(0, 2)]
+
+
+def test_retention_drops_oldest_rows(model):
+    for i in range(4):
+        model.append(trade(i))
+    model.flush()
+    for i in range(4, 12):
+        model.append(trade(i))
+    model.flush()
+
+    assert model.rowCount() == 5
+    first = model.data(model.index(0))
+    last = model.data(model.index(4))
+    assert first.startswith("Coin7 (C7)")
+    assert last.startswith("Coin11 (C11)")
+    assert model.received == 12
+
+
+def test_status_rows_and_formatting(model):
+    model.append("Error decoding JSON: {")
+    model.append(trade(1))
+    model.flush()
+    assert model.data(model.index(0)) == "Error decoding JSON: {"
+    assert model.data(model.index(1)) == "Coin1 (C1)  SOL: 1.50  Cap: 30.00  Sig: sig1"
+    assert model.data(model.index(1), Qt.ToolTipRole) is None
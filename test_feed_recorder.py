@@ -0,0 +1,64 @@
+import gzip
+import json
+
+import pytest
+from feed_recorder import FeedRecorder, list_segments, read_recording, read_segment
+
+
+# === Fixtures ===
+
+def frame(i):
+    return json.dumps({"txType": "create", "mint": f"mint{i}", "name": "Café"})
+
+@pytest.fixture
+def recorder(tmp_path):
+    recorder = FeedRecorder(tmp_path, compression="gzip", flush_interval=0.01)
+    yield recorder
+    recorder.stop()
+
+
+# === Tests ===
+
+def test_frames_round_trip_with_receive_times(recorder, tmp_path):
+    recorder.start()
+    for i in range(100):
+        recorder.record(frame(i), received_at=1000.0 + i)
+    recorder.record(b"{not json", received_at=2000.0)
+    recorder.stop()
+
+    records = list(read_recording(tmp_path))
+    assert len(records) == 101
+    assert records[0] == (1000.0, frame(0))
+    assert records[-1] == (2000.0, "{not json")
+    assert recorder.stats()["recorded"] == 101
+    assert recorder.dropped == 0
+
+
+def test_segments_rotate_by_size(tmp_path):
+    recorder = FeedRecorder(tmp_path, compression="gzip", max_bytes=1000)
+    for i in range(50):
+        recorder.record(frame(i), received_at=float(i))
+        if i % 5 == 4:
+            recorder.write_pending()
+    recorder.close_segment()
+
+    segments = list_segments(tmp_path)
+    assert len(segments) > 1
+    assert [t for t, _ in read_recording(tmp_path)] == [float(i) for i in range(50)]
+
+
+def test_backlog_past_limit_drops_oldest(tmp_path):
+    recorder = FeedRecorder(tmp_path, compression="gzip", max_pending=10)
+    for i in range(25):
+        recorder.record(frame(i), received_at=float(i))
+    assert recorder.dropped == 15
+    recorder.write_pending()
+    recorder.close_segment()
+    assert [t for t, _ in read_recording(tmp_path)][0] == 15.0
+
+
+def test_truncated_segment_reads_complete_lines(tmp_path):
+    path = tmp_path / "feed-20240101-000000-1-0001.jsonl.gz"
+    with gzip.open(path, "wb") as f:
+        f.write(b'{"t": 1.0, "frame": "a"}\n{"t": 2.0, "fra')
+    assert list(read_segment(str(path))) == [(1.0, "a")]
@@ -0,0 +1,88 @@
+import asyncio
+import json
+import threading
+import time
+import pytest
+import websockets
+from feed_worker import DropOldestQueue, FeedWorker
+
+
+# === Fixtures ===
+
+@pytest.fixture
+def portal_uri():
+    """A local websocket server on its own thread that sends four frames per session."""
+    ready = threading.Event()
+    state = {}
+
+    async def handler(websocket):
+        for i in range(3):
+            await websocket.send(json.dumps({"txType": "create", "mint": f"mint{i}"}))
+        await websocket.send(json.dumps({"unrelated": True}))  # not queued
+        await websocket.send("{not json")
+        await websocket.wait_closed()
+
+    async def serve():
+        async with websockets.serve(handler, "127.0.0.1", 0) as server:
+            state["port"] = server.sockets[0].getsockname()[1]
+            state["stop"] = asyncio.get_running_loop().create_future()
+            state["loop"] = asyncio.get_running_loop()
+            ready.set()
+            await state["stop"]
+
+    thread = threading.Thread(target=asyncio.run, args=(serve(),), daemon=True)
+    thread.start()
+    ready.wait(5)
+    yield f"ws://127.0.0.1:{state['port']}"
+    state["loop"].call_soon_threadsafe(state["stop"].set_result, None)
+    thread.join(5)
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+# === Tests ===
+
+def test_drop_oldest_queue():
+    queue = DropOldestQueue(3)
+    for i in range(5):
+        queue.put(i)
+    assert queue.dropped == 2
+    assert queue.drain(2) == [2, 3]
+    assert queue.drain() == [4]
+    assert len(queue) == 0
+
+
+def test_worker_decodes_off_thread(portal_uri):
+    worker = FeedWorker(uri=portal_uri, queue_size=100)
+    worker.start()
+    try:
+        wait_for(lambda: len(worker.queue) == 4)
+        batch = worker.drain()
+        assert [event.mint for _, event in batch[:3]] == ["mint0", "mint1", "mint2"]
+        assert batch[3][1] == "Error decoding JSON: {not json"
+
+        stats = worker.stats()
+        assert stats["received"] == 5
+        assert stats["decode_errors"] == 1
+        assert stats["queue_depth"] == 0
+        assert stats["lag_ms"] >= 0
+        assert stats["open_connections"] == 1
+    finally:
+        worker.stop()
+    assert not worker.is_alive()
+
+
+def test_worker_drops_oldest_when_consumer_is_slow(portal_uri):
+    worker = FeedWorker(uri=portal_uri, queue_size=2)
+    worker.start()
+    try:
+        wait_for(lambda: worker.received == 5)
+        assert worker.stats()["dropped"] == 2
+        assert [event for _, event in worker.drain()][-1] == "Error decoding JSON: {not json"
+    finally:
+        worker.stop()
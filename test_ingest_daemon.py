@@ -0,0 +1,113 @@
+import asyncio
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+import websockets
+from feed_recorder import read_recording
+from coin_registry import CoinRegistry
+from ingest_daemon import IngestDaemon, RelayClient
+from registry_snapshot import RegistrySnapshot
+from replay_server import ReplayServer, synthetic_frames
+
+
+# === Fixtures ===
+
+@pytest.fixture
+def upstream():
+    server = ReplayServer(synthetic_frames(coins=30, trades_per_coin=0, rate=2000.0), speed=1.0, settle=0.05)
+    uri = server.start_in_thread()
+    yield uri
+    server.stop_thread()
+
+
+async def wait_for(condition, timeout=5.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+# === Tests ===
+
+def test_daemon_ingests_records_and_relays(upstream, tmp_path):
+    daemon = IngestDaemon(uri=upstream, status_path=str(tmp_path / "status.json"), relay_port=0,
+                          record_dir=str(tmp_path / "rec"), snapshot_dir=str(tmp_path / "snap"),
+                          stats_interval=0.05)
+
+    async def check():
+        task = asyncio.ensure_future(daemon.run())
+        await wait_for(lambda: daemon.relay is not None)
+        relayed = []
+        async with websockets.connect(f"ws://127.0.0.1:{daemon.relay_port}") as client:
+            await client.send(json.dumps({"method": "subscribeNewToken"}))
+            await wait_for(lambda: len(daemon.registry) == 30)
+            await client.send(json.dumps({"method": "subscribeTokenTrade", "keys": ["some-mint"]}))
+            await wait_for(lambda: daemon.supervisor.token_keys == {"some-mint"})
+            try:
+                while True:
+                    relayed.append(json.loads(await asyncio.wait_for(client.recv(), 0.3)))
+            except asyncio.TimeoutError:
+                pass
+        daemon.stopping.set()
+        await task
+        return relayed
+
+    relayed = asyncio.run(check())
+    assert relayed[0]["message"].startswith("Successfully")
+    assert all("message" in frame or frame["txType"] == "create" for frame in relayed)
+
+    status = json.loads((tmp_path / "status.json").read_text())
+    assert status["coins"] == 30 and status["created"] == 30 and len(status["top"]) == 20
+    assert len(list(read_recording(tmp_path / "rec"))) >= 30
+    assert (tmp_path / "snap" / "coins.npy").exists()
+
+
+def test_relay_sync_keeps_restored_subscriptions(tmp_path):
+    RegistrySnapshot(str(tmp_path)).save(CoinRegistry(), ["restored-mint"])
+    daemon = IngestDaemon(uri="ws://127.0.0.1:9", snapshot_dir=str(tmp_path))
+    client = RelayClient(None)
+    client.keys.add("client-mint")
+
+    async def check():
+        daemon.clients.add(client)
+        await daemon.sync_relay_keys()
+        with_client = set(daemon.supervisor.token_keys)
+        daemon.clients.discard(client)
+        await daemon.sync_relay_keys()
+        return with_client, set(daemon.supervisor.token_keys)
+
+    with_client, without_client = asyncio.run(check())
+    assert with_client == {"restored-mint", "client-mint"}
+    assert without_client == {"restored-mint"}
+    daemon.save_snapshot()
+    assert RegistrySnapshot(str(tmp_path)).subscriptions() == ["restored-mint"]
+
+
+class BrokenRelaySocket:
+    """Sends one subscribe, fails every write, then closes."""
+
+    def __init__(self):
+        self.sent = asyncio.Event()
+
+    async def __aiter__(self):
+        yield json.dumps({"method": "subscribeNewToken"})
+        await self.sent.wait()
+
+    async def send(self, raw):
+        self.sent.set()
+        raise RuntimeError("send failed")
+
+
+def test_relay_writer_errors_are_reported(capsys):
+    daemon = IngestDaemon(uri="ws://127.0.0.1:9", snapshot_dir=None)
+    asyncio.run(daemon.handle_relay_client(BrokenRelaySocket()))
+    assert "Relay client writer failed: RuntimeError('send failed')" in capsys.readouterr().out
+    assert not daemon.clients
+
+
+def test_daemon_does_not_import_qt():
+    code = "import sys, ingest_daemon; assert not any(m.startswith('PyQt5') for m in sys.modules)"
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pump_detection import (
+    DetectionCache, build_close_frame, price_changes, detect_events, detect_coin_events,
+    screen_coins, zscores
+)
+
+
+# === Fixtures ===
+
+@pytest.fixture
+def coin_data():
+    dates = pd.date_range("2021-01-01", periods=60, freq="D")
+    rng = np.random.default_rng(0)
+    calm = 10 + rng.normal(0, 0.05, len(dates)).cumsum()
+    spiky = calm.copy()
+    spiky[40] += 5  # one-day pump that reverts the next day
+    # Files are stored newest first, like the "Meme Coin" CSVs
+    return {
+        'Calm': pd.DataFrame({'Close': calm[::-1]}, index=pd.Index(dates[::-1], name='Date')),
+        'Spiky': pd.DataFrame({'Close': spiky[::-1]}, index=pd.Index(dates[::-1], name='Date')),
+        'Late': pd.DataFrame({'Close': [1.0, 2.0, 4.0]}, index=pd.Index(dates[-3:], name='Date')),
+    }
+
+
+# === Tests ===
+
+def test_build_close_frame_aligns_chronologically(coin_data):
+    closes = build_close_frame(coin_data)
+    assert list(closes.columns) == ['Calm', 'Spiky', 'Late']
+    assert closes.index.is_monotonic_increasing
+    assert closes['Late'].notna().sum() == 3
+
+
+def test_price_changes_ignore_alignment_gaps(coin_data):
+    changes = price_changes(build_close_frame(coin_data))
+    assert list(changes['Late'].dropna()) == [1.0, 2.0]
+
+
+def test_global_mode_matches_per_coin_rule(coin_data):
+    df = coin_data['Spiky'].sort_index()
+    change = df['Close'].diff()
+    expected_pumps = change[change > change.mean() + 0.5 * change.std()].index
+    expected_dumps = change[change < change.mean() - 0.5 * change.std()].index
+
+    events = detect_events(build_close_frame(coin_data))['Spiky']
+    assert list(events[events['kind'] == 'pump'].index) == list(expected_pumps)
+    assert list(events[events['kind'] == 'dump'].index) == list(expected_dumps)
+
+
+@pytest.mark.parametrize("mode", ["rolling", "multiscale"])
+def test_windowed_modes_find_the_spike(coin_data, mode):
+    events = detect_events(build_close_frame(coin_data), threshold_multiplier=4, mode=mode,
+                           window=20, windows=(5, 20))['Spiky']
+    spike_date = pd.Timestamp("2021-02-10")
+    assert events.loc[spike_date, 'kind'] == 'pump'
+    assert events.loc[spike_date + pd.Timedelta(days=1), 'kind'] == 'dump'
+
+
+def test_coins_without_events_get_empty_frames(coin_data):
+    events = detect_events(build_close_frame(coin_data), threshold_multiplier=100)
+    assert set(events) == {'Calm', 'Spiky', 'Late'}
+    assert all(frame.empty for frame in events.values())
+
+
+def test_detect_coin_events_leaves_frame_untouched(coin_data):
+    df = coin_data['Spiky']
+    before = df.copy()
+    detect_coin_events(df)
+    pd.testing.assert_frame_equal(df, before)
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        zscores(pd.DataFrame({'A': [1.0, 2.0]}), mode="median")
+
+
+def test_screen_coins_ranks_by_events(coin_data):
+    summary = screen_coins(coin_data, threshold_multiplier=3, mode="rolling", window=20)
+    assert summary.index[0] == 'Spiky'
+    assert summary.loc['Spiky', 'pumps'] >= 1
+
+
+def test_detection_cache_memoizes_by_coin_and_threshold(coin_data):
+    cache = DetectionCache()
+    first = cache.events('Spiky', coin_data['Spiky'], 0.5)
+    again = cache.events('Spiky', coin_data['Spiky'], 0.5)
+    assert again is first
+    assert (cache.hits, cache.misses) == (1, 1)
+    pd.testing.assert_frame_equal(first, detect_coin_events(coin_data['Spiky'], 0.5))
+
+
+def test_detection_cache_reuses_scores_across_thresholds(coin_data):
+    cache = DetectionCache()
+    cache.events('Spiky', coin_data['Spiky'], 0.5)
+    scores = cache._coin_scores('Spiky', coin_data['Spiky'], ("global", 30, (7, 30, 90)))
+    cache.events('Spiky', coin_data['Spiky'], 2.0)
+    assert cache._coin_scores('Spiky', coin_data['Spiky'], ("global", 30, (7, 30, 90))) is scores
+
+
+def test_detection_cache_is_bounded(coin_data):
+    cache = DetectionCache(max_coins=2, max_results=3)
+    for threshold in [0.5, 1.0, 1.5, 2.0]:
+        for coin in coin_data:
+            cache.events(coin, coin_data[coin], threshold)
+    assert len(cache._scores) == 2
+    assert len(cache._events) == 3
@@ -0,0 +1,64 @@
+import json
+import pytest
+import pump_events
+from pump_events import (
+    CreateEvent, MigrationEvent, StatusEvent, TradeEvent, decode_event, event_from_dict
+)
+
+
+# === Fixtures ===
+
+@pytest.fixture
+def create_message():
+    return {
+        'signature': '25EYY2KccEzcqMUt8yfZMeEdcwcL7ytq3zeCyZvTRsngNm7Chy15BR2YU8ENFwgCumayApUsXKNpBiTjMxE7cvSw',
+        'mint': 'BqmTtcVb3U82npDGRHb4tsej5S68ne7VxqCz13mEteQ4',
+        'traderPublicKey': '9ZCrb9iKawp1e5Gw3r2BpHpCZQbHFg6DLguzQ5SkP2Eg',
+        'txType': 'create', 'initialBuy': 153285714.285713, 'solAmount': 5,
+        'bondingCurveKey': 'w1zoUqqCV8kdTq7C8EesnC9jD6YfWBtoePdtTMdaokq',
+        'vTokensInBondingCurve': 919714285.714287, 'vSolInBondingCurve': 34.99999999999995,
+        'marketCapSol': 38.05529667598623, 'name': 'Super Mario World', 'symbol': 'SMW',
+        'uri': 'https://ipfs.io/ipfs/Qmat8VGrszvbHU1yXQFhUYtKreLpbFwdkHcx6jbDiXXMw9', 'pool': 'pump',
+    }
+
+
+# === Tests ===
+
+def test_decode_create_from_bytes_and_str(create_message):
+    for raw in (json.dumps(create_message), json.dumps(create_message).encode()):
+        event = decode_event(raw)
+        assert type(event) is CreateEvent
+        assert (event.name, event.symbol, event.sol_amount) == ('Super Mario World', 'SMW', 5)
+        assert event.v_sol_in_bonding_curve == pytest.approx(35.0)
+
+
+def test_events_are_slotted(create_message):
+    event = event_from_dict(create_message)
+    with pytest.raises(AttributeError):
+        event.extra = 1
+
+
+def test_trade_and_migration_dispatch():
+    buy = event_from_dict({'txType': 'buy', 'mint': 'M', 'solAmount': 0.5, 'traderPublicKey': 'T'})
+    sell = event_from_dict({'txType': 'sell', 'mint': 'M'})
+    migrate = event_from_dict({'txType': 'migrate', 'mint': 'M', 'pool': 'pump-amm'})
+    assert type(buy) is TradeEvent and buy.is_buy and buy.trader == 'T'
+    assert type(sell) is TradeEvent and not sell.is_buy
+    assert type(migrate) is MigrationEvent and migrate.pool == 'pump-amm'
+
+
+def test_status_and_unknown_messages():
+    status = event_from_dict({'message': 'Successfully subscribed to token creation events.'})
+    assert type(status) is StatusEvent
+    assert event_from_dict({'something': 'else'}) is None
+    assert event_from_dict([1, 2]) is None
+
+
+def test_invalid_json_raises_value_error():
+    with pytest.raises(ValueError):
+        decode_event("{not json")
+
+
+def test_stdlib_fallback(monkeypatch, create_message):
+    monkeypatch.setattr(pump_events, "loads", json.loads)
+    assert decode_event(json.dumps(create_message)).mint == create_message['mint']
@@ -0,0 +1,79 @@
+import time
+
+import numpy as np
+import pytest
+from coin_registry import CoinRegistry
+from pump_events import CreateEvent
+from registry_snapshot import COIN_DTYPE, RegistrySnapshot
+
+
+# === Fixtures ===
+
+def coin(mint, symbol, market_cap_sol=30.0):
+    return CreateEvent({"txType": "create", "mint": mint, "symbol": symbol, "name": symbol.title(),
+                        "signature": f"sig-{mint}", "marketCapSol": market_cap_sol})
+
+@pytest.fixture
+def saved_snapshot(tmp_path):
+    registry = CoinRegistry()
+    for i, symbol in enumerate(["PEPE", "pepe", "PENGU", "BONK"]):
+        registry.add(coin(f"m{i}", symbol, market_cap_sol=10.0 + i))
+    RegistrySnapshot(tmp_path).save(registry, token_keys={"m0", "m2"})
+    return tmp_path
+
+
+# === Tests ===
+
+def test_restart_restores_coins_lazily(saved_snapshot):
+    snapshot = RegistrySnapshot(saved_snapshot)
+    registry = CoinRegistry(snapshot=snapshot)
+    assert len(registry) == 0
+
+    found = registry.find_symbol("Pepe")
+    assert [c.mint for c in found] == ["m0", "m1"]
+    assert found[0].market_cap_sol == 10.0 and found[0].signature == "sig-m0"
+    # Only the coins that matched were loaded
+    assert len(registry) == 2
+    assert isinstance(snapshot.coins, np.memmap)
+
+
+def test_prefix_suggestions_and_subscriptions(saved_snapshot):
+    snapshot = RegistrySnapshot(saved_snapshot)
+    registry = CoinRegistry(snapshot=snapshot)
+    assert [c.symbol for c in registry.find_prefix("PEN")] == ["PENGU"]
+    assert "BONK" in registry.suggest_symbols("BONKK")
+    assert sorted(snapshot.subscriptions()) == ["m0", "m2"]
+
+
+def test_save_merges_with_previous_snapshot(saved_snapshot):
+    snapshot = RegistrySnapshot(saved_snapshot)
+    registry = CoinRegistry(snapshot=snapshot)
+    registry.add(coin("m9", "WIF"))
+    registry.add(coin("m3", "BONK", market_cap_sol=99.0))  # already in the snapshot
+
+    assert snapshot.save(registry, max_coins=10) == 5
+    restored = CoinRegistry(snapshot=RegistrySnapshot(saved_snapshot))
+    assert [c.mint for c in restored.find_symbol("WIF")] == ["m9"]
+    assert [c.market_cap_sol for c in restored.find_symbol("BONK")] == [99.0]
+    assert RegistrySnapshot(saved_snapshot).subscriptions() == []
+
+
+def test_save_keeps_most_recent_coins(tmp_path):
+    clock = iter(range(100)).__next__
+    registry = CoinRegistry(clock=clock)
+    for i in range(5):
+        registry.add(coin(f"m{i}", f"C{i}"))
+    snapshot = RegistrySnapshot(tmp_path)
+    assert snapshot.save(registry, max_coins=3) == 3
+    assert sorted(snapshot.coins['mint'].tolist()) == [b"m2", b"m3", b"m4"]
+
+
+def test_expired_and_unreadable_snapshots_are_ignored(tmp_path):
+    rows = np.zeros(1, dtype=COIN_DTYPE)
+    rows[0] = (b"OLD", b"OLD", b"Old", b"m0", b"", 0.0, 0.0, 0.0, time.time() - 3600)
+    np.save(tmp_path / "coins.npy", rows)
+    assert RegistrySnapshot(tmp_path, ttl=60).find_symbol("OLD") == []
+    assert len(RegistrySnapshot(tmp_path).find_symbol("OLD")) == 1
+
+    (tmp_path / "coins.npy").write_bytes(b"not a snapshot")
+    assert RegistrySnapshot(tmp_path).find_symbol("OLD") == []
@@ -0,0 +1,71 @@
+import asyncio
+import json
+import time
+
+import pytest
+import websockets
+from pump_events import CreateEvent, TradeEvent, decode_event
+from replay_server import ReplayServer, synthetic_frames
+
+
+# === Fixtures ===
+
+@pytest.fixture
+def frames():
+    return synthetic_frames(coins=20, trades_per_coin=5, rate=1000.0)
+
+
+async def collect(server, controls, quiet=0.3):
+    """Connects, sends the control frames and returns every frame until the server goes quiet."""
+    uri = await server.start()
+    received = []
+    try:
+        async with websockets.connect(uri) as websocket:
+            for control in controls:
+                await websocket.send(json.dumps(control))
+            while True:
+                try:
+                    received.append(await asyncio.wait_for(websocket.recv(), quiet))
+                except asyncio.TimeoutError:
+                    break
+    finally:
+        await server.stop()
+    return received
+
+
+# === Tests ===
+
+def test_synthetic_frames_follow_the_feed(frames):
+    events = [decode_event(raw) for _, raw in frames]
+    creates = [e for e in events if type(e) is CreateEvent]
+    trades = [e for e in events if type(e) is TradeEvent]
+    assert len(creates) == 20 and len(trades) == 100
+    created = set()
+    for event in events:
+        if type(event) is CreateEvent:
+            created.add(event.mint)
+        else:
+            assert event.mint in created  # no trade before its create
+    assert synthetic_frames(coins=20, trades_per_coin=5, rate=1000.0) == frames
+
+
+def test_only_subscribed_streams_are_replayed(frames):
+    server = ReplayServer(frames, speed=None, settle=0.05)
+    creates = asyncio.run(collect(server, [{"method": "subscribeNewToken"}]))
+    assert len(creates) == 1 + 20  # acknowledgement + creates
+    assert all(json.loads(raw).get("txType") in (None, "create") for raw in creates)
+
+    mint = json.loads(creates[1])["mint"]
+    server = ReplayServer(frames, speed=None, settle=0.05)
+    trades = asyncio.run(collect(server, [{"method": "subscribeTokenTrade", "keys": [mint]}]))
+    assert [json.loads(raw)["mint"] for raw in trades[1:]] == [mint] * 5
+
+
+def test_playback_is_paced_by_speed():
+    frames = [(i * 0.1, json.dumps({"txType": "create", "mint": f"m{i}"})) for i in range(5)]
+    server = ReplayServer(frames, speed=2.0, settle=0)
+    started = time.perf_counter()
+    received = asyncio.run(collect(server, [{"method": "subscribeNewToken"}], quiet=0.5))
+    assert len(received) == 6
+    # 0.4 s of timestamps at 2x, plus the final quiet period
+    assert time.perf_counter() - started >= 0.2 + 0.5
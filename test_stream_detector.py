@@ -0,0 +1,103 @@
+import os
+import random
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+from pump_events import MigrationEvent, TradeEvent
+from stream_detector import SlidingStats, StreamDetector
+
+
+# === Fixtures ===
+
+class Market:
+    """Trades on one mint along the constant-product curve."""
+
+    def __init__(self, mint="m1", seed=0):
+        self.mint = mint
+        self.rng = random.Random(seed)
+        self.v_sol = 40.0
+        self.v_tokens = 30.0 * 1_073_000_000 / 40.0
+        self.now = 0.0
+
+    def trade(self, sol_amount=None, trader=None, is_buy=None, dt=1.0):
+        if sol_amount is None:
+            sol_amount = self.rng.uniform(0.1, 0.3)
+        if is_buy is None:
+            is_buy = self.rng.random() < 0.5
+        k = self.v_sol * self.v_tokens
+        self.v_sol += sol_amount if is_buy else -sol_amount
+        self.v_tokens = k / self.v_sol
+        self.now += dt
+        return TradeEvent({"txType": "buy" if is_buy else "sell", "mint": self.mint, "solAmount": sol_amount,
+                           "traderPublicKey": trader or f"t{self.rng.randint(0, 9)}",
+                           "vSolInBondingCurve": self.v_sol, "vTokensInBondingCurve": self.v_tokens})
+
+@pytest.fixture
+def market():
+    return Market()
+
+def feed(detector, market, n, **kwargs):
+    found = []
+    for _ in range(n):
+        found.extend(detector.update(market.trade(**kwargs), now=market.now))
+    return found
+
+
+# === Tests ===
+
+def test_sliding_stats_match_numpy():
+    values = np.random.default_rng(0).normal(5.0, 2.0, 500)
+    stats = SlidingStats(50)
+    for x in values:
+        stats.push(x)
+    assert stats.mean == pytest.approx(values[-50:].mean())
+    assert stats.std == pytest.approx(values[-50:].std(ddof=1))
+
+
+def test_quiet_market_raises_nothing(market):
+    detector = StreamDetector()
+    assert feed(detector, market, 300) == []
+
+
+def test_pump_and_volume_burst_are_flagged_once(market):
+    detector = StreamDetector(cooldown=60)
+    feed(detector, market, 100)
+    found = detector.update(market.trade(sol_amount=8.0, is_buy=True), now=market.now)
+    assert {a.kind for a in found} == {"pump", "volume_burst"}
+    assert all(a.mint == "m1" and a.score > 4 for a in found)
+    # Inside the cooldown the same kinds are not reported again
+    found = detector.update(market.trade(sol_amount=8.0, is_buy=True), now=market.now)
+    assert found == []
+
+    found = detector.update(market.trade(sol_amount=12.0, is_buy=False), now=market.now + 60)
+    assert "dump" in {a.kind for a in found}
+
+
+def test_trader_surge(market):
+    detector = StreamDetector(bucket_seconds=10, surge_ratio=3.0, min_traders=5)
+    feed(detector, market, 60, dt=2.0)  # ten regular traders, all seen already
+    found = []
+    for i in range(20):
+        found += detector.update(market.trade(trader=f"new{i}", dt=0.1), now=market.now)
+    assert [a.kind for a in found] == ["trader_surge"]
+
+
+def test_state_is_bounded():
+    detector = StreamDetector(max_mints=10, window=20, trader_memory=50)
+    for i in range(30):
+        feed(detector, Market(mint=f"m{i}", seed=i), 5)
+    assert len(detector.mints) == 10
+    market = Market(mint="big")
+    for i in range(200):
+        detector.update(market.trade(trader=f"t{i}"), now=market.now)
+    state = detector.mints["big"]
+    assert len(state.returns) == 20 and len(state.seen_traders) == 50
+    detector.update(MigrationEvent({"txType": "migrate", "mint": "big"}))
+    assert "big" not in detector.mints
+
+
+def test_runs_without_qt():
+    code = "import sys, stream_detector; assert 'PyQt5' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
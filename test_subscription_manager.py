@@ -0,0 +1,101 @@
+import asyncio
+import time
+
+import pytest
+from subscription_manager import SubscriptionManager
+
+
+# === Fixtures ===
+
+class FakeSocket:
+    def __init__(self):
+        self.frames = []
+        self.sent_at = []
+        self.open = True
+
+    async def send(self, payload):
+        if not self.open:
+            return False
+        self.frames.append(payload)
+        self.sent_at.append(time.monotonic())
+        return True
+
+@pytest.fixture
+def socket():
+    return FakeSocket()
+
+
+# === Tests ===
+
+def test_watchlist_is_sent_in_batches(socket):
+    manager = SubscriptionManager(socket.send, batch_size=100, min_interval=0)
+    mints = [f"mint{i:03d}" for i in range(250)]
+    manager.watch(mints)
+    asyncio.run(manager.sync())
+
+    assert [len(frame["keys"]) for frame in socket.frames] == [100, 100, 50]
+    assert {frame["method"] for frame in socket.frames} == {"subscribeTokenTrade"}
+    assert manager.current == set(mints)
+    assert manager.stats() == {"desired": 250, "subscribed": 250, "control_frames": 3}
+
+
+def test_only_the_difference_is_sent(socket):
+    manager = SubscriptionManager(socket.send, min_interval=0)
+
+    async def run():
+        manager.set_desired(["A", "B", "C"])
+        await manager.sync()
+        manager.set_desired(["B", "C", "D"])
+        await manager.sync()
+        await manager.sync()  # nothing left to do
+
+    asyncio.run(run())
+    assert socket.frames == [
+        {"method": "subscribeTokenTrade", "keys": ["A", "B", "C"]},
+        {"method": "unsubscribeTokenTrade", "keys": ["A"]},
+        {"method": "subscribeTokenTrade", "keys": ["D"]},
+    ]
+
+
+def test_control_frames_are_rate_limited(socket):
+    manager = SubscriptionManager(socket.send, batch_size=1, min_interval=0.05)
+    manager.watch(["A", "B", "C"])
+    asyncio.run(manager.sync())
+    gaps = [b - a for a, b in zip(socket.sent_at, socket.sent_at[1:])]
+    assert len(socket.frames) == 3
+    assert min(gaps) >= 0.045
+
+
+def test_concurrent_changes_share_one_sync(socket):
+    manager = SubscriptionManager(socket.send, min_interval=0.02)
+
+    async def run():
+        manager.watch(["A"])
+        first = asyncio.ensure_future(manager.sync())
+        await asyncio.sleep(0)
+        manager.watch(["B"])
+        manager.unwatch(["A"])
+        await asyncio.gather(first, manager.sync())
+
+    asyncio.run(run())
+    assert manager.current == {"B"}
+    assert socket.frames[-1] == {"method": "subscribeTokenTrade", "keys": ["B"]}
+
+
+def test_closed_socket_keeps_diff_until_resubscribe(socket):
+    manager = SubscriptionManager(socket.send, min_interval=0)
+
+    async def run():
+        manager.watch(["A"])
+        await manager.sync()
+        socket.open = False
+        manager.watch(["B"])
+        await manager.sync()
+        assert manager.pending() == ({"B"}, set())
+        # A new session starts with nothing subscribed
+        socket.open = True
+        await manager.resubscribe()
+
+    asyncio.run(run())
+    assert socket.frames[-1] == {"method": "subscribeTokenTrade", "keys": ["A", "B"]}
+    assert manager.current == {"A", "B"}
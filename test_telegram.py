@@ -68,3 +68,14 @@ def test_parse_message_data_no_message(processor):
 
     result = processor.parse_message_data(msg)
     assert result is None
+
+
+def test_load_file_fills_the_table(processor, qtbot):
+    processor.load_file("telegram-scraper/Insider_ECA/Insider_ECA.json")
+    qtbot.waitUntil(lambda: processor.load_worker is None, timeout=5000)
+    model = processor.model
+    assert len(model.rows) == 507
+    assert 0 < model.rowCount() <= len(model.rows)
+    # Newest first by default
+    dates = [model.data(model.index(i, 0)) for i in range(model.rowCount())]
+    assert dates == sorted(dates, reverse=True)
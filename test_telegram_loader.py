@@ -0,0 +1,108 @@
+import json
+
+import pytest
+from PyQt5.QtCore import QThreadPool
+from telegram_loader import iter_json_messages, newest
+from telegram_worker import TelegramLoadWorker
+
+SAMPLE_DUMP = "telegram-scraper/Insider_ECA/Insider_ECA.json"
+
+
+# === Fixtures ===
+
+def message(message_id, date, text="🔔 Pepe PEPE | 2x\nMarketcap: 100K"):
+    return {"message_id": message_id, "date": date, "sender_id": -100, "message": text, "reply_to": None}
+
+@pytest.fixture
+def messages():
+    # Out of date order, with non-ASCII text straddling small chunks
+    return [message(i, f"2025-05-{(i * 7) % 28 + 1:02d} 12:00:{i % 60:02d}") for i in range(200)]
+
+@pytest.fixture
+def dump(tmp_path, messages):
+    path = tmp_path / "channel.json"
+    path.write_text(json.dumps(messages, indent=4, ensure_ascii=False), encoding="utf-8")
+    return str(path)
+
+
+# === Tests ===
+
+@pytest.mark.parametrize("chunk_size", [7, 64, 1 << 16])
+def test_streams_every_message(dump, messages, chunk_size):
+    assert list(iter_json_messages(dump, chunk_size=chunk_size)) == messages
+
+
+def test_streams_wrapped_messages_list(tmp_path, messages):
+    path = tmp_path / "wrapped.json"
+    path.write_text(json.dumps({"channel": "x", "messages": messages}), encoding="utf-8")
+    assert list(iter_json_messages(str(path), chunk_size=32)) == messages
+
+    # "messages" as a value, or inside one, before the real key
+    decoy = {"title": "messages", "about": {"messages": "no", "x": [1, "messages"]}, "messages": messages}
+    path.write_text(json.dumps(decoy), encoding="utf-8")
+    assert list(iter_json_messages(str(path), chunk_size=16)) == messages
+
+    path.write_text(json.dumps({"title": "messages", "count": 3}), encoding="utf-8")
+    with pytest.raises(ValueError):
+        list(iter_json_messages(str(path), chunk_size=16))
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 40))
+def test_numbers_cut_by_chunks(tmp_path, chunk_size):
+    listed = [1, message(1, "2025-05-01 12:00:00"), 3.5e10, -0.25, True, None,
+              message(2, "2025-05-02 12:00:00"), 1234567]
+    path = tmp_path / "numbers.json"
+    path.write_text(json.dumps(listed), encoding="utf-8")
+    assert list(iter_json_messages(str(path), chunk_size=chunk_size)) == [listed[1], listed[6]]
+
+    wrapped = {"channel_id": 1234567.5, "count": -12e-3, "ok": False, "messages": listed}
+    path.write_text(json.dumps(wrapped, indent=1), encoding="utf-8")
+    assert list(iter_json_messages(str(path), chunk_size=chunk_size)) == [listed[1], listed[6]]
+
+
+def test_empty_and_broken_dumps(tmp_path):
+    empty = tmp_path / "empty.json"
+    empty.write_text("[ ]")
+    assert list(iter_json_messages(str(empty))) == []
+
+    truncated = tmp_path / "truncated.json"
+    truncated.write_text('[{"message_id": 1, "date": "2025-05-01 12:00:00"}, {"message_id": 2, "da')
+    with pytest.raises(ValueError):
+        list(iter_json_messages(str(truncated), chunk_size=16))
+
+    with pytest.raises(FileNotFoundError):
+        list(iter_json_messages(str(tmp_path / "missing.json")))
+
+
+def test_newest_keeps_the_largest_keys():
+    assert newest([5, 1, 9, 3, 9, 7], 3, key=lambda x: x) == [9, 9, 7]
+    assert newest([2, 1], 5, key=lambda x: x) == [2, 1]
+    # Equal keys never compare the items themselves
+    assert len(newest([{"a": 1}, {"b": 2}], 1, key=lambda item: 0)) == 1
+
+
+def test_real_dump_streams_like_json_load():
+    with open(SAMPLE_DUMP, "r", encoding="utf-8") as f:
+        expected = json.load(f)
+    assert list(iter_json_messages(SAMPLE_DUMP, chunk_size=4096)) == expected
+
+
+def test_worker_sends_chunks_on_the_thread_pool(dump, messages, qtbot):
+    worker = TelegramLoadWorker(dump, lambda batch: [(msg["date"], msg["message_id"]) for msg in batch], limit=5,
+                                key=lambda item: item, chunk_messages=64)
+    chunks = []
+    worker.signals.chunk.connect(lambda rows, read: chunks.append((rows, read)))
+    with qtbot.waitSignal(worker.signals.finished, timeout=5000) as finished:
+        QThreadPool.globalInstance().start(worker)
+    assert finished.args == [len(messages)]
+    assert [read for _, read in chunks] == [64, 128, 192, 200]
+    assert all(len(rows) <= 5 for rows, _ in chunks)
+    merged = newest([row for rows, _ in chunks for row in rows], 5, key=lambda item: item)
+    assert merged == sorted(((m["date"], m["message_id"]) for m in messages), reverse=True)[:5]
+
+
+def test_worker_reports_missing_dump(tmp_path, qtbot):
+    worker = TelegramLoadWorker(str(tmp_path / "missing.json"), list)
+    with qtbot.waitSignal(worker.signals.failed, timeout=5000) as failed:
+        QThreadPool.globalInstance().start(worker)
+    assert "No Telegram dump" in failed.args[0]
@@ -0,0 +1,83 @@
+import pytest
+from PyQt5.QtCore import QDateTime, QPersistentModelIndex, Qt
+from alert_parser import cap_value
+from telegram_model import TelegramMessageModel, make_message_table, message_rows
+
+
+# === Fixtures ===
+
+@pytest.fixture
+def model(qapp):
+    return TelegramMessageModel(fetch_batch=3)
+
+def row(day, coin="Coin", symbol="C", cap="N/A", age="N/A"):
+    return (QDateTime.fromString(f"2025-05-{day:02d} 12:00:00", "yyyy-MM-dd hh:mm:ss"), coin, symbol, cap, age,
+            cap_value(cap))
+
+
+# === Tests ===
+
+def test_rows_are_fetched_in_batches(model):
+    model.add_rows([row(d) for d in range(1, 9)])
+    assert len(model.rows) == 8
+    assert model.rowCount() == 3
+    assert model.canFetchMore()
+    model.fetchMore()
+    model.fetchMore()
+    assert model.rowCount() == 8
+    assert not model.canFetchMore()
+
+
+def test_cells_are_formatted_on_request(model):
+    model.add_rows([row(7, "Pepe", "PEPE", "$1.2M", "2 hours")])
+    assert [model.data(model.index(0, c)) for c in range(5)] == ["2025-05-07 12:00:00", "Pepe", "PEPE", "$1.2M", "2 hours"]
+    assert model.headerData(3, Qt.Horizontal) == "Cap"
+    assert model.data(model.index(0, 0), Qt.ToolTipRole) is None
+
+
+def test_sort_by_cap_and_merge_new_rows(model):
+    model.add_rows([row(1, cap="$100K"), row(2, cap="N/A"), row(3, cap="$1.2M")])
+    model.sort(3, Qt.DescendingOrder)
+    assert [r[3] for r in model.rows] == ["$1.2M", "$100K", "N/A"]
+    model.add_rows([row(4, cap="$500K")])
+    assert [r[3] for r in model.rows] == ["$1.2M", "$500K", "$100K", "N/A"]
+    # Only a batch was fetched; the rest waits for fetchMore
+    assert model.rowCount() == 3
+
+
+def test_rows_carry_numeric_cap(model):
+    rows = message_rows([{"date": "2025-05-07 12:00:00", "message": "🔔 Pepe PEPE | Marketcap: $1.2M"}])
+    assert rows[0][1:] == ("Pepe", "PEPE", "$1.2M", "N/A", pytest.approx(1.2e6))
+    # Sorting uses the number, not the text
+    model.add_rows([row(1, cap="junk")[:5] + (5.0,), row(2, cap="$1K")])
+    model.sort(3, Qt.AscendingOrder)
+    assert [r[3] for r in model.rows] == ["junk", "$1K"]
+
+
+def test_merge_keeps_persistent_indexes_on_their_rows(model):
+    model.add_rows([row(1, cap="$100K"), row(3, cap="$1.2M")])
+    model.sort(3, Qt.DescendingOrder)
+    selected = QPersistentModelIndex(model.index(1, 1))  # the $100K row
+    model.add_rows([row(4, cap="$500K")])
+    assert selected.row() == 2 and model.rows[selected.row()][3] == "$100K"
+
+
+def test_trim_keeps_the_newest_rows(model, qtbot):
+    model.add_rows([row(d, cap=f"${d}K") for d in range(1, 7)])
+    model.sort(3, Qt.AscendingOrder)
+    # The two oldest rows are on screen, so the view is told they go
+    with qtbot.waitSignal(model.rowsRemoved) as removed:
+        model.trim(4, lambda r: r[0].toMSecsSinceEpoch())
+    assert removed.args[1:] == [0, 1]
+    assert [r[3] for r in model.rows] == ["$3K", "$4K", "$5K", "$6K"]
+    assert model.sort_keys == [3000.0, 4000.0, 5000.0, 6000.0]
+    assert model.rowCount() == 4
+
+
+def test_table_sorts_newest_first(model):
+    table = make_message_table(model)
+    model.add_rows([row(1), row(9), row(5)])
+    assert [model.data(model.index(i, 0))[:10] for i in range(3)] == ["2025-05-09", "2025-05-05", "2025-05-01"]
+    table.sortByColumn(0, Qt.AscendingOrder)
+    assert model.data(model.index(0, 0))[:10] == "2025-05-01"
+
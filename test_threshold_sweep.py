@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+import pytest
+from threshold_sweep import sweep
+
+
+# === Fixtures ===
+
+@pytest.fixture
+def coin_data():
+    dates = pd.date_range("2021-01-01", periods=40, freq="D", name="Date")
+    rng = np.random.default_rng(1)
+    data = {}
+    for i in range(3):
+        close = 5 + rng.normal(0, 0.02, len(dates)).cumsum()
+        close[20 + i] += 2  # one-day pump, reverted the next day
+        data[f"Coin{i}"] = pd.DataFrame({'Close': close}, index=dates)
+    return data
+
+
+# === Tests ===
+
+def test_sweep_table_shape(coin_data):
+    table = sweep(coin_data, multipliers=[1, 2], windows=[None, 10], horizons=[1, 5], max_workers=1)
+    assert table.index.names == ['window', 'multiplier', 'kind', 'horizon']
+    assert len(table) == 2 * 2 * 2 * 2
+    assert set(table.index.get_level_values('window')) == {'global', 10}
+
+
+def test_higher_multiplier_flags_fewer_events(coin_data):
+    table = sweep(coin_data, multipliers=[0.01, 3], windows=[None], horizons=[1], max_workers=1)
+    pumps = table.xs(('global', 'pump', 1), level=['window', 'kind', 'horizon'])['events']
+    assert pumps.loc[0.01] > pumps.loc[3] > 0
+
+
+def test_reverted_pumps_are_hits(coin_data):
+    table = sweep(coin_data, multipliers=[3], windows=[None], horizons=[1], max_workers=1)
+    row = table.loc[('global', 3, 'pump', 1)]
+    assert row['events'] == 3
+    assert row['hit_rate'] == 1.0
+    assert row['mean_forward_return'] < 0
+
+
+def test_process_pool_matches_serial(coin_data):
+    kwargs = dict(multipliers=[0.5, 2], windows=[None, 10], horizons=[1, 3], chunk_size=1)
+    serial = sweep(coin_data, max_workers=1, **kwargs)
+    pooled = sweep(coin_data, max_workers=2, **kwargs)
+    pd.testing.assert_frame_equal(serial, pooled)
@@ -0,0 +1,87 @@
+import pytest
+from pump_events import CreateEvent, MigrationEvent, TradeEvent
+from token_tracker import CREATED, MIGRATED, TRADER_REGISTERS, TRADING, TokenTracker, curve_progress
+
+
+# === Fixtures ===
+
+def create(mint, v_sol=30.0, v_tokens=1_073_000_000, sol_amount=0.0):
+    return CreateEvent({"txType": "create", "mint": mint, "symbol": "PEPE", "name": "Pepe",
+                        "traderPublicKey": "creator", "solAmount": sol_amount,
+                        "vSolInBondingCurve": v_sol, "vTokensInBondingCurve": v_tokens,
+                        "marketCapSol": v_sol / v_tokens * 1e9})
+
+def trade(mint, tx_type, sol_amount, trader, v_sol, v_tokens):
+    return TradeEvent({"txType": tx_type, "mint": mint, "traderPublicKey": trader, "solAmount": sol_amount,
+                       "vSolInBondingCurve": v_sol, "vTokensInBondingCurve": v_tokens,
+                       "marketCapSol": v_sol / v_tokens * 1e9})
+
+@pytest.fixture
+def tracker():
+    return TokenTracker()
+
+
+# === Tests ===
+
+def test_lifecycle_and_running_metrics(tracker):
+    token = tracker.apply(create("m1", sol_amount=1.0, v_sol=31.0, v_tokens=1_038_000_000))
+    assert token.state == CREATED and token.buys == 1
+
+    tracker.apply(trade("m1", "buy", 2.0, "alice", 33.0, 975_000_000))
+    tracker.apply(trade("m1", "buy", 1.0, "alice", 34.0, 946_000_000))
+    token = tracker.apply(trade("m1", "sell", 0.5, "bob", 33.5, 960_000_000))
+
+    assert token.state == TRADING
+    assert (token.buys, token.sells) == (3, 1)
+    assert token.buy_volume == pytest.approx(4.0) and token.sell_volume == pytest.approx(0.5)
+    assert token.unique_traders == 3  # creator, alice, bob
+    assert token.price == pytest.approx(33.5 / 960_000_000)
+    assert token.progress == pytest.approx(curve_progress(960_000_000))
+
+    token = tracker.apply(MigrationEvent({"txType": "migrate", "mint": "m1"}))
+    assert token.state == MIGRATED and token.progress == 1.0
+    tracker.apply(trade("m1", "buy", 1.0, "carol", 40.0, 900_000_000))
+    assert token.state == MIGRATED and token.progress == 1.0
+
+
+def test_trade_before_create_starts_trading(tracker):
+    token = tracker.apply(trade("m2", "buy", 1.0, "alice", 31.0, 1_038_000_000))
+    assert token.state == TRADING
+    tracker.apply(create("m2", sol_amount=1.0))
+    assert token.symbol == "PEPE" and token.state == TRADING
+    # The late create keeps the traded curve and does not count its initial buy
+    assert token.price == pytest.approx(31.0 / 1_038_000_000)
+    assert (token.buys, token.buy_volume) == (1, pytest.approx(1.0))
+
+
+def test_duplicate_create_counts_initial_buy_once(tracker):
+    tracker.apply(create("m3", sol_amount=1.0))
+    token = tracker.apply(create("m3", sol_amount=1.0))
+    assert (token.buys, token.buy_volume, token.unique_traders) == (1, pytest.approx(1.0), 1)
+
+
+def test_unique_traders_take_fixed_memory(tracker):
+    for i in range(10):
+        token = tracker.apply(trade("m4", "buy", 0.1, f"trader{i}", 31.0, 1_038_000_000))
+    tracker.apply(trade("m4", "buy", 0.1, "trader9", 31.0, 1_038_000_000))
+    assert token.unique_traders == 10
+    for i in range(10, 20000):
+        tracker.apply(trade("m4", "buy", 0.1, f"trader{i}", 31.0, 1_038_000_000))
+    assert len(token.traders) == TRADER_REGISTERS
+    assert token.unique_traders == pytest.approx(20000, rel=0.15)
+
+
+def test_curve_progress_bounds():
+    assert curve_progress(1_073_000_000) == 0.0
+    assert curve_progress(1_073_000_000 - 793_100_000) == 1.0
+    assert curve_progress(0) == 0.0
+
+
+def test_ranking_and_eviction():
+    tracker = TokenTracker(max_tokens=3)
+    for i, v_sol in enumerate([40.0, 80.0, 35.0, 60.0]):
+        tracker.apply(trade(f"m{i}", "buy", 1.0, "alice", v_sol, 30.0 * 1_073_000_000 / v_sol))
+    assert "m0" not in tracker and tracker.evicted == 1
+    assert [t.mint for t in tracker.top(2)] == ["m1", "m3"]
+    assert [t.mint for t in tracker.top(1, key="progress")] == ["m1"]
+    assert tracker.stats() == {CREATED: 0, TRADING: 3, MIGRATED: 0, "evicted": 1}
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from pump_events import TradeEvent
+from trade_buffer import TradeBuffers, TradeRing
+
+
+# === Fixtures ===
+
+@pytest.fixture
+def ring():
+    ring = TradeRing(capacity=8)
+    for i in range(13):
+        ring.append(float(i), 1.0 + i, 0.1 * i, 1 if i % 2 else -1)
+    return ring
+
+def trade(mint, sol_amount=1.0, tx_type="buy"):
+    return TradeEvent({"txType": tx_type, "mint": mint, "solAmount": sol_amount,
+                       "vSolInBondingCurve": 40.0, "vTokensInBondingCurve": 8e8})
+
+
+# === Tests ===
+
+def test_latest_is_a_contiguous_view(ring):
+    assert len(ring) == 8
+    assert ring.window()['t'].tolist() == [float(i) for i in range(5, 13)]
+    latest = ring.latest(3)
+    assert latest['price'].tolist() == [11.0, 12.0, 13.0]
+    assert np.shares_memory(latest, ring.data)
+    assert ring.latest(100)['t'][0] == 5.0
+    assert ring.last['t'] == 12.0
+
+
+def test_between_binary_searches_time(ring):
+    trades = ring.between(6.5, 9.0)
+    assert trades['t'].tolist() == [7.0, 8.0]
+    assert np.shares_memory(trades, ring.data)
+    assert len(ring.between(100.0, 200.0)) == 0
+
+
+def test_version_tracks_appends(ring):
+    version = ring.version
+    ring.append(13.0, 14.0, 1.0, 1)
+    assert ring.version == version + 1
+
+
+def test_buffers_are_bounded_and_memory_mapped(tmp_path):
+    buffers = TradeBuffers(capacity=4, max_mints=2, directory=tmp_path)
+    for mint in ["a", "b", "a", "c"]:
+        buffers.append(trade(mint), t=1.0)
+    assert "b" not in buffers and len(buffers) == 2
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.ring", "c.ring"]
+
+    ring = buffers.get("a")
+    assert isinstance(ring.data, np.memmap)
+    assert ring.window()['price'].tolist() == [pytest.approx(40.0 / 8e8)] * 2
+    assert buffers.append(trade("c", tx_type="sell"), t=2.0).last['side'] == -1
+    buffers.clear()
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,127 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from pump_detection import build_close_frame, price_changes, zscores
+
+DEFAULT_MULTIPLIERS = (0.5, 1.0, 1.5, 2.0, 2.5, 3.0)
+DEFAULT_WINDOWS = (None, 7, 30, 90)
+DEFAULT_HORIZONS = (1, 3, 7)
+KINDS = ('pump', 'dump')
+
+
+def forward_returns(closes, horizon):
+    """Return from each close to the close `horizon` rows later, NaN where it is unknown."""
+    return (closes.shift(-horizon) / closes - 1).to_numpy()
+
+
+def sweep_block(closes, multipliers, windows, horizons):
+    """Accumulates event statistics for one block of coin columns.
+
+    Returns three arrays shaped (windows, multipliers, kinds, horizons): the number of
+    events with a known forward return, the sum of those returns and the number of
+    hits. A hit is an event the price moves back against: a pump followed by a
+    lower price, or a dump followed by a higher one.
+    """
+    multipliers = np.asarray(multipliers, dtype='float64')
+    changes = price_changes(closes)
+    future = np.stack([forward_returns(closes, h) for h in horizons])  # (H, T, C)
+    known = np.isfinite(future)
+
+    # Flattened (H, T*C) operands, so every statistic is one matrix product per mask
+    n_cells = closes.shape[0] * closes.shape[1]
+    known_flat = known.reshape(len(horizons), n_cells).astype('float64')
+    future_flat = np.where(known, future, 0.0).reshape(len(horizons), n_cells)
+    reversals = (
+        (future < 0).reshape(len(horizons), n_cells).astype('float64'),
+        (future > 0).reshape(len(horizons), n_cells).astype('float64'),
+    )
+
+    shape = (len(windows), len(multipliers), len(KINDS), len(horizons))
+    counts = np.zeros(shape, dtype='int64')
+    sums = np.zeros(shape)
+    hits = np.zeros(shape, dtype='int64')
+
+    for w, window in enumerate(windows):
+        if window is None:
+            scores = zscores(changes, mode="global").to_numpy()
+        else:
+            scores = zscores(changes, mode="rolling", window=window).to_numpy()
+        scores = np.nan_to_num(scores, nan=0.0).reshape(1, n_cells)
+
+        # (M, T*C) event masks for every multiplier at once
+        thresholds = multipliers[:, np.newaxis]
+        masks = (scores > thresholds, scores < -thresholds)
+
+        for k in range(len(KINDS)):
+            mask = masks[k].astype('float64')
+            counts[w, :, k] = np.rint(mask @ known_flat.T)
+            sums[w, :, k] = mask @ future_flat.T
+            hits[w, :, k] = np.rint(mask @ reversals[k].T)
+
+    return counts, sums, hits
+
+
+def sweep(csv_data, multipliers=DEFAULT_MULTIPLIERS, windows=DEFAULT_WINDOWS,
+          horizons=DEFAULT_HORIZONS, chunk_size=256, max_workers=None):
+    """Evaluates every (window, multiplier) pair over all coins in csv_data.
+
+    Coins are processed in column blocks of chunk_size; when there is more than one
+    block and max_workers is not 1, the blocks run on a process pool.
+    Window None means the global whole-history threshold used by the plot.
+    """
+    closes = build_close_frame(csv_data)
+    blocks = [closes.iloc[:, i:i + chunk_size] for i in range(0, closes.shape[1], chunk_size)]
+    args = (tuple(multipliers), tuple(windows), tuple(horizons))
+
+    if len(blocks) > 1 and max_workers != 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(sweep_block, blocks, *[[a] * len(blocks) for a in args]))
+    else:
+        results = [sweep_block(block, *args) for block in blocks]
+
+    counts = sum(r[0] for r in results)
+    sums = sum(r[1] for r in results)
+    hits = sum(r[2] for r in results)
+    return _to_table(counts, sums, hits, multipliers, windows, horizons)
+
+
+def _to_table(counts, sums, hits, multipliers, windows, horizons):
+    index = pd.MultiIndex.from_product(
+        [['global' if w is None else w for w in windows], list(multipliers), list(KINDS), list(horizons)],
+        names=['window', 'multiplier', 'kind', 'horizon'],
+    )
+    with np.errstate(invalid='ignore', divide='ignore'):
+        table = pd.DataFrame({
+            'events': counts.ravel(),
+            'hit_rate': hits.ravel() / counts.ravel(),
+            'mean_forward_return': sums.ravel() / counts.ravel(),
+        }, index=index)
+    return table
+
+
+def _parse_window(value):
+    return None if value == 'global' else int(value)
+
+
+if __name__ == "__main__":
+    from csvfile import load_and_merge_data
+    from csv_cache import CsvCache
+
+    parser = argparse.ArgumentParser(description="Sweep pump/dump thresholds over a folder of coin CSVs")
+    parser.add_argument("folder", nargs="?", default="Meme Coin")
+    parser.add_argument("--multipliers", type=float, nargs="+", default=list(DEFAULT_MULTIPLIERS))
+    parser.add_argument("--windows", type=_parse_window, nargs="+", default=list(DEFAULT_WINDOWS),
+                        help="window sizes in rows, or 'global'")
+    parser.add_argument("--horizons", type=int, nargs="+", default=list(DEFAULT_HORIZONS))
+    parser.add_argument("--chunk-size", type=int, default=256)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    options = parser.parse_args()
+
+    coin_data = load_and_merge_data(options.folder, cache=CsvCache())
+    results = sweep(coin_data, options.multipliers, options.windows, options.horizons,
+                    chunk_size=options.chunk_size, max_workers=options.workers)
+    print(results.to_string())
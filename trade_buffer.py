@@ -0,0 +1,127 @@
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+# side is +1 for a buy and -1 for a sell
+TRADE_DTYPE = np.dtype([('t', 'f8'), ('price', 'f8'), ('sol', 'f8'), ('side', 'i1')])
+
+
+class TradeRing:
+    """Fixed-size ring of one mint's most recent trades.
+
+    Every trade is written twice, at i and i + capacity, so the last `capacity` trades
+    are always one contiguous slice of the backing array: latest() and between() return
+    views into it instead of copies. Timestamps are expected in arrival order, which
+    lets between() binary search them. With a path, the backing array is a memory-mapped
+    scratch file instead of process memory.
+    """
+
+    def __init__(self, capacity=4096, path=None):
+        self.capacity = capacity
+        if path is None:
+            self.data = np.zeros(2 * capacity, dtype=TRADE_DTYPE)
+        else:
+            self.data = np.memmap(path, dtype=TRADE_DTYPE, mode='w+', shape=(2 * capacity,))
+        self.head = 0  # next slot to write, in [0, capacity)
+        self.count = 0
+        self.version = 0  # bumped on every append, so readers can tell when to redraw
+
+    def __len__(self):
+        return self.count
+
+    def append(self, t, price, sol, side):
+        record = (t, price, sol, side)
+        self.data[self.head] = record
+        self.data[self.head + self.capacity] = record
+        self.head = (self.head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+        self.version += 1
+
+    def window(self):
+        """Every trade held, oldest first, as a view."""
+        stop = self.head + self.capacity
+        return self.data[stop - self.count:stop]
+
+    def latest(self, n):
+        """The last n trades, oldest first, as a view."""
+        stop = self.head + self.capacity
+        return self.data[stop - min(n, self.count):stop]
+
+    def between(self, t_start, t_end):
+        """Trades with t_start <= t < t_end, as a view."""
+        window = self.window()
+        times = window['t']
+        return window[np.searchsorted(times, t_start, side='left'):np.searchsorted(times, t_end, side='left')]
+
+    @property
+    def last(self):
+        return self.data[self.head + self.capacity - 1] if self.count else None
+
+    def close(self):
+        # The mapping itself goes once no view of it is left
+        if isinstance(self.data, np.memmap):
+            self.data.flush()
+        self.data = np.empty(0, dtype=TRADE_DTYPE)
+        self.head = self.count = 0
+
+
+class TradeBuffers:
+    """A TradeRing per mint, created on the mint's first trade.
+
+    Past max_mints the ring of the least recently traded mint is released. With a
+    directory, rings are memory-mapped files in it, so thousands of mints do not have
+    to fit in process memory.
+    """
+
+    def __init__(self, capacity=4096, max_mints=1000, directory=None):
+        self.capacity = capacity
+        self.max_mints = max_mints
+        self.directory = directory
+        self.rings = OrderedDict()  # mint -> TradeRing, least recently traded first
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self):
+        return len(self.rings)
+
+    def __contains__(self, mint):
+        return mint in self.rings
+
+    def get(self, mint):
+        return self.rings.get(mint)
+
+    def append(self, event, t):
+        """Adds a TradeEvent; returns its mint's ring, or None if the event has no curve price."""
+        if not event.v_tokens_in_bonding_curve:
+            return None
+        ring = self.rings.get(event.mint)
+        if ring is None:
+            ring = self.rings[event.mint] = TradeRing(self.capacity, self._path(event.mint))
+            if len(self.rings) > self.max_mints:
+                self._release(*self.rings.popitem(last=False))
+        else:
+            self.rings.move_to_end(event.mint)
+        ring.append(t, event.v_sol_in_bonding_curve / event.v_tokens_in_bonding_curve,
+                    event.sol_amount or 0.0, 1 if event.is_buy else -1)
+        return ring
+
+    def _path(self, mint):
+        if self.directory is None:
+            return None
+        return os.path.join(self.directory, f"{mint}.ring")
+
+    def _release(self, mint, ring):
+        ring.close()
+        path = self._path(mint)
+        if path is not None:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def clear(self):
+        for mint, ring in list(self.rings.items()):
+            self._release(mint, ring)
+        self.rings.clear()